@@ -0,0 +1,119 @@
+"""
+Async Upstream I/O
+Awaitable wrappers for the blocking Yahoo Finance, Alpha Vantage, metadata
+and news calls, plus hand-off of CPU-bound model work to the prediction pool
+
+The upstream client libraries are synchronous, so each call runs on a large,
+dedicated I/O thread pool; threads there only wait on the network, which lets
+one event loop keep hundreds of upstream calls in flight at once.
+"""
+
+import os
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from models import get_predictions, PREDICTION_HISTORY_DAYS, LSTM_TRAINING_DAYS
+from utils import fetch_stock_data, fetch_stock_data_many, fetch_close_history, fetch_history_range, analyze_sentiment
+from metadata import get_symbol_info
+from jobs import get_job_manager
+
+UPSTREAM_IO_THREADS = int(os.getenv('UPSTREAM_IO_THREADS', '256'))
+
+_io_executor = None
+_io_executor_lock = threading.Lock()
+
+
+def get_io_executor():
+    """Get the process-wide thread pool for blocking upstream calls"""
+    global _io_executor
+    if _io_executor is None:
+        with _io_executor_lock:
+            if _io_executor is None:
+                _io_executor = ThreadPoolExecutor(max_workers=UPSTREAM_IO_THREADS, thread_name_prefix='upstream-io')
+    return _io_executor
+
+
+async def run_io(fn, *args, **kwargs):
+    """Await a blocking I/O-bound call on the upstream I/O pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_io_executor(), functools.partial(fn, *args, **kwargs))
+
+
+async def run_cpu(fn, *args):
+    """Await a CPU-bound call in the prediction worker pool (fn must be picklable)"""
+    return await asyncio.wrap_future(get_job_manager().submit_future(fn, *args))
+
+
+async def fetch_stock_data_async(symbol, days=30, source='yfinance', history_format='rows'):
+    return await run_io(fetch_stock_data, symbol, days, source, history_format)
+
+
+async def fetch_stock_data_many_async(symbols, days=30, include_info=True, history_format='rows'):
+    return await run_io(fetch_stock_data_many, symbols, days, include_info, history_format)
+
+
+async def fetch_history_range_async(symbol, start, end, max_points, history_format='rows'):
+    return await run_io(fetch_history_range, symbol, start, end, max_points, history_format)
+
+
+async def analyze_sentiment_async(symbol, days=7, max_results=20):
+    return await run_io(analyze_sentiment, symbol, days, max_results)
+
+
+async def get_symbol_info_async(symbol):
+    return await run_io(get_symbol_info, symbol)
+
+
+_in_flight = {}  # prediction key -> asyncio.Task of the call in progress
+
+
+async def get_predictions_async(symbol, market='us', period='7d', stock_data=None, model=None):
+    """
+    get_predictions() with its upstream I/O awaited concurrently
+
+    Price data, close history, news sentiment and metadata are fetched at the
+    same time on the I/O pool; only the model work then runs in the worker
+    pool. Identical concurrent calls share one task, which keeps running if a
+    caller is cancelled (timed-out fan-out, client disconnect) so the others
+    still get the result.
+    """
+    key = (symbol, market, period, model)
+    task = _in_flight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_predict(symbol, market, period, stock_data, model))
+        _in_flight[key] = task
+        task.add_done_callback(functools.partial(_forget, key))
+    return await asyncio.shield(task)
+
+
+def _forget(key, task):
+    if _in_flight.get(key) is task:
+        del _in_flight[key]
+    # Mark the exception retrieved when every caller has gone away
+    if not task.cancelled():
+        task.exception()
+
+
+async def _predict(symbol, market, period, stock_data, model):
+    stock_data_task = (fetch_stock_data_async(symbol, days=PREDICTION_HISTORY_DAYS)
+                       if stock_data is None else _value(stock_data))
+
+    # Metadata is only fetched to warm its shared disk cache for the worker
+    stock_data, price_history, sentiment_data, _ = await asyncio.gather(
+        stock_data_task,
+        run_io(fetch_close_history, symbol, days=LSTM_TRAINING_DAYS),
+        analyze_sentiment_async(symbol, days=7, max_results=15),
+        get_symbol_info_async(symbol)
+    )
+
+    if not stock_data:
+        print(f"Could not fetch data for {symbol}")
+        return None
+
+    return await run_cpu(get_predictions, symbol, market, period, stock_data, model, price_history, sentiment_data)
+
+
+async def _value(value):
+    return value
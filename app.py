@@ -3,10 +3,12 @@ FinPridict Flask Backend API
 Serves AI-powered stock predictions and market data
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, g, stream_with_context
 from flask_cors import CORS
 from datetime import datetime, timedelta
 import os
+import json
+import time
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -16,8 +18,18 @@ load_dotenv()
 os.environ['TF_ENABLE_ONEDNN_OPTS'] = '0'
 
 # Import models and utilities
-from models import get_predictions, train_model
-from utils import fetch_stock_data, calculate_indicators, format_prediction_response
+from models import get_predictions, train_model, MARKET_SYMBOLS, PREDICTION_HISTORY_DAYS, PREDICTION_MODELS
+from utils import (
+    fetch_stock_data, fetch_stock_data_many, calculate_indicators, get_live_indicators,
+    format_prediction_response, fetch_history_range, HISTORY_FORMATS, HISTORY_RESPONSE_BARS,
+    CHART_DEFAULT_POINTS, CHART_MAX_POINTS
+)
+from jobs import get_job_manager, QueueFullError, FAN_OUT_TIMEOUT_SECONDS
+from cache import cache_stats
+from training import get_training_scheduler
+from warmup import start_warmup, get_warmup
+from metrics import observe_request, render_metrics
+from symbols import lookup_symbol, autocomplete, MARKETS, AUTOCOMPLETE_MAX_RESULTS
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for frontend requests
@@ -26,6 +38,8 @@ CORS(app)  # Enable CORS for frontend requests
 app.config['JSON_SORT_KEYS'] = False
 FLASK_ENV = os.getenv('FLASK_ENV', 'development')
 DEBUG = FLASK_ENV == 'development'
+MAX_BATCH_SYMBOLS = int(os.getenv('MAX_BATCH_SYMBOLS', '50'))
+SSE_HEARTBEAT_SECONDS = float(os.getenv('SSE_HEARTBEAT_SECONDS', '15'))
 
 print("=" * 60)
 print("FinPridict Backend Server Starting...")
@@ -33,6 +47,35 @@ print("=" * 60)
 print(f"Environment: {FLASK_ENV}")
 print(f"Debug Mode: {DEBUG}")
 
+# Load TensorFlow and friends in the background so the server can bind right away
+start_warmup()
+
+
+@app.before_request
+def _start_timer():
+    g.request_started = time.perf_counter()
+
+
+@app.after_request
+def _record_latency(response):
+    started = g.get('request_started')
+    if started is not None:
+        # Label by route pattern, not raw path, to keep the series count bounded
+        endpoint = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+        observe_request(request.method, endpoint, response.status_code, time.perf_counter() - started)
+    return response
+
+
+def _query_flag(name):
+    """Read a boolean query parameter such as ?async=true"""
+    return request.args.get(name, '').lower() in ('1', 'true', 'yes')
+
+
+def _query_date(name):
+    """Read an ISO date query parameter such as ?start=2023-01-31 (ValueError if malformed)"""
+    value = request.args.get(name)
+    return datetime.fromisoformat(value) if value else None
+
 
 # ============================================================================
 # HEALTH CHECK ENDPOINT
@@ -48,6 +91,24 @@ def health_check():
     }), 200
 
 
+@app.route('/ready', methods=['GET'])
+def readiness_check():
+    """
+    Readiness check: 503 until the background warm-up has succeeded (or was
+    skipped); a failed warm-up stays 503 so load balancers route around it
+
+    Response:
+    {
+        "status": "ready",  # 'pending', 'running', 'ready', 'failed', 'skipped'
+        "steps": {"libraries": 2.41, "lstm": 0.87, "workers": 6.2}
+    }
+    """
+    warmup = get_warmup()
+    response = warmup.status()
+    response['timestamp'] = datetime.now().isoformat()
+    return jsonify(response), 200 if warmup.is_ready() else 503
+
+
 # ============================================================================
 # PREDICTION ENDPOINTS
 # ============================================================================
@@ -61,7 +122,16 @@ def get_prediction():
     {
         "symbol": "AAPL",
         "market": "us",  # 'us', 'indian', 'crypto'
-        "period": "7d"   # '1d', '7d', '30d', '90d'
+        "period": "7d",  # '1d', '7d', '30d', '90d'
+        "model": "symbol",  # optional, 'symbol' (per-symbol LSTM) or 'market' (shared market LSTM)
+        "async": false   # optional, queue a background job instead of waiting
+    }
+
+    Async response (202):
+    {
+        "job_id": "9f1c...",
+        "status": "queued",
+        "status_url": "/api/jobs/9f1c..."
     }
 
     Response:
@@ -89,6 +159,7 @@ def get_prediction():
         symbol = data.get('symbol', '').upper()
         market = data.get('market', 'us').lower()
         period = data.get('period', '7d')
+        model = data.get('model')
 
         if not symbol:
             return jsonify({'error': 'Symbol is required'}), 400
@@ -96,8 +167,28 @@ def get_prediction():
         if market not in ['us', 'indian', 'crypto']:
             return jsonify({'error': 'Invalid market. Use: us, indian, crypto'}), 400
 
+        if model is not None and model not in PREDICTION_MODELS:
+            return jsonify({'error': f"Invalid model. Use: {', '.join(PREDICTION_MODELS)}"}), 400
+
+        run_async = data.get('async', False) or _query_flag('async')
+        if run_async:
+            try:
+                job_id = get_job_manager().submit_unique(
+                    ('predictions', symbol, market, period, model), get_predictions, symbol, market, period, None, model
+                )
+            except QueueFullError as e:
+                return jsonify({'error': str(e)}), 503
+
+            status_url = f'/api/jobs/{job_id}'
+            return jsonify({
+                'job_id': job_id,
+                'status': 'queued',
+                'status_url': status_url,
+                'timestamp': datetime.now().isoformat()
+            }), 202, {'Location': status_url}
+
         # Get prediction from ML model
-        prediction = get_predictions(symbol, market, period)
+        prediction = get_predictions(symbol, market, period, model=model)
 
         if not prediction:
             return jsonify({'error': f'Could not generate prediction for {symbol}. Please check the symbol and try again.'}), 400
@@ -115,41 +206,35 @@ def search_symbol(symbol):
     Search and validate any stock symbol
 
     Query params:
-    - market: 'us', 'indian', 'crypto' (optional, will try all if not specified)
+    - market: 'us', 'indian', 'crypto' (optional, preferred market for tickers
+              listed in several, e.g. INFY vs INFY.NS)
 
-    Returns symbol information if found
+    Symbols are resolved against the local symbol master (RELIANCE finds
+    RELIANCE.NS, BTC finds BTC-USD); price data is only fetched for a
+    confirmed symbol. Returns symbol information if found
     """
     try:
         symbol = symbol.upper()
         market = request.args.get('market', '').lower()
 
-        markets_to_try = [market] if market in ['us', 'indian', 'crypto'] else ['us', 'indian', 'crypto']
+        entry = lookup_symbol(symbol, market if market in MARKETS else None)
 
-        for m in markets_to_try:
-            try:
-                # Try to fetch data for this symbol in this market
-                stock_data = fetch_stock_data(symbol, days=30)
-
-                if stock_data:
-                    # Get company name
-                    from models import get_company_name, get_sector_from_symbol
-                    name = get_company_name(symbol, m)
-                    sector = get_sector_from_symbol(symbol, m)
-
-                    return jsonify({
-                        'symbol': symbol,
-                        'name': name,
-                        'market': m,
-                        'sector': sector,
-                        'currentPrice': stock_data['currentPrice'],
-                        'currency': stock_data.get('currency', 'USD'),
-                        'found': True,
-                        'timestamp': datetime.now().isoformat()
-                    }), 200
-
-            except Exception as e:
-                print(f"Error searching {symbol} in {m}: {str(e)}")
-                continue
+        if entry is not None:
+            stock_data = fetch_stock_data(entry['symbol'], days=30)
+
+            if stock_data:
+                return jsonify({
+                    'symbol': entry['symbol'],
+                    'name': entry['name'],
+                    'market': entry['market'],
+                    'sector': entry['sector'],
+                    'currentPrice': stock_data['currentPrice'],
+                    'currency': stock_data.get('currency', 'USD'),
+                    'found': True,
+                    'timestamp': datetime.now().isoformat()
+                }), 200
+
+            print(f"No price data for {entry['symbol']}")
 
         return jsonify({
             'symbol': symbol,
@@ -163,6 +248,80 @@ def search_symbol(symbol):
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/autocomplete', methods=['GET'])
+def autocomplete_symbols():
+    """
+    Suggest symbols as the user types, from the local symbol master (no network calls)
+
+    Query params:
+    - q: partial ticker or company name, e.g. 'rel' or 'tata cons'
+    - market: 'us', 'indian', 'crypto' (optional)
+    - limit: most results (default: 10, max: AUTOCOMPLETE_MAX_RESULTS)
+
+    Response:
+    {
+        "query": "rel",
+        "count": 1,
+        "results": [{"symbol": "RELIANCE.NS", "name": "Reliance Industries Ltd.",
+                     "market": "indian", "sector": "Energy"}]
+    }
+    """
+    try:
+        query = request.args.get('q', '')
+        market = request.args.get('market', '').lower() or None
+        limit = request.args.get('limit', 10, type=int)
+
+        if market is not None and market not in MARKETS:
+            return jsonify({'error': 'Invalid market. Use: us, indian, crypto'}), 400
+
+        results = autocomplete(query, market, min(limit, AUTOCOMPLETE_MAX_RESULTS))
+
+        return jsonify({
+            'query': query,
+            'count': len(results),
+            'results': results,
+            'timestamp': datetime.now().isoformat()
+        }), 200
+
+    except Exception as e:
+        print(f"Error in autocomplete_symbols: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+
+def _market_prediction_calls(market):
+    """
+    Validate a market predictions request and build its get_predictions calls
+    
+    Returns:
+        Tuple of (calls, timeout, error_response); error_response is None if valid
+    """
+    if market not in ['us', 'indian', 'crypto']:
+        return None, None, (jsonify({'error': 'Invalid market'}), 400)
+    
+    period = request.args.get('period', '7d')
+    model = request.args.get('model')
+    if model is not None and model not in PREDICTION_MODELS:
+        return None, None, (jsonify({'error': f"Invalid model. Use: {', '.join(PREDICTION_MODELS)}"}), 400)
+    timeout = request.args.get('timeout', FAN_OUT_TIMEOUT_SECONDS, type=float)
+    timeout = min(max(timeout, 1.0), FAN_OUT_TIMEOUT_SECONDS)
+    
+    stocks = MARKET_SYMBOLS.get(market, [])
+    
+    # One batched download for the whole market; workers refetch any symbol missing from it
+    market_data = fetch_stock_data_many(stocks, days=PREDICTION_HISTORY_DAYS, include_info=False)
+    
+    calls = [(symbol, market, period, market_data.get(symbol), model) for symbol in stocks]
+    return calls, timeout, None
+
+
+def _sse_event(event, data, event_id=None):
+    """Format one Server-Sent Event"""
+    lines = [f'id: {event_id}'] if event_id is not None else []
+    lines.append(f'event: {event}')
+    lines.append(f'data: {json.dumps(data)}')
+    return '\n'.join(lines) + '\n\n'
+
+
 @app.route('/api/predictions/<market>', methods=['GET'])
 def get_market_predictions(market):
     """
@@ -170,38 +329,33 @@ def get_market_predictions(market):
     
     Query params:
     - period: '1d', '7d', '30d', '90d' (default: '7d')
+    - model: 'symbol' or 'market' (default: PREDICTION_MODEL setting)
+    - timeout: seconds to wait for the slowest symbol (default: FAN_OUT_TIMEOUT_SECONDS)
     
-    Returns list of predictions for all stocks in that market
+    Returns list of predictions for all stocks in that market. Symbols are
+    predicted in parallel; any that fail or time out are listed in 'errors'.
     """
     try:
-        if market not in ['us', 'indian', 'crypto']:
-            return jsonify({'error': 'Invalid market'}), 400
-        
-        period = request.args.get('period', '7d')
+        calls, timeout, error_response = _market_prediction_calls(market)
+        if error_response:
+            return error_response
         
-        # Define stocks for each market
-        market_stocks = {
-            'us': ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA'],
-            'indian': ['RELIANCE.NS', 'TCS.NS', 'HDFCBANK.NS', 'INFY.NS', 'ITC.NS'],
-            'crypto': ['BTC-USD', 'ETH-USD', 'BNB-USD', 'SOL-USD', 'ADA-USD']
-        }
-        
-        stocks = market_stocks.get(market, [])
         predictions = []
+        errors = []
         
-        for symbol in stocks:
-            try:
-                pred = get_predictions(symbol, market, period)
-                if pred:
-                    predictions.append(pred)
-            except Exception as e:
-                print(f"Error getting prediction for {symbol}: {str(e)}")
-                continue
+        for (symbol, *_), pred, error in get_job_manager().run_many(get_predictions, calls, timeout=timeout):
+            if pred:
+                predictions.append(pred)
+            else:
+                error = error or 'Could not generate prediction'
+                print(f"Error getting prediction for {symbol}: {error}")
+                errors.append({'symbol': symbol, 'error': error})
         
         return jsonify({
             'market': market,
             'count': len(predictions),
             'predictions': predictions,
+            'errors': errors,
             'timestamp': datetime.now().isoformat()
         }), 200
         
@@ -210,6 +364,118 @@ def get_market_predictions(market):
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/predictions/<market>/stream', methods=['GET'])
+def stream_market_predictions(market):
+    """
+    Stream predictions for a market as Server-Sent Events
+    
+    Takes the same query params as /api/predictions/<market>. Each symbol is
+    sent as soon as its prediction finishes, so the first result arrives after
+    one symbol's latency rather than the slowest one's:
+    
+        event: prediction   data: {...prediction...}
+        event: error        data: {"symbol": "TSLA", "error": "..."}
+        event: summary      data: {"market": "us", "count": 4, "errors": [...], "duration_seconds": 12.3}
+    
+    A comment line is sent every SSE_HEARTBEAT_SECONDS while waiting so
+    proxies do not close an idle connection.
+    """
+    try:
+        calls, timeout, error_response = _market_prediction_calls(market)
+        if error_response:
+            return error_response
+        
+    except Exception as e:
+        print(f"Error in stream_market_predictions: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+    
+    def _events():
+        started = time.perf_counter()
+        count = 0
+        errors = []
+        event_id = 0
+        
+        for outcome in get_job_manager().iter_many(get_predictions, calls, timeout=timeout,
+                                                   heartbeat=SSE_HEARTBEAT_SECONDS):
+            if outcome is None:
+                yield ': keep-alive\n\n'
+                continue
+            
+            (symbol, *_), pred, error = outcome
+            event_id += 1
+            if pred:
+                count += 1
+                yield _sse_event('prediction', pred, event_id)
+            else:
+                error = error or 'Could not generate prediction'
+                print(f"Error getting prediction for {symbol}: {error}")
+                errors.append({'symbol': symbol, 'error': error})
+                yield _sse_event('error', errors[-1], event_id)
+        
+        yield _sse_event('summary', {
+            'market': market,
+            'count': count,
+            'errors': errors,
+            'duration_seconds': round(time.perf_counter() - started, 3),
+            'timestamp': datetime.now().isoformat()
+        }, event_id + 1)
+    
+    return Response(stream_with_context(_events()), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'  # stop nginx from buffering the stream
+    })
+
+
+# ============================================================================
+# JOB ENDPOINTS
+# ============================================================================
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """
+    Get the status of a background prediction job
+
+    Query params:
+    - wait: seconds to wait for the job to finish before responding (default: 0)
+
+    Response:
+    {
+        "job_id": "9f1c...",
+        "status": "completed",  # 'queued', 'running', 'completed', 'failed'
+        "result": {...}         # prediction, once completed
+    }
+    """
+    try:
+        wait = request.args.get('wait', 0, type=float)
+        job = get_job_manager().get(job_id, wait=wait)
+
+        if job is None:
+            return jsonify({'error': f'Job {job_id} not found'}), 404
+
+        if job['status'] == 'completed' and not job.get('result'):
+            job['status'] = 'failed'
+            job['error'] = 'Could not generate prediction. Please check the symbol and try again.'
+
+        return jsonify(job), 200
+
+    except Exception as e:
+        print(f"Error in get_job: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/jobs', methods=['GET'])
+def get_job_stats():
+    """Get worker pool size and job queue depth"""
+    try:
+        stats = get_job_manager().stats()
+        stats['timestamp'] = datetime.now().isoformat()
+        return jsonify(stats), 200
+
+    except Exception as e:
+        print(f"Error in get_job_stats: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+
 # ============================================================================
 # STOCK DATA ENDPOINTS
 # ============================================================================
@@ -221,17 +487,53 @@ def get_stock_data(symbol):
     
     Query params:
     - days: number of historical days (default: 30)
+    - start, end: chart range as YYYY-MM-DD (default: the last `days` days)
+    - max_points: most bars in historical_data (default: CHART_DEFAULT_POINTS, max: CHART_MAX_POINTS)
+    - format: 'rows' (default) or 'columnar' for historical_data as
+              {"date": [...], "open": [...], ...}, which is smaller for charts
+    
+    historical_data holds the last 30 bars unless a range is requested (start,
+    end, max_points or days above 30). Ranges cover every bar, downsampled
+    with Largest-Triangle-Three-Buckets to max_points, and are described
+    under 'history': {"start", "end", "bars", "points", "downsampled"}.
     """
     try:
         symbol = symbol.upper()
         days = request.args.get('days', 30, type=int)
+        history_format = request.args.get('format', 'rows')
+        max_points = request.args.get('max_points', type=int)
+        
+        if history_format not in HISTORY_FORMATS:
+            return jsonify({'error': f"Invalid format. Use: {', '.join(HISTORY_FORMATS)}"}), 400
+        
+        try:
+            start = _query_date('start')
+            end = _query_date('end')
+        except ValueError:
+            return jsonify({'error': 'start and end must be dates like 2024-01-31'}), 400
         
         # Fetch stock data
-        stock_data = fetch_stock_data(symbol, days)
+        stock_data = fetch_stock_data(symbol, days, history_format=history_format)
         
         if not stock_data:
             return jsonify({'error': f'Could not fetch data for {symbol}'}), 400
         
+        if start or end or max_points or days > HISTORY_RESPONSE_BARS:
+            # Whole days keep the range (and its cache key) stable between requests
+            end = datetime.combine((end or datetime.now()).date(), datetime.max.time())
+            start = datetime.combine((start or end - timedelta(days=days)).date(), datetime.min.time())
+            if start > end:
+                return jsonify({'error': 'start must not be after end'}), 400
+            max_points = min(max(max_points or CHART_DEFAULT_POINTS, 3), CHART_MAX_POINTS)
+            
+            history = fetch_history_range(symbol, start, end, max_points, history_format)
+            if not history:
+                return jsonify({'error': f'No history for {symbol} in the requested range'}), 400
+            
+            # Cached responses are shared, so build a new dictionary
+            history = dict(history)
+            stock_data = dict(stock_data, historical_data=history.pop('historical_data'), history=history)
+        
         return jsonify(stock_data), 200
         
     except Exception as e:
@@ -239,6 +541,44 @@ def get_stock_data(symbol):
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/stock-data', methods=['GET'])
+def get_stock_data_batch():
+    """
+    Get current stock data for several symbols (e.g. a watchlist) in one call
+    
+    Query params:
+    - symbols: comma-separated symbols, e.g. 'AAPL,MSFT,BTC-USD' (max: MAX_BATCH_SYMBOLS)
+    - days: number of historical days (default: 30)
+    - format: 'rows' (default) or 'columnar' historical_data
+    """
+    try:
+        symbols = [s.strip().upper() for s in request.args.get('symbols', '').split(',') if s.strip()]
+        days = request.args.get('days', 30, type=int)
+        history_format = request.args.get('format', 'rows')
+        
+        if not symbols:
+            return jsonify({'error': 'symbols is required'}), 400
+        
+        if history_format not in HISTORY_FORMATS:
+            return jsonify({'error': f"Invalid format. Use: {', '.join(HISTORY_FORMATS)}"}), 400
+        
+        if len(symbols) > MAX_BATCH_SYMBOLS:
+            return jsonify({'error': f'At most {MAX_BATCH_SYMBOLS} symbols per request'}), 400
+        
+        data = fetch_stock_data_many(symbols, days, history_format=history_format)
+        
+        return jsonify({
+            'count': len(data),
+            'data': data,
+            'missing': [s for s in symbols if s not in data],
+            'timestamp': datetime.now().isoformat()
+        }), 200
+        
+    except Exception as e:
+        print(f"Error in get_stock_data_batch: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+
 @app.route('/api/technical-indicators/<symbol>', methods=['GET'])
 def get_technical_indicators(symbol):
     """
@@ -246,12 +586,17 @@ def get_technical_indicators(symbol):
     
     Query params:
     - period: '1d', '1w', '1m', '3m', '1y' (default: '1m')
+    - live: 'true' to answer from in-memory streaming indicators over the
+            full stored history instead of recomputing them for the period
     """
     try:
         symbol = symbol.upper()
         period = request.args.get('period', '1m')
         
-        indicators = calculate_indicators(symbol, period)
+        if _query_flag('live'):
+            indicators = get_live_indicators(symbol)
+        else:
+            indicators = calculate_indicators(symbol, period)
         
         if not indicators:
             return jsonify({'error': f'Could not calculate indicators for {symbol}'}), 400
@@ -270,33 +615,113 @@ def get_technical_indicators(symbol):
 @app.route('/api/models/train', methods=['POST'])
 def train_models():
     """
-    Trigger model retraining (admin endpoint)
+    Start a batch model retraining run (admin endpoint)
     
     Request body:
     {
-        "market": "us",  # optional
-        "force": true    # force retrain
+        "market": "us",  # optional, all markets if omitted
+        "force": true    # retrain models that are still fresh too
+    }
+    
+    Response (202):
+    {
+        "run_id": "4be0...",
+        "status": "running",
+        "status_url": "/api/models/train/4be0...",
+        "progress": {"total": 20, "done": 0, ...}
     }
     """
     try:
-        data = request.get_json() or {}
+        data = request.get_json(silent=True) or {}
         market = data.get('market', None)
-        force = data.get('force', False)
+        force = bool(data.get('force', False))
+        
+        if market and market not in ['us', 'indian', 'crypto']:
+            return jsonify({'error': 'Invalid market. Use: us, indian, crypto'}), 400
         
-        result = train_model(market, force)
+        run = train_model(market, force)
+        status_url = f"/api/models/train/{run['run_id']}"
         
         return jsonify({
-            'status': 'training_initiated',
+            'run_id': run['run_id'],
+            'status': run['status'],
+            'status_url': status_url,
             'market': market,
-            'message': result,
+            'force': force,
+            'progress': run['progress'],
             'timestamp': datetime.now().isoformat()
-        }), 202
+        }), 202, {'Location': status_url}
         
     except Exception as e:
         print(f"Error in train_models: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/api/models/train/<run_id>', methods=['GET'])
+def get_training_run(run_id):
+    """
+    Get the progress of a training run
+    
+    Response:
+    {
+        "run_id": "4be0...",
+        "status": "running",  # 'running', 'completed'
+        "progress": {"total": 20, "done": 7, "trained": 6, "failed": 1, "skipped": 40, "percent": 35.0},
+        "tasks": [{"symbol": "AAPL", "horizon": 7, "status": "trained", "duration_seconds": 41.2,
+                   "loss": 0.0012, "artifact_path": "..."}, ...]
+    }
+    """
+    try:
+        run = get_training_scheduler().get(run_id)
+        
+        if run is None:
+            return jsonify({'error': f'Training run {run_id} not found'}), 404
+        
+        return jsonify(run), 200
+        
+    except Exception as e:
+        print(f"Error in get_training_run: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/models/train', methods=['GET'])
+def get_training_runs():
+    """List recent training runs, newest first"""
+    try:
+        return jsonify({
+            'runs': get_training_scheduler().list(),
+            'timestamp': datetime.now().isoformat()
+        }), 200
+        
+    except Exception as e:
+        print(f"Error in get_training_runs: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+
+# ============================================================================
+# MONITORING ENDPOINTS
+# ============================================================================
+
+@app.route('/api/cache/stats', methods=['GET'])
+def get_cache_stats():
+    """Get size, hit/miss/eviction counters and hit ratio per cache namespace"""
+    try:
+        return jsonify({
+            'caches': cache_stats(),
+            'timestamp': datetime.now().isoformat()
+        }), 200
+
+    except Exception as e:
+        print(f"Error in get_cache_stats: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/metrics', methods=['GET'])
+def get_metrics():
+    """Request latency histograms, per-stage timings, upstream errors and cache counters in Prometheus text format"""
+    return Response(render_metrics(), mimetype='text/plain; version=0.0.4; charset=utf-8')
+
+
 # ============================================================================
 # ERROR HANDLERS
 # ============================================================================
@@ -319,12 +744,21 @@ if __name__ == '__main__':
     print("\nStarting FinPridict Flask Server...")
     print("API Documentation: http://localhost:5000")
     print("Health Check: http://localhost:5000/health")
+    print("Readiness Check: http://localhost:5000/ready")
     print("\nAvailable Endpoints:")
     print("  POST   /api/predictions - Get single stock prediction")
     print("  GET    /api/predictions/<market> - Get all predictions for market")
+    print("  GET    /api/predictions/<market>/stream - Stream market predictions (SSE)")
+    print("  GET    /api/jobs/<job_id> - Get background prediction job status")
+    print("  GET    /api/jobs - Get prediction job queue depth")
     print("  GET    /api/stock-data/<symbol> - Get stock data")
+    print("  GET    /api/stock-data?symbols=A,B - Get stock data for several symbols")
+    print("  GET    /api/autocomplete?q=... - Suggest symbols by ticker or name")
     print("  GET    /api/technical-indicators/<symbol> - Get indicators")
-    print("  POST   /api/models/train - Retrain models")
+    print("  POST   /api/models/train - Start a model retraining run")
+    print("  GET    /api/models/train/<run_id> - Get training run progress")
+    print("  GET    /api/cache/stats - Get cache hit/miss counters")
+    print("  GET    /metrics - Prometheus metrics")
     print("=" * 60)
     
     app.run(
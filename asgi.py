@@ -0,0 +1,287 @@
+"""
+FinPridict ASGI Server
+Async serving mode for the Flask API: the prediction and stock data endpoints
+await their upstream I/O concurrently instead of blocking a worker, and every
+other route is served by the Flask app in app.py
+
+Run with: uvicorn asgi:app --host 0.0.0.0 --port 5000
+      or: python asgi.py
+"""
+
+import os
+import json
+import time
+import asyncio
+from datetime import datetime, timedelta
+
+from a2wsgi import WSGIMiddleware
+from starlette.applications import Starlette
+from starlette.responses import Response
+from starlette.routing import Route, Mount
+
+from app import app as flask_app, DEBUG, MAX_BATCH_SYMBOLS
+from models import MARKET_SYMBOLS, PREDICTION_HISTORY_DAYS, PREDICTION_MODELS, get_predictions
+from utils import HISTORY_FORMATS, HISTORY_RESPONSE_BARS, CHART_DEFAULT_POINTS, CHART_MAX_POINTS
+from jobs import get_job_manager, QueueFullError, FAN_OUT_TIMEOUT_SECONDS
+from metrics import observe_request
+from aio import (
+    get_predictions_async, fetch_stock_data_async, fetch_stock_data_many_async, fetch_history_range_async
+)
+
+# Threads serving the Flask routes mounted below (SSE streams hold one each for their whole run)
+WSGI_THREADS = int(os.getenv('WSGI_THREADS', '64'))
+
+
+def _json(data, status=200, headers=None):
+    """JSON response encoded like Flask's jsonify (NaN allowed, key order kept)"""
+    return Response(json.dumps(data), status_code=status, headers=headers, media_type='application/json')
+
+
+def _instrumented(endpoint):
+    """Record request latency under the same endpoint labels the Flask routes use"""
+    def decorator(handler):
+        async def wrapper(request):
+            started = time.perf_counter()
+            response = await handler(request)
+            observe_request(request.method, endpoint, response.status_code, time.perf_counter() - started)
+            return response
+        return wrapper
+    return decorator
+
+
+def _query_flag(request, name):
+    return request.query_params.get(name, '').lower() in ('1', 'true', 'yes')
+
+
+def _query_number(request, name, default, kind):
+    try:
+        return kind(request.query_params[name])
+    except (KeyError, ValueError):
+        return default
+
+
+# ============================================================================
+# PREDICTION ENDPOINTS
+# ============================================================================
+
+@_instrumented('/api/predictions')
+async def get_prediction(request):
+    """Async version of app.get_prediction (same request body and responses)"""
+    try:
+        try:
+            data = await request.json()
+        except ValueError:
+            data = None
+
+        if not data:
+            return _json({'error': 'No data provided'}, 400)
+
+        symbol = data.get('symbol', '').upper()
+        market = data.get('market', 'us').lower()
+        period = data.get('period', '7d')
+        model = data.get('model')
+
+        if not symbol:
+            return _json({'error': 'Symbol is required'}, 400)
+
+        if market not in ['us', 'indian', 'crypto']:
+            return _json({'error': 'Invalid market. Use: us, indian, crypto'}, 400)
+
+        if model is not None and model not in PREDICTION_MODELS:
+            return _json({'error': f"Invalid model. Use: {', '.join(PREDICTION_MODELS)}"}, 400)
+
+        if data.get('async', False) or _query_flag(request, 'async'):
+            try:
+                job_id = get_job_manager().submit_unique(
+                    ('predictions', symbol, market, period, model), get_predictions, symbol, market, period, None, model
+                )
+            except QueueFullError as e:
+                return _json({'error': str(e)}, 503)
+
+            status_url = f'/api/jobs/{job_id}'
+            return _json({
+                'job_id': job_id,
+                'status': 'queued',
+                'status_url': status_url,
+                'timestamp': datetime.now().isoformat()
+            }, 202, {'Location': status_url})
+
+        try:
+            prediction = await get_predictions_async(symbol, market, period, model=model)
+        except QueueFullError as e:
+            return _json({'error': str(e)}, 503)
+
+        if not prediction:
+            return _json({'error': f'Could not generate prediction for {symbol}. Please check the symbol and try again.'}, 400)
+
+        return _json(prediction)
+
+    except Exception as e:
+        print(f"Error in get_prediction: {str(e)}")
+        return _json({'error': str(e)}, 500)
+
+
+@_instrumented('/api/predictions/<market>')
+async def get_market_predictions(request):
+    """Async version of app.get_market_predictions (same query params and response)"""
+    try:
+        market = request.path_params['market']
+        if market not in ['us', 'indian', 'crypto']:
+            return _json({'error': 'Invalid market'}, 400)
+
+        period = request.query_params.get('period', '7d')
+        model = request.query_params.get('model')
+        if model is not None and model not in PREDICTION_MODELS:
+            return _json({'error': f"Invalid model. Use: {', '.join(PREDICTION_MODELS)}"}, 400)
+        timeout = _query_number(request, 'timeout', FAN_OUT_TIMEOUT_SECONDS, float)
+        timeout = min(max(timeout, 1.0), FAN_OUT_TIMEOUT_SECONDS)
+
+        stocks = MARKET_SYMBOLS.get(market, [])
+        market_data = await fetch_stock_data_many_async(stocks, days=PREDICTION_HISTORY_DAYS, include_info=False)
+
+        tasks = {
+            symbol: asyncio.ensure_future(get_predictions_async(symbol, market, period, market_data.get(symbol), model))
+            for symbol in stocks
+        }
+        done, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+        for task in pending:
+            task.cancel()
+
+        predictions = []
+        errors = []
+        for symbol, task in tasks.items():
+            if task in pending:
+                error = f'Timed out after {timeout:g}s'
+            elif task.exception() is not None:
+                error = str(task.exception())
+            elif task.result():
+                predictions.append(task.result())
+                continue
+            else:
+                error = 'Could not generate prediction'
+            print(f"Error getting prediction for {symbol}: {error}")
+            errors.append({'symbol': symbol, 'error': error})
+
+        return _json({
+            'market': market,
+            'count': len(predictions),
+            'predictions': predictions,
+            'errors': errors,
+            'timestamp': datetime.now().isoformat()
+        })
+
+    except Exception as e:
+        print(f"Error in get_market_predictions: {str(e)}")
+        return _json({'error': str(e)}, 500)
+
+
+# ============================================================================
+# STOCK DATA ENDPOINTS
+# ============================================================================
+
+@_instrumented('/api/stock-data/<symbol>')
+async def get_stock_data(request):
+    """Async version of app.get_stock_data (same query params and response)"""
+    try:
+        symbol = request.path_params['symbol'].upper()
+        days = _query_number(request, 'days', 30, int)
+        history_format = request.query_params.get('format', 'rows')
+        max_points = _query_number(request, 'max_points', None, int)
+
+        if history_format not in HISTORY_FORMATS:
+            return _json({'error': f"Invalid format. Use: {', '.join(HISTORY_FORMATS)}"}, 400)
+
+        try:
+            start = request.query_params.get('start')
+            start = datetime.fromisoformat(start) if start else None
+            end = request.query_params.get('end')
+            end = datetime.fromisoformat(end) if end else None
+        except ValueError:
+            return _json({'error': 'start and end must be dates like 2024-01-31'}, 400)
+
+        wants_range = bool(start or end or max_points or days > HISTORY_RESPONSE_BARS)
+        if wants_range:
+            # Whole days keep the range (and its cache key) stable between requests
+            end = datetime.combine((end or datetime.now()).date(), datetime.max.time())
+            start = datetime.combine((start or end - timedelta(days=days)).date(), datetime.min.time())
+            if start > end:
+                return _json({'error': 'start must not be after end'}, 400)
+            max_points = min(max(max_points or CHART_DEFAULT_POINTS, 3), CHART_MAX_POINTS)
+
+            # The summary and the chart range are independent upstream reads
+            stock_data, history = await asyncio.gather(
+                fetch_stock_data_async(symbol, days, history_format=history_format),
+                fetch_history_range_async(symbol, start, end, max_points, history_format)
+            )
+        else:
+            stock_data = await fetch_stock_data_async(symbol, days, history_format=history_format)
+            history = None
+
+        if not stock_data:
+            return _json({'error': f'Could not fetch data for {symbol}'}, 400)
+
+        if wants_range:
+            if not history:
+                return _json({'error': f'No history for {symbol} in the requested range'}, 400)
+            # Cached responses are shared, so build a new dictionary
+            history = dict(history)
+            stock_data = dict(stock_data, historical_data=history.pop('historical_data'), history=history)
+
+        return _json(stock_data)
+
+    except Exception as e:
+        print(f"Error in get_stock_data: {str(e)}")
+        return _json({'error': str(e)}, 500)
+
+
+@_instrumented('/api/stock-data')
+async def get_stock_data_batch(request):
+    """Async version of app.get_stock_data_batch (same query params and response)"""
+    try:
+        symbols = [s.strip().upper() for s in request.query_params.get('symbols', '').split(',') if s.strip()]
+        days = _query_number(request, 'days', 30, int)
+        history_format = request.query_params.get('format', 'rows')
+
+        if not symbols:
+            return _json({'error': 'symbols is required'}, 400)
+
+        if history_format not in HISTORY_FORMATS:
+            return _json({'error': f"Invalid format. Use: {', '.join(HISTORY_FORMATS)}"}, 400)
+
+        if len(symbols) > MAX_BATCH_SYMBOLS:
+            return _json({'error': f'At most {MAX_BATCH_SYMBOLS} symbols per request'}, 400)
+
+        data = await fetch_stock_data_many_async(symbols, days, history_format=history_format)
+
+        return _json({
+            'count': len(data),
+            'data': data,
+            'missing': [s for s in symbols if s not in data],
+            'timestamp': datetime.now().isoformat()
+        })
+
+    except Exception as e:
+        print(f"Error in get_stock_data_batch: {str(e)}")
+        return _json({'error': str(e)}, 500)
+
+
+# ============================================================================
+# APPLICATION
+# ============================================================================
+
+app = Starlette(debug=DEBUG, routes=[
+    Route('/api/predictions', get_prediction, methods=['POST']),
+    Route('/api/predictions/{market}', get_market_predictions, methods=['GET']),
+    Route('/api/stock-data/{symbol}', get_stock_data, methods=['GET']),
+    Route('/api/stock-data', get_stock_data_batch, methods=['GET']),
+    # Everything else (jobs, training, search, SSE, metrics, ...) is served by Flask
+    # on a thread pool, so a long stream never holds up /health or /metrics
+    Mount('/', app=WSGIMiddleware(flask_app, workers=WSGI_THREADS))
+])
+
+
+if __name__ == '__main__':
+    import uvicorn
+
+    print("\nStarting FinPridict ASGI Server...")
+    uvicorn.run(app, host='0.0.0.0', port=int(os.getenv('PORT', '5000')))
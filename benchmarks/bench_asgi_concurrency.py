@@ -0,0 +1,73 @@
+"""
+ASGI Fall-Through Concurrency Check
+Sends concurrent slow requests to Flask routes mounted in asgi.py and checks
+they run in parallel, and that /health stays fast while they are in flight
+
+A slow route is registered on the Flask app for the run; nothing touches the
+network. Exits non-zero if the requests were serialized.
+
+Usage: python benchmarks/bench_asgi_concurrency.py [--requests 8] [--sleep 1.0]
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('WARMUP_ON_START', 'false')
+
+import httpx
+
+from app import app as flask_app
+
+
+async def _run(requests, sleep_seconds):
+    @flask_app.route('/_bench/sleep', methods=['GET'])
+    def _bench_sleep():
+        time.sleep(sleep_seconds)
+        return {'slept': sleep_seconds}
+
+    from asgi import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+        async def timed(path):
+            start = time.perf_counter()
+            response = await client.get(path)
+            response.raise_for_status()
+            return time.perf_counter() - start
+
+        start = time.perf_counter()
+        slow = [asyncio.ensure_future(timed('/_bench/sleep')) for _ in range(requests)]
+        await asyncio.sleep(sleep_seconds / 4)
+        health_seconds = await timed('/health')
+        await asyncio.gather(*slow)
+        total_seconds = time.perf_counter() - start
+
+    return total_seconds, health_seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--requests', type=int, default=8)
+    parser.add_argument('--sleep', type=float, default=1.0)
+    args = parser.parse_args()
+
+    total_seconds, health_seconds = asyncio.run(_run(args.requests, args.sleep))
+    serialized_seconds = args.requests * args.sleep
+
+    print(f"{args.requests} concurrent {args.sleep:g}s Flask requests: {total_seconds:.2f}s "
+          f"(serialized would take {serialized_seconds:.2f}s)")
+    print(f"/health while they ran: {health_seconds * 1000:.1f}ms")
+
+    # Parallel requests finish in about one sleep; allow generous scheduling slack
+    if total_seconds > args.sleep * 2 or health_seconds > args.sleep / 2:
+        print("FAIL: fall-through routes are not served concurrently")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == '__main__':
+    main()
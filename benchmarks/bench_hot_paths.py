@@ -0,0 +1,347 @@
+"""
+Data and Model Hot Path Benchmark
+Times indicator, formatting, downsampling, LSTM, sentiment and serialization code on
+synthetic OHLCV fixtures, fully offline, and writes JSON results that can be
+compared between commits
+
+yfinance, alpha_vantage and GoogleNews are replaced by in-process stubs and
+every on-disk store points at a temporary directory, so no network access is
+needed and nothing under the repo is touched.
+
+Usage: python benchmarks/bench_hot_paths.py [--quick] [--repeat 5] [--output results.json]
+                                            [--compare previous.json]
+"""
+
+import os
+import sys
+import json
+import time
+import types
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+SERIES_SIZES = [250, 1000, 5000]
+SYMBOL_COUNTS = [1, 5, 10, 50]
+QUICK_SERIES_SIZES = [250, 1000]
+QUICK_SYMBOL_COUNTS = [1, 5, 10]
+
+HEADLINES = [
+    'Shares surge after record quarterly earnings beat expectations',
+    'Regulators open investigation into accounting practices',
+    'Analysts see steady growth as new product line ships',
+    'Stock slides on weak guidance and supply chain concerns',
+    'Company announces buyback and raises dividend',
+    'CEO resigns amid boardroom dispute'
+]
+
+
+# ============================================================================
+# OFFLINE FIXTURES
+# ============================================================================
+
+def make_ohlcv(size, seed=0, end=None):
+    """Synthetic daily OHLCV frame with a geometric random walk close"""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, size)))
+    spread = np.abs(rng.normal(0, 0.01, size)) * close
+    index = pd.bdate_range(end=end or pd.Timestamp('2025-01-03'), periods=size)
+    return pd.DataFrame({
+        'Open': close + rng.normal(0, 0.3, size),
+        'High': close + spread,
+        'Low': close - spread,
+        'Close': close,
+        'Volume': rng.integers(1_000_000, 50_000_000, size)
+    }, index=index)
+
+
+class _StubGoogleNews:
+    """Stands in for GoogleNews.GoogleNews with canned headlines"""
+
+    def __init__(self, period='7d', **kwargs):
+        self._query = ''
+
+    def search(self, query):
+        self._query = query
+
+    def result(self):
+        return [{'title': f"{self._query}: {headline}", 'date': '1 day ago', 'link': ''} for headline in HEADLINES * 4]
+
+
+class _StubTimeSeries:
+    """Stands in for alpha_vantage.timeseries.TimeSeries"""
+
+    def __init__(self, key=None, output_format='pandas'):
+        pass
+
+    def get_daily(self, symbol, outputsize='compact'):
+        df = make_ohlcv(100 if outputsize == 'compact' else 1000)
+        df.columns = ['1. open', '2. high', '3. low', '4. close', '5. volume']
+        return df, {}
+
+
+def _stub_download(tickers, start=None, end=None, **kwargs):
+    symbols = [tickers] if isinstance(tickers, str) else list(tickers)
+    size = max(int(np.busday_count(pd.Timestamp(start).date(), pd.Timestamp(end).date())), 1)
+    frames = {symbol: make_ohlcv(size, seed=i, end=pd.Timestamp(end)) for i, symbol in enumerate(symbols)}
+    if isinstance(tickers, str):
+        return frames[tickers]
+    return pd.concat(frames, axis=1)
+
+
+class _StubTicker:
+    def __init__(self, symbol):
+        self.info = {'longName': f"{symbol} Corp", 'sector': 'Technology', 'currency': 'USD'}
+
+
+def install_offline_stubs(workdir):
+    """Replace network-backed modules with stubs and point stores at workdir"""
+    yfinance = types.ModuleType('yfinance')
+    yfinance.download = _stub_download
+    yfinance.Ticker = _StubTicker
+
+    alpha_vantage = types.ModuleType('alpha_vantage')
+    timeseries = types.ModuleType('alpha_vantage.timeseries')
+    timeseries.TimeSeries = _StubTimeSeries
+    alpha_vantage.timeseries = timeseries
+
+    googlenews = types.ModuleType('GoogleNews')
+    googlenews.GoogleNews = _StubGoogleNews
+
+    sys.modules.update({
+        'yfinance': yfinance,
+        'alpha_vantage': alpha_vantage,
+        'alpha_vantage.timeseries': timeseries,
+        'GoogleNews': googlenews
+    })
+
+    for name in ('MODEL_DIR', 'OHLCV_DIR', 'METADATA_DIR'):
+        os.environ[name] = os.path.join(workdir, name.lower())
+    os.environ.setdefault('TF_CPP_MIN_LOG_LEVEL', '3')
+
+
+def _vader_available():
+    try:
+        import nltk
+        nltk.data.find('sentiment/vader_lexicon.zip')
+        return True
+    except (ImportError, LookupError):
+        return False
+
+
+class _StubAnalyzer:
+    """Word-count polarity used when the VADER lexicon is not installed"""
+
+    POSITIVE = {'surge', 'record', 'beat', 'growth', 'steady', 'raises', 'buyback'}
+    NEGATIVE = {'investigation', 'slides', 'weak', 'concerns', 'resigns', 'dispute'}
+
+    def polarity_scores(self, text):
+        words = text.lower().split()
+        score = sum(w in self.POSITIVE for w in words) - sum(w in self.NEGATIVE for w in words)
+        return {'compound': max(min(score / 4, 1.0), -1.0)}
+
+
+# ============================================================================
+# TIMING
+# ============================================================================
+
+def _time_calls(fn, repeat, setup=None):
+    """Seconds taken by `repeat` calls of fn, each after setup(), following one warm-up call"""
+    if setup:
+        setup()
+    fn()
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _summary(timings):
+    ordered = sorted(timings)
+    return {
+        'runs': len(ordered),
+        'mean_ms': round(statistics.fmean(ordered) * 1000, 3),
+        'p50_ms': round(ordered[len(ordered) // 2] * 1000, 3),
+        'min_ms': round(ordered[0] * 1000, 3)
+    }
+
+
+def _prediction_response(symbol, path_length):
+    """A get_predictions-shaped response full of numpy scalars and arrays"""
+    path = np.linspace(100, 110, path_length)
+    return {
+        'symbol': symbol,
+        'currentPrice': np.float64(100.0),
+        'predictedPrice': np.float32(110.0),
+        'confidence': np.int64(80),
+        'horizon': np.int64(path_length),
+        'factors': ['LSTM price prediction model'],
+        'predictionPath': [{'date': f"2025-01-{i % 28 + 1:02d}", 'price': price} for i, price in enumerate(path)],
+        'lstm_path': path,
+        'sentiment_score': np.float64(0.12)
+    }
+
+
+def run(repeat=5, quick=False, epochs=2):
+    import utils
+    import models
+    from downsample import downsample_ohlcv
+    from cache import clear_caches
+    from sentiment import get_sentiment_service
+
+    sizes = QUICK_SERIES_SIZES if quick else SERIES_SIZES
+    counts = QUICK_SYMBOL_COUNTS if quick else SYMBOL_COUNTS
+    results = {}
+
+    def record(name, params, timings):
+        results.setdefault(name, []).append(dict(params, **_summary(timings)))
+
+    # Per-series data paths
+    for size in sizes:
+        df = make_ohlcv(size)
+        params = {'bars': size}
+        record('calculate_technical_indicators', params,
+               _time_calls(lambda: utils.calculate_technical_indicators(df.copy()), repeat))
+        record('calculate_rsi', params, _time_calls(lambda: utils.calculate_rsi(df['Close'].values), repeat))
+        record('format_historical_data', params, _time_calls(lambda: utils.format_historical_data(df), repeat))
+        record('format_historical_data_all_rows', params,
+               _time_calls(lambda: utils.format_historical_data(df, limit=None), repeat))
+        record('format_historical_data_all_columnar', params,
+               _time_calls(lambda: utils.format_historical_data(df, limit=None, columnar=True), repeat))
+        record('downsample_ohlcv', dict(params, max_points=500),
+               _time_calls(lambda: downsample_ohlcv(df, 500), repeat))
+
+    # Multi-symbol paths
+    for count in counts:
+        frames = {f"SYM{i}": make_ohlcv(1000, seed=i) for i in range(count)}
+        params = {'symbols': count, 'bars': 1000}
+        record('calculate_technical_indicators_loop', params, _time_calls(
+            lambda: [utils.calculate_technical_indicators(df.copy()) for df in frames.values()], repeat))
+        record('calculate_technical_indicators_many', params,
+               _time_calls(lambda: utils.calculate_technical_indicators_many(frames), repeat))
+
+        responses = [_prediction_response(symbol, 90) for symbol in frames]
+        record('convert_to_serializable', {'symbols': count, 'path_length': 90},
+               _time_calls(lambda: models.convert_to_serializable(responses), repeat))
+
+    # LSTM data preparation, training and prediction
+    lstm_sizes = sizes[:2]
+    for size in lstm_sizes:
+        closes = make_ohlcv(size)['Close']
+        params = {'bars': size, 'lookback': 20, 'horizon': 7}
+
+        predictor = models.LSTMPredictor('BENCH', lookback=20, epochs=epochs, horizon=7)
+        record('lstm_prepare_data', params, _time_calls(lambda: predictor.prepare_data(closes), repeat))
+
+        train_runs = max(repeat // 2, 1)
+        record('lstm_train', dict(params, epochs=epochs), _time_calls(
+            lambda: models.LSTMPredictor('BENCH', lookback=20, epochs=epochs, horizon=7).train(closes), train_runs))
+
+        predictor.train(closes)
+        record('lstm_predict', params, _time_calls(lambda: predictor.predict(closes, days_ahead=7), repeat))
+        record('lstm_forecast', params, _time_calls(lambda: predictor.forecast(closes), repeat))
+
+    # Sentiment scoring (news comes from the GoogleNews stub)
+    service = get_sentiment_service()
+    analyzer = 'vader' if _vader_available() else 'stub'
+    if analyzer == 'stub':
+        service._analyzer = _StubAnalyzer()
+    record('analyze_sentiment_cold', {'headlines': len(HEADLINES) * 4, 'analyzer': analyzer},
+           _time_calls(lambda: utils.analyze_sentiment('BENCH', days=7, max_results=20), repeat, setup=clear_caches))
+    record('analyze_sentiment_cached', {'headlines': len(HEADLINES) * 4, 'analyzer': analyzer},
+           _time_calls(lambda: utils.analyze_sentiment('BENCH', days=7, max_results=20), repeat))
+
+    return results
+
+
+# ============================================================================
+# REPORTING
+# ============================================================================
+
+def _git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _environment():
+    versions = {'python': platform.python_version(), 'numpy': np.__version__, 'pandas': pd.__version__}
+    for name in ('tensorflow', 'sklearn'):
+        module = sys.modules.get(name)
+        if module is not None:
+            versions[name] = getattr(module, '__version__', None)
+    return {'platform': platform.platform(), 'cpus': os.cpu_count(), 'versions': versions}
+
+
+def _rows(results):
+    for name, cases in results.items():
+        for case in cases:
+            params = {k: v for k, v in case.items() if k not in ('runs', 'mean_ms', 'p50_ms', 'min_ms')}
+            yield name, ' '.join(f"{k}={v}" for k, v in params.items()), case
+
+
+def compare(report, previous):
+    """Print p50 ratios (current / previous) for cases present in both reports"""
+    before = {(name, label): case['p50_ms'] for name, label, case in _rows(previous['results'])}
+    print(f"\nCompared with {previous.get('commit') or 'previous run'} (p50, >1.00 is slower):")
+    for name, label, case in _rows(report['results']):
+        old = before.get((name, label))
+        if old:
+            print(f"  {name:<38}{label:<34}{case['p50_ms'] / old:>8.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--epochs', type=int, default=2)
+    parser.add_argument('--quick', action='store_true', help='smaller sizes for a fast smoke run')
+    parser.add_argument('--output', help='JSON results path (default: benchmarks/results/hot_paths-<commit>.json)')
+    parser.add_argument('--compare', help='previous JSON results to compare against')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='bench-') as workdir:
+        install_offline_stubs(workdir)
+        results = run(repeat=args.repeat, quick=args.quick, epochs=args.epochs)
+
+    commit = _git_commit()
+    report = {
+        'benchmark': 'hot_paths',
+        'commit': commit,
+        'timestamp': datetime.now().isoformat(),
+        'settings': {'repeat': args.repeat, 'epochs': args.epochs, 'quick': args.quick},
+        'environment': _environment(),
+        'results': results
+    }
+
+    output = args.output or os.path.join(ROOT, 'benchmarks', 'results', f"hot_paths-{commit or 'local'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    print(f"{'path':<38}{'case':<34}{'mean ms':>10}{'p50 ms':>10}")
+    for name, label, case in _rows(results):
+        print(f"{name:<38}{label:<34}{case['mean_ms']:>10}{case['p50_ms']:>10}")
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            compare(report, json.load(f))
+
+
+if __name__ == '__main__':
+    main()
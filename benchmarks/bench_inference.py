@@ -0,0 +1,79 @@
+"""
+LSTM Inference Benchmark
+Compares per-call latency of Keras model.predict() with the compiled
+LSTMPredictor.infer() path, single-window and batched
+
+Usage: python benchmarks/bench_inference.py [--calls 200] [--batch 50]
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import LSTMPredictor
+
+
+def _time_calls(fn, calls):
+    """Latencies in milliseconds of `calls` invocations of fn, after one warm-up call"""
+    fn()
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def _summary(latencies):
+    ordered = sorted(latencies)
+    return {
+        'mean_ms': round(statistics.fmean(ordered), 3),
+        'p50_ms': round(ordered[len(ordered) // 2], 3),
+        'p95_ms': round(ordered[int(len(ordered) * 0.95) - 1], 3)
+    }
+
+
+def run(calls=200, batch=50, lookback=20, horizon=7):
+    predictor = LSTMPredictor('BENCH', lookback=lookback, horizon=horizon)
+    predictor.build_model((lookback, 1))
+    predictor.is_trained = True
+
+    rng = np.random.default_rng(0)
+    window = rng.random((1, lookback, 1), dtype=np.float32)
+    windows = rng.random((batch, lookback, 1), dtype=np.float32)
+
+    results = {
+        'keras_predict_single': _summary(_time_calls(lambda: predictor.model.predict(window, verbose=0), calls)),
+        'compiled_infer_single': _summary(_time_calls(lambda: predictor.infer(window), calls)),
+        'keras_predict_loop_batch': _summary(_time_calls(
+            lambda: [predictor.model.predict(windows[i:i + 1], verbose=0) for i in range(batch)], max(calls // 20, 3))),
+        'compiled_infer_batch': _summary(_time_calls(lambda: predictor.infer(windows), calls))
+    }
+
+    speedup = results['keras_predict_single']['p50_ms'] / max(results['compiled_infer_single']['p50_ms'], 1e-9)
+    return {'calls': calls, 'batch': batch, 'lookback': lookback, 'horizon': horizon,
+            'results': results, 'single_call_speedup': round(speedup, 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--calls', type=int, default=200)
+    parser.add_argument('--batch', type=int, default=50)
+    args = parser.parse_args()
+
+    report = run(calls=args.calls, batch=args.batch)
+
+    print(f"{'path':<28}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}")
+    for name, stats in report['results'].items():
+        print(f"{name:<28}{stats['mean_ms']:>10}{stats['p50_ms']:>10}{stats['p95_ms']:>10}")
+    print(f"\nSingle-window speedup (p50): {report['single_call_speedup']}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,203 @@
+"""
+In-Memory Caching Layer
+Thread-safe, size-bounded LRU caches with per-namespace TTLs and
+hit/miss/eviction counters
+"""
+
+import os
+import time
+import inspect
+import threading
+import functools
+from collections import OrderedDict
+
+# Default TTL (seconds, None = no expiry) and entry limit per namespace.
+# Override with CACHE_TTL_<NAMESPACE> / CACHE_MAX_ENTRIES_<NAMESPACE>.
+CACHE_NAMESPACES = {
+    'default': {'ttl': 300, 'max_entries': 1024},
+    'stock_data': {'ttl': 300, 'max_entries': 512},
+    'indicators': {'ttl': 300, 'max_entries': 512},
+    'sentiment': {'ttl': 1800, 'max_entries': 1024},
+    'news': {'ttl': 1800, 'max_entries': 1024},
+    'headline_scores': {'ttl': None, 'max_entries': 20000},
+    'predictions': {'ttl': 900, 'max_entries': 512},
+    'symbol_misses': {'ttl': 3600, 'max_entries': 10000},
+}
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    LRU cache whose entries also expire after a TTL
+
+    Cached values are shared between callers and must not be mutated.
+    """
+
+    def __init__(self, name, ttl_seconds=300, max_entries=1024):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(max_entries, 1)
+        self._lock = threading.Lock()
+        self._data = OrderedDict()  # key -> (stored_at, expires_at, value)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key, default=None, max_age=None):
+        """
+        Get a value, or default if it is missing or expired
+
+        Args:
+            max_age: Also treat entries older than this many seconds as missing
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                self.misses += 1
+                return default
+
+            stored_at, expires_at, value = entry
+            expired = expires_at is not None and now >= expires_at
+            if expired:
+                del self._data[key]
+                self.expirations += 1
+
+            if expired or (max_age is not None and now - stored_at >= max_age):
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, ttl=_MISSING):
+        """Store a value, evicting the least recently used entries beyond max_entries"""
+        ttl = self.ttl_seconds if ttl is _MISSING else ttl
+        now = time.monotonic()
+        expires_at = now + ttl if ttl is not None else None
+
+        with self._lock:
+            self._data[key] = (now, expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self):
+        """Counters for monitoring"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._data),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl_seconds,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def _namespace_config(namespace):
+    config = dict(CACHE_NAMESPACES.get(namespace, CACHE_NAMESPACES['default']))
+    env_name = namespace.upper()
+
+    ttl = os.getenv(f'CACHE_TTL_{env_name}')
+    if ttl is not None:
+        config['ttl'] = float(ttl) if float(ttl) > 0 else None
+
+    max_entries = os.getenv(f'CACHE_MAX_ENTRIES_{env_name}')
+    if max_entries is not None:
+        config['max_entries'] = int(max_entries)
+
+    return config
+
+
+def get_cache(namespace='default'):
+    """Get (creating on first use) the cache for a namespace"""
+    cache = _caches.get(namespace)
+    if cache is None:
+        with _caches_lock:
+            cache = _caches.get(namespace)
+            if cache is None:
+                config = _namespace_config(namespace)
+                cache = TTLCache(namespace, config['ttl'], config['max_entries'])
+                _caches[namespace] = cache
+    return cache
+
+
+def cache_stats():
+    """Stats for every cache namespace in use"""
+    with _caches_lock:
+        caches = dict(_caches)
+    return {namespace: cache.stats() for namespace, cache in caches.items()}
+
+
+def clear_caches():
+    """Empty every cache namespace"""
+    with _caches_lock:
+        caches = list(_caches.values())
+    for cache in caches:
+        cache.clear()
+
+
+def make_call_key(signature, key, args, kwargs):
+    """Build a hashable key for a call from a key function or the bound arguments"""
+    if key is not None:
+        return key(*args, **kwargs)
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return tuple(bound.arguments.items())
+
+
+def cached(namespace, key=None, cache_if=None):
+    """
+    Cache a function's results in a namespace
+
+    Args:
+        namespace: Cache namespace name
+        key: Optional callable taking the function's arguments and returning the
+             cache key; by default all arguments (with defaults applied) are used
+        cache_if: Optional predicate on the result; by default None is not cached
+    """
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            cache = get_cache(namespace)
+            cache_key = (fn.__name__, make_call_key(signature, key, args, kwargs))
+
+            value = cache.get(cache_key, _MISSING)
+            if value is not _MISSING:
+                return value
+
+            value = fn(*args, **kwargs)
+            should_cache = cache_if(value) if cache_if is not None else value is not None
+            if should_cache:
+                cache.set(cache_key, value)
+            return value
+
+        wrapper.uncached = fn
+        return wrapper
+
+    return decorator
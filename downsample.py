@@ -0,0 +1,75 @@
+"""
+Chart Downsampling
+Largest-Triangle-Three-Buckets (LTTB) selection of the bars that best keep
+the visual shape of a long price series
+"""
+
+import numpy as np
+
+
+def lttb_indices(y, max_points, x=None):
+    """
+    Pick at most max_points indices of a series with LTTB
+
+    The first and last points are always kept; every bucket in between
+    contributes the point forming the largest triangle with the point kept
+    from the previous bucket and the average of the next bucket.
+
+    Args:
+        y: 1-D array of values (e.g. closes), without NaNs
+        max_points: Number of points to keep (at least 3)
+        x: Optional 1-D array of x positions; bar ordinals by default
+
+    Returns:
+        Sorted integer array of selected indices
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    max_points = max(int(max_points), 3)
+    if n <= max_points:
+        return np.arange(n)
+
+    x = np.arange(n, dtype=float) if x is None else np.asarray(x, dtype=float)
+
+    # Bucket b (of max_points - 2) covers [edges[b], edges[b + 1]); points 0 and n - 1 stand alone
+    edges = (np.arange(max_points - 1) * ((n - 2) / (max_points - 2))).astype(np.int64) + 1
+    edges[-1] = n - 1
+
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    a = 0
+    for b in range(max_points - 2):
+        start, end = edges[b], edges[b + 1]
+        if b + 2 < len(edges):
+            avg_x = x[end:edges[b + 2]].mean()
+            avg_y = y[end:edges[b + 2]].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+
+        # Twice the triangle area; the constant factor does not change the argmax
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        selected[b + 1] = a
+
+    return selected
+
+
+def downsample_ohlcv(df, max_points, column='Close'):
+    """
+    Reduce an OHLCV frame to at most max_points bars chosen by LTTB on one column
+
+    Selected bars are returned unchanged, so every row is a real bar.
+
+    Returns:
+        DataFrame (the input itself if it is already small enough)
+    """
+    if max_points is None or len(df) <= max_points:
+        return df
+
+    df = df[np.isfinite(df[column].to_numpy(dtype=float))]
+    if len(df) <= max_points:
+        return df
+
+    return df.iloc[lttb_indices(df[column].to_numpy(dtype=float), max_points)]
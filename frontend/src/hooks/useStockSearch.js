@@ -114,8 +114,8 @@ export function useStockSearch() {
       const searchData = await searchSymbol(symbol, market);
       
       if (searchData && searchData.found) {
-        // Then train and predict
-        const predictionData = await trainAndPredict(symbol, market, period);
+        // Then train and predict on the resolved listing (e.g. RELIANCE -> RELIANCE.NS)
+        const predictionData = await trainAndPredict(searchData.symbol, searchData.market, period);
         return { search: searchData, prediction: predictionData };
       }
       
@@ -0,0 +1,455 @@
+"""
+Vectorized Technical Indicator Engine
+Computes indicators for many symbols at once on 2-D arrays (symbols x time)
+
+Results match utils.calculate_technical_indicators / utils.calculate_rsi
+for each row: EMA, MACD and signal line bit for bit (same pandas kernel),
+RSI, rolling means and standard deviations to floating-point round-off.
+Rows must be aligned series of equal length (e.g. closes of symbols that
+trade on the same calendar); NaNs propagate as in the pandas implementation.
+"""
+
+import copy
+from collections import deque
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def _as_2d(values):
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        values = values[np.newaxis, :]
+    if values.ndim != 2:
+        raise ValueError(f"Expected a 1-D or 2-D array, got {values.ndim} dimensions")
+    return values
+
+
+def sma(values, window):
+    """Simple moving average along the time axis (pandas rolling(window).mean())"""
+    values = _as_2d(values)
+    out = np.full(values.shape, np.nan)
+    if values.shape[1] >= window:
+        out[:, window - 1:] = sliding_window_view(values, window, axis=1).mean(axis=-1)
+    return out
+
+
+def rolling_std(values, window):
+    """Sample standard deviation over a rolling window (pandas rolling(window).std())"""
+    values = _as_2d(values)
+    out = np.full(values.shape, np.nan)
+    if values.shape[1] >= window:
+        out[:, window - 1:] = sliding_window_view(values, window, axis=1).std(axis=-1, ddof=1)
+    return out
+
+
+def ema(values, span):
+    """
+    Exponential moving average along the time axis (pandas ewm(span=span).mean())
+
+    Runs pandas' own EWM kernel on the transposed block, one column per row.
+    """
+    values = _as_2d(values)
+    if values.shape[1] == 0:
+        return np.full(values.shape, np.nan)
+    return pd.DataFrame(values.T).ewm(span=span).mean().to_numpy().T
+
+
+def rsi(values, period=14):
+    """
+    Relative Strength Index along the time axis (utils.calculate_rsi for each row)
+
+    Uses the same seeding as calculate_rsi; Wilder's smoothing
+    up[t] = (up[t - 1] * (period - 1) + gain[t]) / period is an EWM with
+    alpha = 1 / period, so it runs on pandas' EWM kernel started from the seed.
+    """
+    values = _as_2d(values)
+    n_rows, n_cols = values.shape
+    out = np.zeros(values.shape)
+    if n_cols == 0:
+        return out
+
+    deltas = np.diff(values, axis=1)
+    seed = deltas[:, :period + 1]
+    up = np.where(seed >= 0, seed, 0.).sum(axis=1) / period
+    down = -np.where(seed < 0, seed, 0.).sum(axis=1) / period
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rs = np.where(down != 0, up / down, 0.)
+        out[:, :period] = (100. - 100. / (1. + rs))[:, np.newaxis]
+
+        if n_cols > period:
+            delta = deltas[:, period - 1:]
+            gains = np.where(delta > 0, delta, 0.)
+            losses = np.where(delta > 0, 0., -delta)
+
+            up = _wilder_smooth(up, gains, period)
+            down = _wilder_smooth(down, losses, period)
+
+            rs = np.where(down != 0, up / down, 0.)
+            out[:, period:] = 100. - 100. / (1. + rs)
+
+    return out
+
+
+def _wilder_smooth(seed, values, period):
+    """
+    y[t] = (y[t - 1] * (period - 1) + values[t]) / period for each row, from y[-1] = seed
+
+    pandas skips NaN inputs; the scalar recurrence carries them forward, so
+    everything after a row's first NaN is NaN here as well.
+    """
+    block = np.column_stack([seed, values])
+    smoothed = pd.DataFrame(block.T).ewm(alpha=1. / period, adjust=False).mean().to_numpy().T[:, 1:].copy()
+    smoothed[np.cumsum(np.isnan(values), axis=1) > 0] = np.nan
+    return smoothed
+
+
+def compute_indicators(closes):
+    """
+    Compute every indicator calculate_technical_indicators adds, for all rows at once
+
+    Args:
+        closes: Closing prices, shape (symbols, time) or (time,)
+
+    Returns:
+        Dictionary mapping column name ('SMA_20', 'RSI', ...) to a 2-D array
+    """
+    closes = _as_2d(closes)
+
+    ema_12 = ema(closes, 12)
+    ema_26 = ema(closes, 26)
+    macd = ema_12 - ema_26
+
+    bb_middle = sma(closes, 20)
+    std = rolling_std(closes, 20)
+
+    return {
+        'SMA_20': bb_middle,
+        'SMA_50': sma(closes, 50),
+        'EMA_12': ema_12,
+        'EMA_26': ema_26,
+        'MACD': macd,
+        'Signal_Line': ema(macd, 9),
+        'RSI': rsi(closes),
+        'BB_Middle': bb_middle,
+        'BB_Upper': bb_middle + (std * 2),
+        'BB_Lower': bb_middle - (std * 2)
+    }
+
+
+# ============================================================================
+# STREAMING INDICATORS
+# ============================================================================
+#
+# Each class keeps just enough state to fold in one new bar in O(1) time and
+# reports the same latest value the batch functions give for the full series.
+# to_dict()/from_dict() round-trip the state through plain JSON types.
+
+class StreamingSMA:
+    """Simple moving average over the last `window` values"""
+
+    def __init__(self, window):
+        self.window = window
+        self.values = deque(maxlen=window)
+        self.total = 0.
+
+    def update(self, value):
+        if len(self.values) == self.window:
+            self.total -= self.values[0]
+        self.values.append(value)
+        self.total += value
+        return self.value
+
+    @property
+    def value(self):
+        if len(self.values) < self.window:
+            return np.nan
+        return self.total / self.window
+
+    def to_dict(self):
+        return {'window': self.window, 'values': list(self.values), 'total': self.total}
+
+    @classmethod
+    def from_dict(cls, state):
+        indicator = cls(state['window'])
+        indicator.values.extend(state['values'])
+        indicator.total = state['total']
+        return indicator
+
+
+class StreamingBollinger:
+    """Bollinger Bands over the last `window` values (Welford add/remove updates)"""
+
+    def __init__(self, window=20, num_std=2):
+        self.window = window
+        self.num_std = num_std
+        self.values = deque(maxlen=window)
+        self.mean = 0.
+        self.m2 = 0.
+
+    def update(self, value):
+        if len(self.values) == self.window:
+            old = self.values[0]
+            n = len(self.values) - 1
+            delta = old - self.mean
+            self.mean -= delta / n
+            self.m2 -= delta * (old - self.mean)
+
+        self.values.append(value)
+        n = len(self.values)
+        delta = value - self.mean
+        self.mean += delta / n
+        self.m2 += delta * (value - self.mean)
+        return self.value
+
+    @property
+    def value(self):
+        """(middle, upper, lower), NaN until the window is full"""
+        if len(self.values) < self.window:
+            return np.nan, np.nan, np.nan
+        std = np.sqrt(max(self.m2, 0.) / (self.window - 1))
+        return self.mean, self.mean + std * self.num_std, self.mean - std * self.num_std
+
+    def to_dict(self):
+        return {
+            'window': self.window,
+            'num_std': self.num_std,
+            'values': list(self.values),
+            'mean': self.mean,
+            'm2': self.m2
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        indicator = cls(state['window'], state['num_std'])
+        indicator.values.extend(state['values'])
+        indicator.mean = state['mean']
+        indicator.m2 = state['m2']
+        return indicator
+
+
+class StreamingEMA:
+    """Exponential moving average with pandas' adjusted ewm(span=span) weighting"""
+
+    def __init__(self, span):
+        self.span = span
+        self.old_wt_factor = 1. - 1. / (1. + (span - 1) / 2.0)
+        self.weighted = np.nan
+        self.old_wt = 1.
+
+    def update(self, value):
+        if self.weighted != self.weighted:
+            self.weighted = value
+        else:
+            self.old_wt *= self.old_wt_factor
+            if value == value:
+                if self.weighted != value:
+                    self.weighted = ((self.old_wt * self.weighted) + value) / (self.old_wt + 1.)
+                self.old_wt += 1.
+        return self.weighted
+
+    @property
+    def value(self):
+        return self.weighted
+
+    def to_dict(self):
+        return {'span': self.span, 'weighted': _json_float(self.weighted), 'old_wt': self.old_wt}
+
+    @classmethod
+    def from_dict(cls, state):
+        indicator = cls(state['span'])
+        indicator.weighted = _from_json_float(state['weighted'])
+        indicator.old_wt = state['old_wt']
+        return indicator
+
+
+class StreamingMACD:
+    """MACD line and signal line built from three streaming EMAs"""
+
+    def __init__(self, fast=12, slow=26, signal=9):
+        self.fast = StreamingEMA(fast)
+        self.slow = StreamingEMA(slow)
+        self.signal = StreamingEMA(signal)
+
+    def update(self, value):
+        macd = self.fast.update(value) - self.slow.update(value)
+        self.signal.update(macd)
+        return self.value
+
+    @property
+    def value(self):
+        """(macd, signal_line)"""
+        return self.fast.value - self.slow.value, self.signal.value
+
+    def to_dict(self):
+        return {'fast': self.fast.to_dict(), 'slow': self.slow.to_dict(), 'signal': self.signal.to_dict()}
+
+    @classmethod
+    def from_dict(cls, state):
+        indicator = cls.__new__(cls)
+        indicator.fast = StreamingEMA.from_dict(state['fast'])
+        indicator.slow = StreamingEMA.from_dict(state['slow'])
+        indicator.signal = StreamingEMA.from_dict(state['signal'])
+        return indicator
+
+
+class StreamingRSI:
+    """
+    Wilder RSI matching calculate_rsi for the latest bar
+
+    calculate_rsi seeds its averages from the first period + 1 price changes,
+    so the first period + 2 prices are buffered before a value is reported.
+    """
+
+    def __init__(self, period=14):
+        self.period = period
+        self.warmup = []
+        self.last_price = None
+        self.up = None
+        self.down = None
+
+    def update(self, value):
+        if self.up is None:
+            self.warmup.append(value)
+            if len(self.warmup) == self.period + 2:
+                self._seed()
+            return self.value
+
+        self._step(value - self.last_price)
+        self.last_price = value
+        return self.value
+
+    def _seed(self):
+        deltas = np.diff(self.warmup)
+        seed = deltas[:self.period + 1]
+        self.up = seed[seed >= 0].sum() / self.period
+        self.down = -seed[seed < 0].sum() / self.period
+
+        # Replay the smoothing calculate_rsi applies from index `period` onwards
+        for delta in deltas[self.period - 1:]:
+            self._step(delta)
+
+        self.last_price = self.warmup[-1]
+        self.warmup = []
+
+    def _step(self, delta):
+        if delta > 0:
+            upval = delta
+            downval = 0.
+        else:
+            upval = 0.
+            downval = -delta
+        self.up = (self.up * (self.period - 1) + upval) / self.period
+        self.down = (self.down * (self.period - 1) + downval) / self.period
+
+    @property
+    def value(self):
+        if self.up is None:
+            return np.nan
+        rs = self.up / self.down if self.down != 0 else 0
+        return 100. - 100. / (1. + rs)
+
+    def to_dict(self):
+        return {
+            'period': self.period,
+            'warmup': list(self.warmup),
+            'last_price': self.last_price,
+            'up': self.up,
+            'down': self.down
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        indicator = cls(state['period'])
+        indicator.warmup = list(state['warmup'])
+        indicator.last_price = state['last_price']
+        indicator.up = state['up']
+        indicator.down = state['down']
+        return indicator
+
+
+class IndicatorState:
+    """
+    Live indicators for one symbol, updated one closing price at a time
+
+    Tracks the same indicators as calculate_technical_indicators.
+    """
+
+    def __init__(self):
+        self.sma_20 = StreamingSMA(20)
+        self.sma_50 = StreamingSMA(50)
+        self.macd = StreamingMACD()
+        self.rsi = StreamingRSI()
+        self.bollinger = StreamingBollinger()
+        self.last_timestamp = None
+        self.count = 0
+
+    def update(self, close, timestamp=None):
+        """Fold in the closing price of a new bar"""
+        close = float(close)
+        self.sma_20.update(close)
+        self.sma_50.update(close)
+        self.macd.update(close)
+        self.rsi.update(close)
+        self.bollinger.update(close)
+        self.last_timestamp = timestamp
+        self.count += 1
+        return self.values()
+
+    def preview(self, close):
+        """Indicator values as if `close` were appended, without changing the state"""
+        return copy.deepcopy(self).update(close, self.last_timestamp)
+
+    def values(self):
+        """Latest indicator values (None where not enough bars have been seen)"""
+        macd, signal_line = self.macd.value
+        bb_middle, bb_upper, bb_lower = self.bollinger.value
+        values = {
+            'sma_20': self.sma_20.value,
+            'sma_50': self.sma_50.value,
+            'ema_12': self.macd.fast.value,
+            'ema_26': self.macd.slow.value,
+            'rsi': self.rsi.value,
+            'macd': macd,
+            'signal_line': signal_line,
+            'bb_upper': bb_upper,
+            'bb_middle': bb_middle,
+            'bb_lower': bb_lower
+        }
+        return {name: _json_float(value) for name, value in values.items()}
+
+    def to_dict(self):
+        return {
+            'sma_20': self.sma_20.to_dict(),
+            'sma_50': self.sma_50.to_dict(),
+            'macd': self.macd.to_dict(),
+            'rsi': self.rsi.to_dict(),
+            'bollinger': self.bollinger.to_dict(),
+            'last_timestamp': self.last_timestamp,
+            'count': self.count
+        }
+
+    @classmethod
+    def from_dict(cls, state):
+        indicator = cls.__new__(cls)
+        indicator.sma_20 = StreamingSMA.from_dict(state['sma_20'])
+        indicator.sma_50 = StreamingSMA.from_dict(state['sma_50'])
+        indicator.macd = StreamingMACD.from_dict(state['macd'])
+        indicator.rsi = StreamingRSI.from_dict(state['rsi'])
+        indicator.bollinger = StreamingBollinger.from_dict(state['bollinger'])
+        indicator.last_timestamp = state['last_timestamp']
+        indicator.count = state['count']
+        return indicator
+
+
+def _json_float(value):
+    """NaN is not valid JSON; report it as None"""
+    if value is None or value != value:
+        return None
+    return float(value)
+
+
+def _from_json_float(value):
+    return np.nan if value is None else value
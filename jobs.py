@@ -0,0 +1,332 @@
+"""
+Background Prediction Jobs
+Runs heavy prediction work in a bounded process pool so HTTP workers stay free
+"""
+
+import os
+import uuid
+import atexit
+import threading
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+
+from warmup import init_worker
+
+PREDICTION_WORKERS = int(os.getenv('PREDICTION_WORKERS', str(os.cpu_count() or 2)))
+MAX_PENDING_JOBS = int(os.getenv('MAX_PENDING_JOBS', '100'))
+JOB_RETENTION_SECONDS = int(os.getenv('JOB_RETENTION_SECONDS', '3600'))
+MAX_JOB_WAIT_SECONDS = float(os.getenv('MAX_JOB_WAIT_SECONDS', '30'))
+FAN_OUT_TIMEOUT_SECONDS = float(os.getenv('FAN_OUT_TIMEOUT_SECONDS', '120'))
+
+
+class QueueFullError(Exception):
+    """Raised when too many jobs are waiting for a worker"""
+
+
+class JobManager:
+    """
+    Tracks jobs submitted to a fixed-size process pool
+
+    The pool uses the 'spawn' start method because TensorFlow is not fork-safe
+    once it has been imported by the parent process. Each worker warms itself
+    up as it starts (see warmup.init_worker).
+    """
+
+    def __init__(self, max_workers=PREDICTION_WORKERS, max_pending=MAX_PENDING_JOBS,
+                 retention_seconds=JOB_RETENTION_SECONDS):
+        self.max_workers = max(max_workers, 1)
+        self.max_pending = max_pending
+        self.retention_seconds = retention_seconds
+        self._lock = threading.Lock()
+        self._unique_lock = threading.Lock()
+        self._executor = None
+        self._jobs = {}  # job_id -> job record
+        self._untracked = set()  # unfinished futures from submit_future()
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=init_worker
+                )
+            return self._executor
+
+    def _reset_executor(self):
+        """Replace a pool whose worker process died"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit_future(self, fn, *args, **kwargs):
+        try:
+            return self._get_executor().submit(fn, *args, **kwargs)
+        except BrokenProcessPool:
+            self._reset_executor()
+            return self._get_executor().submit(fn, *args, **kwargs)
+
+    def submit_future(self, fn, *args, **kwargs):
+        """
+        Run fn(*args, **kwargs) in the worker pool without tracking it as a job
+
+        Returns:
+            concurrent.futures.Future (e.g. for asyncio.wrap_future)
+
+        Raises:
+            QueueFullError: If max_pending jobs are already waiting
+        """
+        self._prune()
+        if self.stats()['queued'] >= self.max_pending:
+            raise QueueFullError(f"Job queue is full ({self.max_pending} pending)")
+
+        future = self._submit_future(fn, *args, **kwargs)
+        with self._lock:
+            self._untracked.add(future)
+
+        def _forget(_future):
+            with self._lock:
+                self._untracked.discard(_future)
+
+        future.add_done_callback(_forget)
+        return future
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        Submit fn(*args, **kwargs) to the worker pool
+
+        fn must be a module-level function so it can be pickled.
+
+        Returns:
+            Job id string
+
+        Raises:
+            QueueFullError: If max_pending jobs are already waiting
+        """
+        self._prune()
+        if self.stats()['queued'] >= self.max_pending:
+            raise QueueFullError(f"Job queue is full ({self.max_pending} pending)")
+
+        future = self._submit_future(fn, *args, **kwargs)
+
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._jobs[job_id] = {
+                'future': future,
+                'name': getattr(fn, '__name__', 'job'),
+                'created_at': datetime.now(),
+                'finished_at': None
+            }
+
+        def _mark_finished(_future, job_id=job_id):
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job is not None:
+                    job['finished_at'] = datetime.now()
+
+        future.add_done_callback(_mark_finished)
+        return job_id
+
+    def submit_unique(self, key, fn, *args, **kwargs):
+        """
+        Submit fn(*args, **kwargs) unless an unfinished job with the same key exists
+
+        Returns:
+            Id of the new job, or of the matching job already in flight
+        """
+        with self._unique_lock:
+            with self._lock:
+                for job_id, job in self._jobs.items():
+                    if job.get('key') == key and not job['future'].done():
+                        return job_id
+
+            job_id = self.submit(fn, *args, **kwargs)
+            with self._lock:
+                self._jobs[job_id]['key'] = key
+            return job_id
+
+    def get(self, job_id, wait=0):
+        """
+        Get a job's status, optionally waiting up to `wait` seconds for it to finish
+
+        Returns:
+            Job dictionary, or None if the job id is unknown or expired
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            return None
+
+        future = job['future']
+        wait = min(max(float(wait or 0), 0.0), MAX_JOB_WAIT_SECONDS)
+        if wait > 0 and not future.done():
+            try:
+                future.exception(timeout=wait)
+            except FutureTimeoutError:
+                pass
+
+        return self._describe(job_id, job)
+
+    def _describe(self, job_id, job):
+        future = job['future']
+        response = {
+            'job_id': job_id,
+            'name': job['name'],
+            'status': _future_status(future),
+            'created_at': job['created_at'].isoformat()
+        }
+
+        if future.done():
+            finished_at = job['finished_at'] or datetime.now()
+            response['finished_at'] = finished_at.isoformat()
+            response['duration_seconds'] = round((finished_at - job['created_at']).total_seconds(), 3)
+            if future.cancelled():
+                response['error'] = 'Job was cancelled'
+            elif future.exception() is not None:
+                response['error'] = str(future.exception())
+            else:
+                response['result'] = future.result()
+
+        return response
+
+    def run_many(self, fn, calls, timeout=FAN_OUT_TIMEOUT_SECONDS):
+        """
+        Run fn once per argument tuple in parallel and collect whatever finishes in time
+
+        Calls that miss the timeout are reported as errors; ones that have not
+        started yet are cancelled, ones already running finish in the background.
+
+        Args:
+            fn: Module-level function to run in the worker pool
+            calls: List of argument tuples
+            timeout: Seconds to wait for the whole batch
+
+        Returns:
+            List of (args, result, error) tuples in input order
+        """
+        futures = [(args, self._submit_future(fn, *args)) for args in calls]
+        done, _ = wait([future for _, future in futures], timeout=timeout)
+
+        results = []
+        for args, future in futures:
+            if future in done:
+                error = future.exception()
+                if error is not None:
+                    results.append((args, None, str(error)))
+                else:
+                    results.append((args, future.result(), None))
+            else:
+                future.cancel()
+                results.append((args, None, f'Timed out after {timeout:g}s'))
+
+        return results
+
+    def iter_many(self, fn, calls, timeout=FAN_OUT_TIMEOUT_SECONDS, heartbeat=None):
+        """
+        Run fn once per argument tuple in parallel and yield each outcome as it finishes
+
+        Timeouts are handled as in run_many(). If the consumer stops early, calls
+        that have not started yet are cancelled.
+
+        Args:
+            fn: Module-level function to run in the worker pool
+            calls: List of argument tuples
+            timeout: Seconds to wait for the whole batch
+            heartbeat: If set, also yield None after this many seconds without a result
+
+        Yields:
+            (args, result, error) tuples in completion order, or None on a heartbeat
+        """
+        futures = {self._submit_future(fn, *args): args for args in calls}
+        deadline = time.monotonic() + timeout
+        pending = set(futures)
+
+        try:
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+
+                done, pending = wait(pending, timeout=min(remaining, heartbeat or remaining),
+                                     return_when=FIRST_COMPLETED)
+                if not done:
+                    if heartbeat and time.monotonic() < deadline:
+                        yield None
+                    continue
+
+                for future in done:
+                    error = future.exception()
+                    if error is not None:
+                        yield futures[future], None, str(error)
+                    else:
+                        yield futures[future], future.result(), None
+
+            for future in pending:
+                future.cancel()
+                yield futures[future], None, f'Timed out after {timeout:g}s'
+            pending = set()
+
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def stats(self):
+        """Queue depth and job counts by status (untracked futures count while unfinished)"""
+        counts = {'queued': 0, 'running': 0, 'completed': 0, 'failed': 0}
+        with self._lock:
+            futures = [job['future'] for job in self._jobs.values()]
+            untracked = list(self._untracked)
+        for future in futures:
+            counts[_future_status(future)] += 1
+        for future in untracked:
+            if not future.done():
+                counts[_future_status(future)] += 1
+
+        counts['workers'] = self.max_workers
+        counts['max_pending'] = self.max_pending
+        counts['queue_depth'] = counts['queued'] + counts['running']
+        return counts
+
+    def _prune(self):
+        """Forget finished jobs older than retention_seconds"""
+        now = datetime.now()
+        with self._lock:
+            expired = [
+                job_id for job_id, job in self._jobs.items()
+                if job['finished_at'] and (now - job['finished_at']).total_seconds() > self.retention_seconds
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+
+    def shutdown(self):
+        """Stop the worker pool without waiting for running jobs"""
+        self._reset_executor()
+
+
+def _future_status(future):
+    if future.cancelled():
+        return 'failed'
+    if future.done():
+        return 'failed' if future.exception() is not None else 'completed'
+    if future.running():
+        return 'running'
+    return 'queued'
+
+
+_job_manager = None
+_job_manager_lock = threading.Lock()
+
+
+def get_job_manager():
+    """Get the process-wide job manager"""
+    global _job_manager
+    if _job_manager is None:
+        with _job_manager_lock:
+            if _job_manager is None:
+                _job_manager = JobManager()
+                atexit.register(_job_manager.shutdown)
+    return _job_manager
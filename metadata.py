@@ -0,0 +1,159 @@
+"""
+Symbol Metadata Cache
+Fetches Yahoo Finance Ticker.info once per symbol and serves name, sector,
+marketCap and PE ratio from memory, persisted to local disk with a long TTL
+"""
+
+import os
+import json
+import uuid
+import time
+import threading
+
+from singleflight import SingleFlight
+from metrics import span, count_upstream_error
+
+METADATA_DIR = os.getenv('METADATA_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'metadata'))
+METADATA_TTL_SECONDS = int(os.getenv('METADATA_TTL_SECONDS', str(7 * 24 * 3600)))
+# Failed lookups are retried much sooner than successful ones expire
+METADATA_FAILURE_TTL_SECONDS = int(os.getenv('METADATA_FAILURE_TTL_SECONDS', '300'))
+METADATA_FETCH_TIMEOUT_SECONDS = float(os.getenv('METADATA_FETCH_TIMEOUT_SECONDS', '30'))
+
+# Ticker.info has well over a hundred fields; keep only the ones the API uses
+INFO_FIELDS = [
+    'longName', 'shortName', 'name', 'sector', 'industry', 'category',
+    'marketCap', 'trailingPE', 'currency', 'quoteType', 'exchange'
+]
+
+
+class SymbolMetadataCache:
+    """
+    Two-level (memory, then disk) cache of per-symbol Ticker.info fields
+
+    Concurrent misses for the same symbol are collapsed: one caller fetches
+    from Yahoo while the others wait for its result.
+    """
+
+    def __init__(self, root=METADATA_DIR, ttl_seconds=METADATA_TTL_SECONDS,
+                 failure_ttl_seconds=METADATA_FAILURE_TTL_SECONDS):
+        self.root = root
+        self.ttl_seconds = ttl_seconds
+        self.failure_ttl_seconds = failure_ttl_seconds
+        self._lock = threading.Lock()
+        self._memory = {}  # symbol -> entry
+        self._flight = SingleFlight('metadata')
+
+    def get(self, symbol):
+        """
+        Get cached Ticker.info fields for a symbol
+
+        Returns:
+            Dictionary of INFO_FIELDS that Yahoo reported (empty if the lookup failed)
+        """
+        return self.lookup(symbol)[0]
+
+    def lookup(self, symbol):
+        """
+        Like get(), but also say whether the lookup failed
+
+        Returns:
+            Tuple (info, failed); failed is True when Yahoo could not be reached
+            or timed out, as opposed to answering without any of INFO_FIELDS
+        """
+        symbol = symbol.upper()
+
+        entry = self._get_fresh(symbol)
+        if entry is None:
+            try:
+                entry = self._flight.do(symbol, self._load, symbol, timeout=METADATA_FETCH_TIMEOUT_SECONDS)
+            except TimeoutError:
+                return {}, True
+        return entry['info'], entry.get('error', False)
+
+    def _load(self, symbol):
+        # Another caller may have finished a fetch between our check and taking the lead
+        entry = self._get_fresh(symbol)
+        if entry is None:
+            entry = self._fetch(symbol)
+            with self._lock:
+                self._memory[symbol] = entry
+            self._write_disk(symbol, entry)
+        return entry
+
+    def _is_fresh(self, entry):
+        ttl = self.ttl_seconds if entry.get('ok') else self.failure_ttl_seconds
+        return time.time() - entry.get('fetched_at', 0) < ttl
+
+    def _get_fresh(self, symbol):
+        entry = self._memory.get(symbol)
+        if entry is not None and self._is_fresh(entry):
+            return entry
+
+        entry = self._read_disk(symbol)
+        if entry is not None and self._is_fresh(entry):
+            with self._lock:
+                self._memory[symbol] = entry
+            return entry
+
+        return None
+
+    def _fetch(self, symbol):
+        """Fetch Ticker.info from Yahoo Finance"""
+        try:
+            import yfinance as yf
+            with span('metadata_fetch'):
+                info = yf.Ticker(symbol).info or {}
+            fields = {field: info[field] for field in INFO_FIELDS if info.get(field) is not None}
+            return {'info': fields, 'ok': bool(fields), 'fetched_at': time.time()}
+        except Exception as e:
+            count_upstream_error('yfinance_info')
+            print(f"Could not fetch metadata for {symbol}: {str(e)}")
+            return {'info': {}, 'ok': False, 'error': True, 'fetched_at': time.time()}
+
+    def _path(self, symbol):
+        safe_symbol = ''.join(c if c.isalnum() or c in '-_.' else '_' for c in symbol)
+        return os.path.join(self.root, f"{safe_symbol}.json")
+
+    def _read_disk(self, symbol):
+        try:
+            with open(self._path(symbol), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_disk(self, symbol, entry):
+        path = self._path(symbol)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Could not persist metadata for {symbol}: {str(e)}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def clear(self):
+        """Drop the in-memory entries (disk entries are kept)"""
+        with self._lock:
+            self._memory = {}
+
+
+_metadata_cache = None
+_metadata_cache_lock = threading.Lock()
+
+
+def get_metadata_cache():
+    """Get the process-wide symbol metadata cache"""
+    global _metadata_cache
+    if _metadata_cache is None:
+        with _metadata_cache_lock:
+            if _metadata_cache is None:
+                _metadata_cache = SymbolMetadataCache()
+    return _metadata_cache
+
+
+def get_symbol_info(symbol):
+    """Get cached Ticker.info fields (name, sector, marketCap, trailingPE, ...) for a symbol"""
+    return get_metadata_cache().get(symbol)
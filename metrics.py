@@ -0,0 +1,205 @@
+"""
+Latency and Error Metrics
+Lightweight in-process counters and histograms with Prometheus text output,
+plus timing spans for the stages of a prediction request
+
+Metrics are per process: work done in the prediction worker pool is recorded
+in the worker, not in the server that serves /metrics.
+"""
+
+import time
+import bisect
+import threading
+import functools
+from contextlib import contextmanager
+
+from cache import cache_stats
+
+# Upper bounds (seconds) of latency histogram buckets; +Inf is implicit
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def _format_labels(names, values):
+    if not names:
+        return ''
+    pairs = ','.join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return '{' + pairs + '}'
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Counter:
+    """Monotonic counter with optional labels"""
+
+    kind = 'counter'
+
+    def __init__(self, name, documentation, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+        self._values = {}  # label values -> count
+
+    def inc(self, *label_values, amount=1):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            values = dict(self._values)
+        for label_values, value in sorted(values.items()):
+            yield self.name, _format_labels(self.labels, label_values), value
+
+
+class Histogram:
+    """Cumulative-bucket histogram with optional labels"""
+
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labels=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._series = {}  # label values -> [bucket counts..., +Inf count, sum]
+
+    def observe(self, value, *label_values):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def samples(self):
+        with self._lock:
+            series_by_labels = {labels: list(series) for labels, series in self._series.items()}
+
+        for label_values, series in sorted(series_by_labels.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), series[:-1]):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                yield (f'{self.name}_bucket',
+                       _format_labels(self.labels + ('le',), label_values + (le,)), cumulative)
+            labels = _format_labels(self.labels, label_values)
+            yield f'{self.name}_sum', labels, round(series[-1], 6)
+            yield f'{self.name}_count', labels, cumulative
+
+
+class Collected:
+    """Gauge (or counter kept elsewhere) whose samples are read from a callback at scrape time"""
+
+    def __init__(self, name, documentation, labels, collect, kind='gauge'):
+        self.kind = kind
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._collect = collect  # callable returning {label values: value}
+
+    def samples(self):
+        try:
+            values = self._collect()
+        except Exception as e:
+            print(f"Error collecting metric {self.name}: {str(e)}")
+            return
+        for label_values, value in sorted(values.items()):
+            yield self.name, _format_labels(self.labels, label_values), value
+
+
+class MetricsRegistry:
+    """Named collection of metrics rendered together"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics = {}
+
+    def register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def render(self):
+        """All metrics in the Prometheus text exposition format (0.0.4)"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines = []
+        for metric in metrics:
+            lines.append(f'# HELP {metric.name} {metric.documentation}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            for name, labels, value in metric.samples():
+                lines.append(f'{name}{labels} {value}')
+        return '\n'.join(lines) + '\n'
+
+
+_registry = MetricsRegistry()
+
+STAGE_SECONDS = _registry.register(Histogram(
+    'finpridict_stage_duration_seconds', 'Time spent in each stage of request handling', ('stage',)))
+REQUEST_SECONDS = _registry.register(Histogram(
+    'finpridict_http_request_duration_seconds', 'HTTP request latency by endpoint', ('method', 'endpoint', 'status')))
+UPSTREAM_ERRORS = _registry.register(Counter(
+    'finpridict_upstream_errors_total', 'Failed calls to upstream data and news providers', ('upstream',)))
+
+
+def _cache_field(field):
+    return lambda: {(namespace,): stats[field] for namespace, stats in cache_stats().items()}
+
+
+_registry.register(Collected(
+    'finpridict_cache_hits_total', 'Cache hits by namespace', ('namespace',), _cache_field('hits'), kind='counter'))
+_registry.register(Collected(
+    'finpridict_cache_misses_total', 'Cache misses by namespace', ('namespace',), _cache_field('misses'), kind='counter'))
+_registry.register(Collected(
+    'finpridict_cache_hit_ratio', 'Cache hit ratio by namespace', ('namespace',), _cache_field('hit_ratio')))
+_registry.register(Collected(
+    'finpridict_cache_entries', 'Cached entries by namespace', ('namespace',), _cache_field('size')))
+
+
+def get_metrics_registry():
+    """Get the process-wide metrics registry"""
+    return _registry
+
+
+def render_metrics():
+    """Render every registered metric as Prometheus text"""
+    return _registry.render()
+
+
+@contextmanager
+def span(stage):
+    """Record the wall time of a block under finpridict_stage_duration_seconds{stage=...}"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_SECONDS.observe(time.perf_counter() - start, stage)
+
+
+def timed(stage):
+    """Decorator form of span()"""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(stage):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def observe_request(method, endpoint, status, seconds):
+    """Record one HTTP request's latency"""
+    REQUEST_SECONDS.observe(seconds, method, endpoint, str(status))
+
+
+def count_upstream_error(upstream):
+    """Count a failed call to an upstream provider (e.g. 'yfinance', 'google_news')"""
+    UPSTREAM_ERRORS.inc(upstream)
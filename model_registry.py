@@ -0,0 +1,235 @@
+"""
+Persistent Model Registry
+Stores trained model weights and fitted scalers on local disk so that
+predictions can load an existing model instead of retraining it per request
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Bump when the on-disk artifact layout changes; older artifacts are treated as stale
+ARTIFACT_FORMAT_VERSION = 1
+
+MODEL_DIR = os.getenv('MODEL_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'saved_models'))
+MODEL_MAX_AGE_HOURS = float(os.getenv('MODEL_MAX_AGE_HOURS', '24'))
+MODEL_KEEP_VERSIONS = int(os.getenv('MODEL_KEEP_VERSIONS', '3'))
+
+MANIFEST_FILE = 'manifest.json'
+TRAINING_LOCK_FILE = 'training.lock'
+
+
+def _lock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        return
+    f.seek(0)
+    while True:
+        try:
+            # LK_LOCK gives up after about 10 seconds; keep waiting like flock does
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            continue
+
+
+def _unlock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class ModelRegistry:
+    """
+    Versioned on-disk store of trained predictors
+
+    Layout:
+        <root>/<key>/manifest.json          - points at the latest version
+        <root>/<key>/versions/<version>/    - artifacts written by the predictor
+        <root>/<key>/training.lock          - held while a process trains the key
+    """
+
+    def __init__(self, root=MODEL_DIR, max_age_hours=MODEL_MAX_AGE_HOURS, keep_versions=MODEL_KEEP_VERSIONS):
+        self.root = root
+        self.max_age_hours = max_age_hours
+        self.keep_versions = max(keep_versions, 1)
+        self._lock = threading.RLock()
+        self._loaded = {}  # key -> (version, predictor)
+
+    @staticmethod
+    def make_key(symbol, lookback, hyperparams=None):
+        """Build a filesystem-safe key for (symbol, lookback, hyperparameters)"""
+        params = dict(hyperparams or {})
+        params['lookback'] = lookback
+        digest = hashlib.sha1(json.dumps(params, sort_keys=True).encode('utf-8')).hexdigest()[:12]
+        safe_symbol = ''.join(c if c.isalnum() or c in '-_.' else '_' for c in symbol.upper())
+        return f"{safe_symbol}_{digest}"
+
+    def _key_dir(self, key):
+        return os.path.join(self.root, key)
+
+    def _version_dir(self, key, version):
+        return os.path.join(self._key_dir(key), 'versions', version)
+
+    def get_metadata(self, key):
+        """Return the manifest of the latest saved version, or None"""
+        path = os.path.join(self._key_dir(key), MANIFEST_FILE)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def is_stale(self, metadata):
+        """Check whether a saved artifact must be retrained"""
+        if not metadata:
+            return True
+        if metadata.get('format_version') != ARTIFACT_FORMAT_VERSION:
+            return True
+        try:
+            trained_at = datetime.fromisoformat(metadata['trained_at'])
+        except (KeyError, TypeError, ValueError):
+            return True
+        age_hours = (datetime.now() - trained_at).total_seconds() / 3600
+        return age_hours > self.max_age_hours
+
+    def load(self, key, loader, allow_stale=False, shared=True):
+        """
+        Load the latest fresh predictor for a key
+
+        Args:
+            key: Registry key from make_key()
+            loader: Callable taking an artifact directory and returning a predictor
+            allow_stale: Also return artifacts past max_age_hours (e.g. to fine-tune them);
+                         artifacts from another format version are never returned
+            shared: Return the instance kept in memory for all callers; False loads
+                    a private copy from disk that the caller may modify
+
+        Returns:
+            Predictor instance, or None if no usable artifact exists
+        """
+        metadata = self.get_metadata(key)
+        if not metadata or metadata.get('format_version') != ARTIFACT_FORMAT_VERSION:
+            return None
+        if self.is_stale(metadata) and not allow_stale:
+            return None
+
+        version = metadata['version']
+        if shared:
+            with self._lock:
+                cached = self._loaded.get(key)
+                if cached and cached[0] == version:
+                    return cached[1]
+
+        try:
+            predictor = loader(self._version_dir(key, version))
+        except Exception as e:
+            print(f"Could not load model artifact {key}/{version}: {str(e)}")
+            return None
+
+        if predictor is None or not shared:
+            return predictor
+
+        with self._lock:
+            self._loaded[key] = (version, predictor)
+        return predictor
+
+    @contextmanager
+    def training_lock(self, key):
+        """
+        Hold an exclusive lock on a key across processes (blocks until it is free)
+
+        Worker processes each have their own memory, so in-process single-flight
+        cannot stop them training the same model at once; whoever gets this lock
+        trains and the rest load the saved result after it.
+        """
+        os.makedirs(self._key_dir(key), exist_ok=True)
+        with open(os.path.join(self._key_dir(key), TRAINING_LOCK_FILE), 'a+') as f:
+            _lock_file(f)
+            try:
+                yield
+            finally:
+                _unlock_file(f)
+
+    def save(self, key, predictor, extra=None):
+        """
+        Save a trained predictor as a new version and mark it latest
+
+        The predictor must implement save_artifacts(directory).
+
+        Returns:
+            Manifest dictionary of the saved version
+        """
+        now = datetime.now()
+        version = f"{now.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        version_dir = self._version_dir(key, version)
+        os.makedirs(version_dir, exist_ok=True)
+
+        predictor.save_artifacts(version_dir)
+
+        metadata = {
+            'key': key,
+            'version': version,
+            'format_version': ARTIFACT_FORMAT_VERSION,
+            'trained_at': now.isoformat(),
+            'path': version_dir
+        }
+        metadata.update(extra or {})
+
+        # Write the manifest atomically so concurrent readers never see a partial file
+        manifest_path = os.path.join(self._key_dir(key), MANIFEST_FILE)
+        tmp_path = f"{manifest_path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, indent=2)
+        os.replace(tmp_path, manifest_path)
+
+        with self._lock:
+            self._loaded[key] = (version, predictor)
+
+        self._prune_versions(key, keep=version)
+        return metadata
+
+    def _prune_versions(self, key, keep):
+        """Delete old versions beyond keep_versions (never the current one)"""
+        versions_dir = os.path.join(self._key_dir(key), 'versions')
+        try:
+            versions = sorted(os.listdir(versions_dir))
+        except OSError:
+            return
+
+        for version in versions[:-self.keep_versions]:
+            if version == keep:
+                continue
+            shutil.rmtree(os.path.join(versions_dir, version), ignore_errors=True)
+
+    def clear_memory(self):
+        """Drop all in-memory loaded predictors"""
+        with self._lock:
+            self._loaded = {}
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_model_registry():
+    """Get the process-wide model registry"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ModelRegistry()
+    return _registry
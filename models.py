@@ -3,18 +3,56 @@ Machine Learning Models for Stock Price Predictions
 Includes LSTM, Random Forest, and SVM implementations
 """
 
+import os
+import copy
+import json
+import time
+import pickle
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.svm import SVR
-from sklearn.preprocessing import MinMaxScaler
+from numpy.lib.stride_tricks import sliding_window_view
 import warnings
 
 warnings.filterwarnings('ignore')
 
 # Import utilities
-from utils import fetch_stock_data, calculate_indicators, analyze_sentiment
+from utils import fetch_stock_data, fetch_close_history, calculate_indicators, analyze_sentiment
+from model_registry import get_model_registry
+from metadata import get_symbol_info
+from symbols import get_symbol_index
+from cache import cached
+from singleflight import coalesce, get_group
+from training import get_training_scheduler
+from metrics import span, timed
+
+# ============================================================================
+# MARKET UNIVERSE
+# ============================================================================
+
+MARKET_SYMBOLS = {
+    'us': ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA'],
+    'indian': ['RELIANCE.NS', 'TCS.NS', 'HDFCBANK.NS', 'INFY.NS', 'ITC.NS'],
+    'crypto': ['BTC-USD', 'ETH-USD', 'BNB-USD', 'SOL-USD', 'ADA-USD']
+}
+
+# Days of history fetched for each prediction
+PREDICTION_HISTORY_DAYS = 90
+
+# Days of closing prices the LSTM is trained on (long enough for the 90d horizon)
+LSTM_TRAINING_DAYS = int(os.getenv('LSTM_TRAINING_DAYS', '730'))
+
+# Stale models are fine-tuned on new bars for this many epochs instead of retrained,
+# with a full retrain after LSTM_MAX_FINE_TUNES consecutive fine-tunes
+LSTM_FINE_TUNE_EPOCHS = int(os.getenv('LSTM_FINE_TUNE_EPOCHS', '3'))
+LSTM_MAX_FINE_TUNES = int(os.getenv('LSTM_MAX_FINE_TUNES', '30'))
+
+# Bars forecast for each prediction period
+PERIOD_HORIZONS = {'1d': 1, '7d': 7, '30d': 30, '90d': 90}
+
+# 'symbol' trains one LSTM per symbol, 'market' shares one LSTM per market
+PREDICTION_MODELS = ['symbol', 'market']
+DEFAULT_PREDICTION_MODEL = os.getenv('PREDICTION_MODEL', 'symbol')
 
 # ============================================================================
 # PREDICTION DATA (Temporary - will be replaced with real ML models)
@@ -184,7 +222,17 @@ PREDICTION_DATABASE = {
 # PREDICTION FUNCTION (Real ML Implementation)
 # ============================================================================
 
-def get_predictions(symbol, market='us', period='7d'):
+def _prediction_key(symbol, market='us', period='7d', stock_data=None, model=None,
+                    price_history=None, sentiment_data=None):
+    # stock_data, price_history and sentiment_data are only prefetched inputs; they do not change what is predicted
+    return (symbol, market, period, model or DEFAULT_PREDICTION_MODEL)
+
+
+@cached('predictions', key=_prediction_key)
+@coalesce('predictions', key=_prediction_key)
+@timed('predict')
+def get_predictions(symbol, market='us', period='7d', stock_data=None, model=None,
+                    price_history=None, sentiment_data=None):
     """
     Get AI-powered predictions for a given stock using LSTM + sentiment analysis
 
@@ -192,39 +240,64 @@ def get_predictions(symbol, market='us', period='7d'):
         symbol: Stock symbol (e.g., 'AAPL', 'RELIANCE.NS', 'BTC-USD')
         market: Market type ('us', 'indian', 'crypto')
         period: Prediction period ('1d', '7d', '30d', '90d')
+        stock_data: Already fetched 90-day stock data (e.g. from fetch_stock_data_many)
+        model: 'symbol' (per-symbol LSTM) or 'market' (shared market LSTM);
+               defaults to DEFAULT_PREDICTION_MODEL
+        price_history: Already fetched close history (fetch_close_history)
+        sentiment_data: Already computed sentiment (analyze_sentiment)
 
     Returns:
         Dictionary with prediction data or None if not found
     """
     try:
         # Fetch real stock data
-        stock_data = fetch_stock_data(symbol, days=90)  # Need sufficient historical data
+        if stock_data is None:
+            with span('predict.fetch'):
+                stock_data = fetch_stock_data(symbol, days=PREDICTION_HISTORY_DAYS)  # Need sufficient historical data
 
         if not stock_data:
             print(f"Could not fetch data for {symbol}")
             return None
 
         current_price = stock_data['currentPrice']
+        horizon = PERIOD_HORIZONS.get(period, PERIOD_HORIZONS['7d'])
+        model = model or DEFAULT_PREDICTION_MODEL
+
+        # Train on the longer close history when it is available
+        if price_history is None:
+            with span('predict.fetch_history'):
+                price_history = fetch_close_history(symbol, days=LSTM_TRAINING_DAYS)
+        if price_history is None:
+            price_history = stock_data
+
+        # Load the saved LSTM model, training a new one only if it is missing or stale
+        with span('predict.model'):
+            if model == 'market':
+                lstm_predictor = get_market_predictor(market, lookback=20, epochs=20, horizon=horizon)
+            else:
+                lstm_predictor = get_lstm_predictor(symbol, price_history, lookback=20, epochs=20, horizon=horizon)  # Reduced for faster training
 
-        # Initialize LSTM predictor
-        lstm_predictor = LSTMPredictor(symbol, lookback=20, epochs=20)  # Reduced for faster training
-        # Train LSTM model
-        print(f"Training LSTM model for {symbol}...")
-        training_success = lstm_predictor.train(stock_data)
-
-        if not training_success:
+        if lstm_predictor is None:
             print(f"Failed to train LSTM model for {symbol}")
             return None
 
-        # Get LSTM prediction
-        lstm_prediction = lstm_predictor.predict_single(stock_data)
+        # Forecast the whole horizon in one forward pass
+        with span('predict.inference'):
+            if model == 'market':
+                lstm_path = lstm_predictor.forecast(price_history, symbol)
+            else:
+                lstm_path = lstm_predictor.forecast(price_history)
 
-        if lstm_prediction is None:
+        if lstm_path is None:
             print(f"Failed to get LSTM prediction for {symbol}")
             return None
 
+        lstm_prediction = lstm_path[-1]
+
         # Get sentiment analysis
-        sentiment_data = analyze_sentiment(symbol, days=7, max_results=15)
+        if sentiment_data is None:
+            with span('predict.sentiment'):
+                sentiment_data = analyze_sentiment(symbol, days=7, max_results=15)
 
         if not sentiment_data:
             print(f"Failed to get sentiment for {symbol}")
@@ -243,6 +316,7 @@ def get_predictions(symbol, market='us', period='7d'):
 
         # Ensure prediction doesn't go negative
         adjusted_prediction = max(adjusted_prediction, current_price * 0.5)
+        adjusted_path = np.maximum(lstm_path * (1 + sentiment_adjustment), current_price * 0.5)
 
         # Calculate confidence based on model performance and sentiment
         lstm_confidence = 75  # Base confidence for LSTM
@@ -298,6 +372,9 @@ def get_predictions(symbol, market='us', period='7d'):
             'factors': factors,
             'sector': sector,
             'timeframe': convert_period_to_timeframe(period),
+            'horizon': horizon,
+            'model': model,
+            'predictionPath': build_prediction_path(adjusted_path, market),
             'market': market,
             'timestamp': datetime.now().isoformat(),
             'priceChange': price_change_pct,
@@ -307,7 +384,8 @@ def get_predictions(symbol, market='us', period='7d'):
         }
 
         # Ensure all values are JSON serializable (convert numpy types)
-        response = convert_to_serializable(response)
+        with span('predict.serialize'):
+            response = convert_to_serializable(response)
 
         return response
 
@@ -316,6 +394,149 @@ def get_predictions(symbol, market='us', period='7d'):
         return None
 
 
+def lstm_registry_key(symbol, lookback=20, epochs=20, batch_size=32, horizon=1):
+    """Registry key and hyperparameters of a per-symbol LSTM"""
+    hyperparams = {
+        'epochs': epochs,
+        'batch_size': batch_size,
+        'horizon': horizon,
+        'architecture': LSTMPredictor.ARCHITECTURE
+    }
+    return get_model_registry().make_key(symbol, lookback, hyperparams), hyperparams
+
+
+def get_lstm_predictor(symbol, stock_data, lookback=20, epochs=20, batch_size=32, horizon=1, force=False):
+    """
+    Get a trained LSTM predictor for a symbol from the model registry
+
+    Loads the latest saved model if it is still fresh. A stale model is
+    fine-tuned on the bars of stock_data (stock data dict or close price
+    series) added since it was saved; after LSTM_MAX_FINE_TUNES fine-tunes, or
+    if none is saved, a new one is trained from scratch. Either way the result
+    is saved as a new version. Each horizon is a separate model.
+
+    Args:
+        force: Always train a new model from scratch
+
+    Returns:
+        Trained LSTMPredictor or None if training failed
+    """
+    registry = get_model_registry()
+    key, hyperparams = lstm_registry_key(symbol, lookback, epochs, batch_size, horizon)
+
+    if not force:
+        lstm_predictor = registry.load(key, LSTMPredictor.load)
+        if lstm_predictor is not None:
+            return lstm_predictor
+
+    def _refresh():
+        lstm_predictor = None if force else registry.load(key, LSTMPredictor.load)
+        if lstm_predictor is not None:
+            return lstm_predictor
+
+        # Warm-start a stale model on the bars added since it was saved. Other
+        # threads may still be predicting with the shared instance, so fine-tune
+        # a private copy; registry.save() swaps it in once its artifacts are written.
+        metadata = registry.get_metadata(key) or {}
+        fine_tunes = metadata.get('fine_tunes', 0)
+        if not force and fine_tunes < LSTM_MAX_FINE_TUNES:
+            lstm_predictor = registry.load(key, LSTMPredictor.load, allow_stale=True, shared=False)
+
+        if lstm_predictor is not None:
+            print(f"Fine-tuning LSTM model for {symbol}...")
+            if lstm_predictor.fine_tune(stock_data):
+                fine_tunes += 1
+            else:
+                lstm_predictor = None
+
+        if lstm_predictor is None:
+            lstm_predictor = LSTMPredictor(symbol, lookback=lookback, epochs=epochs, batch_size=batch_size, horizon=horizon)
+            print(f"Training LSTM model for {symbol}...")
+            if not lstm_predictor.train(stock_data):
+                return None
+            fine_tunes = 0
+
+        try:
+            registry.save(key, lstm_predictor, {
+                'symbol': symbol,
+                'lookback': lookback,
+                'hyperparams': hyperparams,
+                'trained_through': lstm_predictor.trained_through,
+                'fine_tunes': fine_tunes
+            })
+        except Exception as e:
+            # A failed save should not fail the request; the model is still usable
+            print(f"Could not save LSTM model for {symbol}: {str(e)}")
+
+        return lstm_predictor
+
+    # Concurrent callers wait for a single fine-tune or training run
+    return get_group('symbol_models').do((key, force), _refresh)
+
+
+def get_market_predictor(market, lookback=20, epochs=20, batch_size=64, horizon=1):
+    """
+    Get the shared LSTM for a market from the model registry
+
+    Loads the latest saved model if it is still fresh, otherwise trains one on
+    the close history of every symbol in MARKET_SYMBOLS[market]. Concurrent
+    callers wait for a single training run, in this process (single-flight)
+    and across worker processes (the registry's training lock).
+
+    Returns:
+        Trained MarketLSTMPredictor or None if training failed
+    """
+    registry = get_model_registry()
+    hyperparams = {
+        'epochs': epochs,
+        'batch_size': batch_size,
+        'horizon': horizon,
+        'architecture': MarketLSTMPredictor.ARCHITECTURE
+    }
+    key = registry.make_key(f"market-{market}", lookback, hyperparams)
+
+    predictor = registry.load(key, MarketLSTMPredictor.load)
+    if predictor is not None:
+        return predictor
+
+    def _train():
+        # Market fan-outs call this from every worker at once; one trains, the rest load its result
+        with registry.training_lock(key):
+            return _train_locked()
+
+    def _train_locked():
+        predictor = registry.load(key, MarketLSTMPredictor.load)
+        if predictor is not None:
+            return predictor
+
+        series_by_symbol = {}
+        for symbol in MARKET_SYMBOLS.get(market, []):
+            history = fetch_close_history(symbol, days=LSTM_TRAINING_DAYS)
+            if history is not None:
+                series_by_symbol[symbol] = history
+
+        predictor = MarketLSTMPredictor(market, lookback=lookback, epochs=epochs,
+                                        batch_size=batch_size, horizon=horizon)
+        print(f"Training {market} market LSTM model on {len(series_by_symbol)} symbols...")
+        if not predictor.train(series_by_symbol):
+            return None
+
+        try:
+            registry.save(key, predictor, {
+                'market': market,
+                'symbols': predictor.symbols,
+                'lookback': lookback,
+                'hyperparams': hyperparams
+            })
+        except Exception as e:
+            # A failed save should not fail the request; the model is still usable
+            print(f"Could not save {market} market LSTM model: {str(e)}")
+
+        return predictor
+
+    return get_group('market_models').do(key, _train)
+
+
 def get_sector_from_symbol(symbol, market):
     """Get sector based on symbol and market"""
     # Simplified sector mapping - in production, this would use a proper database
@@ -373,11 +594,14 @@ def get_sector_from_symbol(symbol, market):
             else:
                 return 'Cryptocurrency'
     
-    # Try to fetch from yfinance for unknown symbols
+    # Then the local symbol master
+    entry = get_symbol_index().get(symbol)
+    if entry and entry['sector'] != 'Unknown':
+        return entry['sector']
+    
+    # Look up unknown symbols through the shared metadata cache
     try:
-        import yfinance as yf
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
+        info = get_symbol_info(symbol)
         if info and 'sector' in info:
             return info['sector']
         elif info and 'industry' in info:
@@ -460,11 +684,14 @@ def get_company_name(symbol, market):
         if crypto_symbol in crypto_names:
             return crypto_names[crypto_symbol]
     
-    # Try to fetch from yfinance for unknown symbols
+    # Then the local symbol master
+    entry = get_symbol_index().get(symbol)
+    if entry:
+        return entry['name']
+    
+    # Look up unknown symbols through the shared metadata cache
     try:
-        import yfinance as yf
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
+        info = get_symbol_info(symbol)
         if info and 'longName' in info:
             return info['longName']
         elif info and 'shortName' in info:
@@ -495,6 +722,25 @@ def convert_period_to_timeframe(period):
     return period_map.get(period, '7 days')
 
 
+def build_prediction_path(prices, market):
+    """
+    Date the forecast path: one point per trading day (every day for crypto)
+
+    Returns:
+        List of {'date', 'price'} dictionaries
+    """
+    start = pd.Timestamp(datetime.now().date()) + pd.Timedelta(days=1)
+    if market == 'crypto':
+        dates = pd.date_range(start, periods=len(prices), freq='D')
+    else:
+        dates = pd.bdate_range(start, periods=len(prices))
+
+    return [
+        {'date': str(date.date()), 'price': float(price)}
+        for date, price in zip(dates, prices)
+    ]
+
+
 def convert_to_serializable(obj):
     """
     Convert numpy types and other non-JSON serializable types to Python native types
@@ -524,50 +770,114 @@ def convert_to_serializable(obj):
 class LSTMPredictor:
     """
     LSTM-based price predictor using TensorFlow/Keras
+
+    The output layer predicts the next `horizon` closes directly, so a whole
+    forecast path comes from a single forward pass.
     """
 
-    def __init__(self, symbol, lookback=60, epochs=50, batch_size=32):
+    # Part of the registry key; change when build_model() changes
+    ARCHITECTURE = 'lstm50x2-dense25-direct-v2'
+
+    # Recent windows always included in a fine-tune so one new bar does not dominate it
+    FINE_TUNE_MIN_WINDOWS = 64
+
+    def __init__(self, symbol, lookback=60, epochs=50, batch_size=32, horizon=1):
+        from sklearn.preprocessing import MinMaxScaler
+
         self.symbol = symbol
         self.lookback = lookback
         self.epochs = epochs
         self.batch_size = batch_size
+        self.horizon = horizon
         self.model = None
+        self._infer_fn = None
         self.scaler = MinMaxScaler()
         self.is_trained = False
+        self.trained_through = None  # date of the last bar trained on
+        self.train_loss = None  # best training loss of the last train/fine-tune
+
+    @staticmethod
+    def _extract_dates(data):
+        """ISO dates of each price in data, or None if data carries no dates"""
+        if isinstance(data, dict) and 'historical_data' in data:
+            return [str(item.get('date', ''))[:10] for item in data['historical_data']]
+        index = getattr(data, 'index', None)
+        if isinstance(index, pd.DatetimeIndex):
+            return [str(date.date()) for date in index]
+        return None
 
-    def prepare_data(self, data):
-        """Prepare data for LSTM training"""
-        try:
-            # Extract closing prices
-            if isinstance(data, dict) and 'historical_data' in data:
-                # Data from our API format
-                prices = np.array([item['close'] for item in data['historical_data']])
-            elif hasattr(data, 'values'):
-                # Pandas Series or DataFrame
-                prices = data.values.flatten() if len(data.shape) > 1 else data.values
-            else:
-                # List or numpy array
-                prices = np.array(data)
+    @staticmethod
+    def _extract_prices(data):
+        """Closing prices from a stock data dict, pandas object or array"""
+        if isinstance(data, dict) and 'historical_data' in data:
+            # Data from our API format
+            return np.array([item['close'] for item in data['historical_data']], dtype=float)
+        if hasattr(data, 'values'):
+            # Pandas Series or DataFrame
+            return np.asarray(data.values, dtype=float).ravel()
+        # List or numpy array
+        return np.asarray(data, dtype=float).ravel()
+
+    def _scale_training_series(self, data):
+        """Fit the scaler and return the scaled 1-D series, or None if there is too little data"""
+        prices = self._extract_prices(data)
+
+        min_points = self.lookback + self.horizon + 9
+        if len(prices) < min_points:
+            print(f"Insufficient data for {self.symbol}: {len(prices)} points, need at least {min_points}")
+            return None
 
-            if len(prices) < self.lookback + 10:
-                print(f"Insufficient data for {self.symbol}: {len(prices)} points, need at least {self.lookback + 10}")
-                return None, None
+        return self.scaler.fit_transform(prices.reshape(-1, 1)).ravel().astype(np.float32)
 
-            # Normalize data
-            scaled_data = self.scaler.fit_transform(prices.reshape(-1, 1))
+    def prepare_data(self, data, fit=True):
+        """
+        Prepare data for LSTM training
 
-            # Create sequences
-            X, y = [], []
-            for i in range(len(scaled_data) - self.lookback):
-                X.append(scaled_data[i:i+self.lookback])
-                y.append(scaled_data[i+self.lookback])
+        X is a read-only strided view over the scaled series, so no window is
+        copied however large lookback is.
 
-            return np.array(X), np.array(y)
+        Args:
+            data: Stock data dict, pandas object or array of closing prices
+            fit: Fit the scaler on this data (training) or reuse the fitted one (inference)
+
+        Returns:
+            Tuple of X with shape (samples, lookback, 1) and y with shape (samples, horizon)
+        """
+        try:
+            if fit:
+                scaled = self._scale_training_series(data)
+                if scaled is None:
+                    return None, None
+            else:
+                prices = self._extract_prices(data)
+                if len(prices) < self.lookback + self.horizon:
+                    print(f"Insufficient data for {self.symbol}: {len(prices)} points, need at least {self.lookback + self.horizon}")
+                    return None, None
+                scaled = self.scaler.transform(prices.reshape(-1, 1)).ravel().astype(np.float32)
+
+            X = sliding_window_view(scaled[:len(scaled) - self.horizon], self.lookback)[:, :, np.newaxis]
+            y = sliding_window_view(scaled[self.lookback:], self.horizon)
+            return X, y
 
         except Exception as e:
             print(f"Error preparing data for {self.symbol}: {str(e)}")
             return None, None
 
+    def last_window(self, data):
+        """
+        Scale only the most recent lookback prices for inference
+
+        Returns:
+            Array with shape (1, lookback, 1), or None if there is too little data
+        """
+        prices = self._extract_prices(data)
+        if len(prices) < self.lookback:
+            print(f"Insufficient data for {self.symbol}: {len(prices)} points, need at least {self.lookback}")
+            return None
+
+        window = self.scaler.transform(prices[-self.lookback:].reshape(-1, 1))
+        return window.astype(np.float32).reshape(1, self.lookback, 1)
+
     def build_model(self, input_shape):
         """Build LSTM model architecture"""
         try:
@@ -582,11 +892,12 @@ class LSTMPredictor:
                 LSTM(50, return_sequences=False),
                 Dropout(0.2),
                 Dense(25),
-                Dense(1)
+                Dense(self.horizon)
             ])
 
             model.compile(optimizer=Adam(learning_rate=0.001), loss='mean_squared_error')
             self.model = model
+            self._infer_fn = None
             return model
 
         except Exception as e:
@@ -596,31 +907,43 @@ class LSTMPredictor:
     def train(self, data):
         """Train LSTM model"""
         try:
-            X, y = self.prepare_data(data)
+            scaled = self._scale_training_series(data)
 
-            if X is None or y is None:
+            if scaled is None:
                 return False
 
             # Build model if not exists
             if self.model is None:
-                self.build_model((X.shape[1], 1))
+                self.build_model((self.lookback, 1))
 
             if self.model is None:
                 return False
 
             # Train model
             from tensorflow.keras.callbacks import EarlyStopping
+            from tensorflow.keras.utils import timeseries_dataset_from_array
+
+            # Windows are gathered one batch at a time from the scaled series
+            dataset = timeseries_dataset_from_array(
+                scaled[:len(scaled) - self.horizon, np.newaxis],
+                sliding_window_view(scaled[self.lookback:], self.horizon),
+                sequence_length=self.lookback,
+                batch_size=self.batch_size,
+                shuffle=True
+            )
 
             early_stop = EarlyStopping(monitor='loss', patience=10, restore_best_weights=True)
 
-            self.model.fit(
-                X, y,
+            history = self.model.fit(
+                dataset,
                 epochs=self.epochs,
-                batch_size=self.batch_size,
                 callbacks=[early_stop],
                 verbose=0
             )
+            self.train_loss = float(min(history.history['loss']))
 
+            dates = self._extract_dates(data)
+            self.trained_through = dates[-1] if dates else None
             self.is_trained = True
             return True
 
@@ -628,37 +951,193 @@ class LSTMPredictor:
             print(f"Error training LSTM model for {self.symbol}: {str(e)}")
             return False
 
+    def _rescale_model(self, old_scaler):
+        """
+        Re-express the network in the current scaler's units
+
+        Min-max scaling is affine, so a wider range is folded exactly into the
+        first LSTM layer's input weights and the output layer.
+        """
+        from tensorflow.keras.layers import LSTM
+
+        a = float(self.scaler.scale_[0] / old_scaler.scale_[0])
+        b = float(self.scaler.min_[0] - a * old_scaler.min_[0])
+
+        # Inputs: x_new = a * x_old + b, so W @ x_old = (W / a) @ x_new - W * b / a
+        lstm = next(layer for layer in self.model.layers if isinstance(layer, LSTM))
+        kernel, recurrent_kernel, bias = lstm.get_weights()
+        lstm.set_weights([kernel / a, recurrent_kernel, bias - kernel[0] * b / a])
+
+        # Outputs: y_new = a * y_old + b
+        output = self.model.layers[-1]
+        kernel, bias = output.get_weights()
+        output.set_weights([kernel * a, bias * a + b])
+        self._infer_fn = None
+
+    def fine_tune(self, data, epochs=LSTM_FINE_TUNE_EPOCHS):
+        """
+        Continue training from the current weights on bars added since trained_through
+
+        The scaler is widened with partial_fit if new prices fall outside its
+        range, and the network is rescaled to match so earlier learning carries over.
+
+        Returns:
+            True if the model is up to date, False if a full retrain is needed
+        """
+        try:
+            if not self.is_trained or self.model is None or self.trained_through is None:
+                return False
+
+            dates = self._extract_dates(data)
+            if not dates:
+                return False
+
+            prices = self._extract_prices(data)
+            new_count = sum(1 for date in dates if date > self.trained_through)
+            if new_count == 0:
+                return True
+
+            # Widen the scaler to the new prices and keep the network consistent with it
+            old_scaler = copy.deepcopy(self.scaler)
+            self.scaler.partial_fit(prices[-new_count:].reshape(-1, 1))
+            if not (np.allclose(self.scaler.scale_, old_scaler.scale_) and np.allclose(self.scaler.min_, old_scaler.min_)):
+                self._rescale_model(old_scaler)
+
+            # Windows whose targets end on a new bar, plus recent history for stability
+            window_count = max(new_count, self.FINE_TUNE_MIN_WINDOWS)
+            tail = prices[-(window_count + self.lookback + self.horizon - 1):]
+            if len(tail) < self.lookback + self.horizon:
+                return False
+
+            scaled = self.scaler.transform(tail.reshape(-1, 1)).ravel().astype(np.float32)
+            X = sliding_window_view(scaled[:len(scaled) - self.horizon], self.lookback)[:, :, np.newaxis]
+            y = sliding_window_view(scaled[self.lookback:], self.horizon)
+
+            history = self.model.fit(X, y, epochs=epochs, batch_size=self.batch_size, shuffle=True, verbose=0)
+            self.train_loss = float(history.history['loss'][-1])
+
+            self.trained_through = dates[-1]
+            self._infer_fn = None
+            return True
+
+        except Exception as e:
+            print(f"Error fine-tuning LSTM model for {self.symbol}: {str(e)}")
+            return False
+
+    def _get_infer_fn(self):
+        """Graph-compiled forward pass with a fixed (batch, lookback, 1) float32 signature"""
+        if self._infer_fn is None:
+            import tensorflow as tf
+
+            model = self.model
+
+            @tf.function(input_signature=[tf.TensorSpec([None, self.lookback, 1], tf.float32)])
+            def infer_fn(windows):
+                return model(windows, training=False)
+
+            self._infer_fn = infer_fn
+        return self._infer_fn
+
+    def infer(self, windows):
+        """
+        Run the model on scaled windows without Keras predict() overhead
+
+        Args:
+            windows: Array with shape (n, lookback, 1) of scaled prices
+
+        Returns:
+            Array with shape (n, horizon) of scaled predictions
+        """
+        windows = np.asarray(windows, dtype=np.float32).reshape(-1, self.lookback, 1)
+        return self._get_infer_fn()(windows).numpy()
+
+    def forecast(self, data):
+        """
+        Forecast the next `horizon` closes in a single forward pass
+
+        Returns:
+            Array of predicted prices, or None on failure
+        """
+        paths = self.forecast_many([data])
+        return paths[0] if paths is not None else None
+
+    def forecast_many(self, datasets):
+        """
+        Forecast several price series of this predictor's symbol with one batched model call
+
+        The scaler and weights are fitted to self.symbol, so every series must
+        be a window of that symbol's prices (e.g. histories ending on different
+        dates). To batch several symbols, use MarketLSTMPredictor.forecast_many.
+
+        Args:
+            datasets: List of stock data dicts, pandas objects or price arrays
+
+        Returns:
+            List of predicted price arrays (None for series with too little data),
+            or None on failure
+
+        Raises:
+            ValueError: If a stock data dict belongs to another symbol
+        """
+        for data in datasets:
+            if isinstance(data, dict) and str(data.get('symbol') or self.symbol).upper() != self.symbol.upper():
+                raise ValueError(f"{self.symbol} predictor cannot forecast {data['symbol']}; "
+                                 f"use MarketLSTMPredictor.forecast_many for several symbols")
+
+        try:
+            if not self.is_trained or self.model is None:
+                return None
+
+            windows = [self.last_window(data) for data in datasets]
+            ready = [i for i, window in enumerate(windows) if window is not None]
+            paths = [None] * len(windows)
+
+            if ready:
+                scaled = self.infer(np.concatenate([windows[i] for i in ready]))
+                prices = self.scaler.inverse_transform(scaled.reshape(-1, 1)).reshape(scaled.shape)
+                for i, path in zip(ready, prices):
+                    paths[i] = path
+
+            return paths
+
+        except Exception as e:
+            print(f"Error forecasting for {self.symbol}: {str(e)}")
+            return None
+
     def predict(self, data, days_ahead=7):
         """Make predictions"""
         try:
             if not self.is_trained or self.model is None:
                 return None
 
-            X, _ = self.prepare_data(data)
+            # Paths within the trained horizon need only one forward pass
+            if days_ahead <= self.horizon:
+                path = self.forecast(data)
+                return path[:days_ahead] if path is not None else None
 
-            if X is None:
-                return None
+            # Only the most recent window is needed for prediction
+            current_sequence = self.last_window(data)
 
-            # Use last sequence for prediction
-            last_sequence = X[-1:]
+            if current_sequence is None:
+                return None
 
             # Predict next values
             predictions = []
-            current_sequence = last_sequence.copy()
 
-            for _ in range(days_ahead):
-                # Predict next value
-                next_pred = self.model.predict(current_sequence, verbose=0)[0][0]
+            while len(predictions) < days_ahead:
+                # Predict the next horizon values
+                step = self.infer(current_sequence)[0]
 
-                # Store prediction
-                predictions.append(next_pred)
+                # Store predictions
+                predictions.extend(step)
 
-                # Update sequence for next prediction
-                current_sequence = np.roll(current_sequence, -1, axis=1)
-                current_sequence[0, -1, 0] = next_pred
+                # Slide the window forward over the predicted values
+                current_sequence = np.concatenate(
+                    [current_sequence[:, len(step):, :], step[-self.lookback:].reshape(1, -1, 1)], axis=1
+                )[:, -self.lookback:, :]
 
             # Inverse transform predictions
-            predictions = np.array(predictions).reshape(-1, 1)
+            predictions = np.array(predictions[:days_ahead]).reshape(-1, 1)
             predictions = self.scaler.inverse_transform(predictions)
 
             return predictions.flatten()
@@ -676,6 +1155,308 @@ class LSTMPredictor:
             print(f"Error in single prediction for {self.symbol}: {str(e)}")
             return None
 
+    def save_artifacts(self, directory):
+        """Save model weights, fitted scaler and settings to a directory"""
+        if not self.is_trained or self.model is None:
+            raise ValueError(f"LSTM model for {self.symbol} is not trained")
+
+        self.model.save(os.path.join(directory, 'model.keras'))
+
+        with open(os.path.join(directory, 'scaler.pkl'), 'wb') as f:
+            pickle.dump(self.scaler, f)
+
+        with open(os.path.join(directory, 'config.json'), 'w', encoding='utf-8') as f:
+            json.dump({
+                'symbol': self.symbol,
+                'lookback': self.lookback,
+                'epochs': self.epochs,
+                'batch_size': self.batch_size,
+                'horizon': self.horizon,
+                'trained_through': self.trained_through,
+                'architecture': self.ARCHITECTURE
+            }, f, indent=2)
+
+    @classmethod
+    def load(cls, directory):
+        """Load a trained predictor saved with save_artifacts()"""
+        from tensorflow.keras.models import load_model
+
+        with open(os.path.join(directory, 'config.json'), 'r', encoding='utf-8') as f:
+            config = json.load(f)
+
+        if config.get('architecture') != cls.ARCHITECTURE:
+            return None
+
+        predictor = cls(
+            config['symbol'],
+            lookback=config['lookback'],
+            epochs=config['epochs'],
+            batch_size=config['batch_size'],
+            horizon=config.get('horizon', 1)
+        )
+        predictor.trained_through = config.get('trained_through')
+
+        with open(os.path.join(directory, 'scaler.pkl'), 'rb') as f:
+            predictor.scaler = pickle.load(f)
+
+        predictor.model = load_model(os.path.join(directory, 'model.keras'))
+        predictor.is_trained = True
+        return predictor
+
+
+# ============================================================================
+# MARKET-LEVEL LSTM MODEL
+# ============================================================================
+
+class MarketLSTMPredictor:
+    """
+    One LSTM shared by every symbol in a market
+
+    Each window is normalized by its own last close, so the model learns
+    relative moves and can forecast symbols it never saw. An optional symbol
+    embedding lets it specialize for the symbols it was trained on; unknown
+    symbols use the shared out-of-vocabulary id 0.
+    """
+
+    # Part of the registry key; change when build_model() changes
+    ARCHITECTURE = 'market-lstm64-emb8-direct-v1'
+
+    # Share of training windows relabelled as out-of-vocabulary so id 0 learns a generic embedding
+    OOV_RATE = 0.1
+
+    def __init__(self, market, lookback=20, epochs=20, batch_size=64, horizon=1,
+                 use_embedding=True, embedding_dim=8):
+        self.market = market
+        self.lookback = lookback
+        self.epochs = epochs
+        self.batch_size = batch_size
+        self.horizon = horizon
+        self.use_embedding = use_embedding
+        self.embedding_dim = embedding_dim
+        self.symbols = []  # symbol ids start at 1; 0 is out-of-vocabulary
+        self.model = None
+        self._infer_fn = None
+        self.is_trained = False
+
+    def symbol_id(self, symbol):
+        """Embedding id for a symbol (0 if it was not in the training universe)"""
+        try:
+            return self.symbols.index(symbol.upper()) + 1
+        except ValueError:
+            return 0
+
+    def _normalized_windows(self, prices):
+        """Training windows and targets, each relative to the window's last close"""
+        windows = sliding_window_view(prices[:len(prices) - self.horizon], self.lookback)
+        targets = sliding_window_view(prices[self.lookback:], self.horizon)
+        last = windows[:, -1:]
+        return windows / last - 1, targets / last - 1
+
+    def prepare_data(self, series_by_symbol):
+        """
+        Build the pooled training set from every symbol's close prices
+
+        Args:
+            series_by_symbol: Dictionary mapping symbol to stock data dict, pandas object or price array
+
+        Returns:
+            Tuple of (X, symbol_ids, y), or (None, None, None) if no symbol has enough data
+        """
+        self.symbols = []
+        X, ids, y = [], [], []
+
+        for symbol, data in series_by_symbol.items():
+            prices = LSTMPredictor._extract_prices(data)
+            prices = prices[np.isfinite(prices) & (prices > 0)]
+            if len(prices) < self.lookback + self.horizon + 10:
+                print(f"Skipping {symbol} for {self.market} market model: {len(prices)} points")
+                continue
+
+            self.symbols.append(symbol.upper())
+            windows, targets = self._normalized_windows(prices)
+            X.append(windows)
+            y.append(targets)
+            ids.append(np.full(len(windows), len(self.symbols), dtype=np.int32))
+
+        if not X:
+            print(f"Insufficient data for {self.market} market model")
+            return None, None, None
+
+        X = np.concatenate(X).astype(np.float32)[:, :, np.newaxis]
+        return X, np.concatenate(ids), np.concatenate(y).astype(np.float32)
+
+    def build_model(self):
+        """Build the shared LSTM, with a symbol embedding branch if enabled"""
+        try:
+            from tensorflow.keras.models import Model
+            from tensorflow.keras.layers import LSTM, Dense, Dropout, Input, Embedding, Flatten, Concatenate
+            from tensorflow.keras.optimizers import Adam
+
+            prices = Input(shape=(self.lookback, 1), name='prices')
+            features = LSTM(64, return_sequences=True)(prices)
+            features = Dropout(0.2)(features)
+            features = LSTM(64)(features)
+            inputs = [prices]
+
+            if self.use_embedding:
+                symbol_ids = Input(shape=(1,), dtype='int32', name='symbol_id')
+                embedded = Flatten()(Embedding(len(self.symbols) + 1, self.embedding_dim)(symbol_ids))
+                features = Concatenate()([features, embedded])
+                inputs.append(symbol_ids)
+
+            features = Dense(25)(features)
+            outputs = Dense(self.horizon)(features)
+
+            model = Model(inputs=inputs, outputs=outputs)
+            model.compile(optimizer=Adam(learning_rate=0.001), loss='mean_squared_error')
+            self.model = model
+            self._infer_fn = None
+            return model
+
+        except Exception as e:
+            print(f"Error building {self.market} market LSTM model: {str(e)}")
+            return None
+
+    def train(self, series_by_symbol):
+        """Train the shared model on every symbol's history"""
+        try:
+            X, ids, y = self.prepare_data(series_by_symbol)
+
+            if X is None:
+                return False
+
+            if self.build_model() is None:
+                return False
+
+            ids = np.where(np.random.random(len(ids)) < self.OOV_RATE, 0, ids).astype(np.int32)
+
+            from tensorflow.keras.callbacks import EarlyStopping
+
+            early_stop = EarlyStopping(monitor='loss', patience=10, restore_best_weights=True)
+
+            self.model.fit(
+                [X, ids] if self.use_embedding else X, y,
+                epochs=self.epochs,
+                batch_size=self.batch_size,
+                shuffle=True,
+                callbacks=[early_stop],
+                verbose=0
+            )
+
+            self.is_trained = True
+            return True
+
+        except Exception as e:
+            print(f"Error training {self.market} market LSTM model: {str(e)}")
+            return False
+
+    def _get_infer_fn(self):
+        """Graph-compiled forward pass with fixed input signatures"""
+        if self._infer_fn is None:
+            import tensorflow as tf
+
+            model = self.model
+            window_spec = tf.TensorSpec([None, self.lookback, 1], tf.float32)
+
+            if self.use_embedding:
+                @tf.function(input_signature=[window_spec, tf.TensorSpec([None, 1], tf.int32)])
+                def infer_fn(windows, symbol_ids):
+                    return model([windows, symbol_ids], training=False)
+            else:
+                @tf.function(input_signature=[window_spec])
+                def infer_fn(windows):
+                    return model(windows, training=False)
+
+            self._infer_fn = infer_fn
+        return self._infer_fn
+
+    def forecast_many(self, series_by_symbol):
+        """
+        Forecast several symbols with one batched model call
+
+        Returns:
+            Dictionary mapping symbol to predicted price array (symbols with
+            too little data are left out), or None on failure
+        """
+        try:
+            if not self.is_trained or self.model is None:
+                return None
+
+            symbols, windows = [], []
+            for symbol, data in series_by_symbol.items():
+                prices = LSTMPredictor._extract_prices(data)
+                if len(prices) < self.lookback or not np.all(prices[-self.lookback:] > 0):
+                    print(f"Insufficient data for {symbol}: {len(prices)} points, need at least {self.lookback}")
+                    continue
+                symbols.append(symbol)
+                windows.append(prices[-self.lookback:])
+
+            if not symbols:
+                return {}
+
+            windows = np.array(windows)
+            last = windows[:, -1:]
+            inputs = [(windows / last - 1).astype(np.float32)[:, :, np.newaxis]]
+            if self.use_embedding:
+                inputs.append(np.array([[self.symbol_id(symbol)] for symbol in symbols], dtype=np.int32))
+
+            relative = self._get_infer_fn()(*inputs).numpy()
+            return dict(zip(symbols, (relative + 1) * last))
+
+        except Exception as e:
+            print(f"Error forecasting with {self.market} market model: {str(e)}")
+            return None
+
+    def forecast(self, data, symbol):
+        """Forecast the next `horizon` closes for one symbol"""
+        paths = self.forecast_many({symbol: data})
+        return paths.get(symbol) if paths else None
+
+    def save_artifacts(self, directory):
+        """Save model weights, symbol vocabulary and settings to a directory"""
+        if not self.is_trained or self.model is None:
+            raise ValueError(f"{self.market} market LSTM model is not trained")
+
+        self.model.save(os.path.join(directory, 'model.keras'))
+
+        with open(os.path.join(directory, 'config.json'), 'w', encoding='utf-8') as f:
+            json.dump({
+                'market': self.market,
+                'lookback': self.lookback,
+                'epochs': self.epochs,
+                'batch_size': self.batch_size,
+                'horizon': self.horizon,
+                'use_embedding': self.use_embedding,
+                'embedding_dim': self.embedding_dim,
+                'symbols': self.symbols,
+                'architecture': self.ARCHITECTURE
+            }, f, indent=2)
+
+    @classmethod
+    def load(cls, directory):
+        """Load a trained predictor saved with save_artifacts()"""
+        from tensorflow.keras.models import load_model
+
+        with open(os.path.join(directory, 'config.json'), 'r', encoding='utf-8') as f:
+            config = json.load(f)
+
+        if config.get('architecture') != cls.ARCHITECTURE:
+            return None
+
+        predictor = cls(
+            config['market'],
+            lookback=config['lookback'],
+            epochs=config['epochs'],
+            batch_size=config['batch_size'],
+            horizon=config['horizon'],
+            use_embedding=config['use_embedding'],
+            embedding_dim=config['embedding_dim']
+        )
+        predictor.symbols = config['symbols']
+        predictor.model = load_model(os.path.join(directory, 'model.keras'))
+        predictor.is_trained = True
+        return predictor
+
 
 # ============================================================================
 # RANDOM FOREST MODEL (Template for future implementation)
@@ -687,6 +1468,8 @@ class RandomForestPredictor:
     """
     
     def __init__(self, symbol, n_estimators=100):
+        from sklearn.ensemble import RandomForestRegressor
+        
         self.symbol = symbol
         self.model = RandomForestRegressor(n_estimators=n_estimators, random_state=42)
     
@@ -721,6 +1504,8 @@ class SVMPredictor:
     """
     
     def __init__(self, symbol):
+        from sklearn.svm import SVR
+        
         self.symbol = symbol
         self.model = SVR(kernel='rbf', C=100, gamma='scale')
     
@@ -737,32 +1522,83 @@ class SVMPredictor:
 # MODEL TRAINING FUNCTION
 # ============================================================================
 
+def train_symbol_model(symbol, horizon, force=False):
+    """
+    Refresh one per-symbol LSTM (runs in a training worker process)
+
+    Returns:
+        Dictionary with the task's status, duration, training loss and artifact path
+    """
+    started = time.perf_counter()
+    result = {'symbol': symbol, 'horizon': horizon}
+
+    try:
+        history = fetch_close_history(symbol, days=LSTM_TRAINING_DAYS)
+        if history is None:
+            raise ValueError(f"No price history for {symbol}")
+
+        predictor = get_lstm_predictor(symbol, history, lookback=20, epochs=20, horizon=horizon, force=force)
+        if predictor is None:
+            raise ValueError(f"Training failed for {symbol}")
+
+        key, _ = lstm_registry_key(symbol, lookback=20, epochs=20, horizon=horizon)
+        metadata = get_model_registry().get_metadata(key) or {}
+        result.update({
+            'status': 'trained',
+            'loss': predictor.train_loss,
+            'fine_tunes': metadata.get('fine_tunes', 0),
+            'trained_through': predictor.trained_through,
+            'artifact_path': metadata.get('path')
+        })
+
+    except Exception as e:
+        result.update({'status': 'failed', 'error': str(e)})
+
+    result['duration_seconds'] = round(time.perf_counter() - started, 3)
+    return result
+
+
 def train_model(market=None, force=False):
     """
-    Trigger model retraining
-    
+    Start a batch retraining run in the training worker pool
+
+    Every symbol in MARKET_SYMBOLS is refreshed for each prediction period;
+    models that are still fresh are skipped unless force is set. A run for
+    the same market and force flag that is still in flight is reused.
+
     Args:
         market: Specific market to retrain ('us', 'indian', 'crypto') or None for all
         force: Force retrain even if recent models exist
-    
+
     Returns:
-        Status message
+        Run status dictionary (see TrainingScheduler.get)
+
+    Raises:
+        ValueError: If market is not a known market
     """
-    try:
-        if market and market not in ['us', 'indian', 'crypto']:
-            return f"Invalid market: {market}"
-        
-        markets_to_train = [market] if market else ['us', 'indian', 'crypto']
-        
-        for m in markets_to_train:
-            print(f"Training models for {m} market...")
-            # TODO: Implement actual model training
-            pass
-        
-        return f"Training initiated for {', '.join(markets_to_train)}"
-        
-    except Exception as e:
-        return f"Error during training: {str(e)}"
+    if market and market not in MARKET_SYMBOLS:
+        raise ValueError(f"Invalid market: {market}")
+
+    markets_to_train = [market] if market else list(MARKET_SYMBOLS)
+    registry = get_model_registry()
+
+    tasks = []
+    skipped = []
+    for m in markets_to_train:
+        for symbol in MARKET_SYMBOLS[m]:
+            for horizon in sorted(set(PERIOD_HORIZONS.values())):
+                label = {'market': m, 'symbol': symbol, 'horizon': horizon}
+                key, _ = lstm_registry_key(symbol, lookback=20, epochs=20, horizon=horizon)
+                if not force and not registry.is_stale(registry.get_metadata(key)):
+                    skipped.append(label)
+                else:
+                    tasks.append((label, (symbol, horizon, force)))
+
+    print(f"Training {len(tasks)} models for {', '.join(markets_to_train)} ({len(skipped)} fresh)...")
+    scheduler = get_training_scheduler()
+    run_id = scheduler.start((market, bool(force)), train_symbol_model, tasks, skipped,
+                             params={'markets': markets_to_train, 'force': bool(force)})
+    return scheduler.get(run_id)
 
 
 if __name__ == '__main__':
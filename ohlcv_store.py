@@ -0,0 +1,198 @@
+"""
+Local OHLCV Store
+Keeps downloaded daily bars on disk (one Parquet file per source and symbol)
+so repeat fetches only download the bars after the last stored date
+"""
+
+import os
+import json
+import uuid
+import threading
+from datetime import datetime
+
+import pandas as pd
+
+OHLCV_DIR = os.getenv('OHLCV_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'ohlcv'))
+OHLCV_REFRESH_SECONDS = int(os.getenv('OHLCV_REFRESH_SECONDS', '300'))
+# An empty download (unknown or delisted ticker, holiday, upstream failure) is retried after this long
+OHLCV_EMPTY_RETRY_SECONDS = int(os.getenv('OHLCV_EMPTY_RETRY_SECONDS', '120'))
+
+
+class OHLCVStore:
+    """
+    On-disk time-series store partitioned by source and symbol
+
+    Layout:
+        <root>/<source>/<SYMBOL>.parquet    - bars indexed by date
+        <root>/<source>/<SYMBOL>.json       - covered start date, last refresh time and
+                                              last empty download (checked_at, checked_start)
+    """
+
+    def __init__(self, root=OHLCV_DIR, refresh_seconds=OHLCV_REFRESH_SECONDS,
+                 empty_retry_seconds=OHLCV_EMPTY_RETRY_SECONDS):
+        self.root = root
+        self.refresh_seconds = refresh_seconds
+        self.empty_retry_seconds = empty_retry_seconds
+        self._locks = {}
+        self._locks_lock = threading.Lock()
+
+    def _lock(self, source, symbol):
+        with self._locks_lock:
+            return self._locks.setdefault((source, symbol), threading.Lock())
+
+    def _paths(self, source, symbol):
+        safe_symbol = ''.join(c if c.isalnum() or c in '-_.' else '_' for c in symbol.upper())
+        base = os.path.join(self.root, source, safe_symbol)
+        return f"{base}.parquet", f"{base}.json"
+
+    def _read_meta(self, source, symbol):
+        """Metadata with datetime values; every key is optional (empty dict if none is stored)"""
+        _, meta_path = self._paths(source, symbol)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            return {name: datetime.fromisoformat(value) for name, value in meta.items()}
+        except (OSError, ValueError, TypeError, AttributeError):
+            return {}
+
+    def _write_meta(self, source, symbol, meta):
+        meta_json = json.dumps({name: value.isoformat() for name, value in meta.items()})
+
+        def _write(path):
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(meta_json)
+
+        self._write_atomic(self._paths(source, symbol)[1], _write)
+
+    def read(self, source, symbol):
+        """Read all stored bars for a symbol, or None if nothing is stored"""
+        data_path, _ = self._paths(source, symbol)
+        if not os.path.exists(data_path):
+            return None
+        return pd.read_parquet(data_path)
+
+    def missing_start(self, source, symbol, start):
+        """
+        Work out what has to be downloaded for the store to cover [start, now]
+
+        Returns:
+            Date to download from, or None if the stored bars are already fresh
+        """
+        start = _start_of_day(start)
+        meta = self._read_meta(source, symbol)
+        now = datetime.now()
+
+        # A recent download for this window came back empty; serve what is stored until it is retried
+        checked_at = meta.get('checked_at')
+        if (checked_at is not None and start >= meta.get('checked_start', now)
+                and (now - checked_at).total_seconds() < self.empty_retry_seconds):
+            return None
+
+        if 'start' not in meta or 'updated_at' not in meta or start < meta['start']:
+            return start
+
+        if (now - meta['updated_at']).total_seconds() < self.refresh_seconds:
+            return None
+
+        stored = self.read(source, symbol)
+        if stored is None or stored.empty:
+            return start
+
+        # Refetch the last stored bar too; it may have been an unfinished trading day
+        return max(stored.index[-1].to_pydatetime(), start)
+
+    def update(self, source, symbol, new_data, start=None):
+        """
+        Merge newly downloaded bars into the store
+
+        Args:
+            new_data: DataFrame indexed by date (may be empty)
+            start: Start of the window that was requested, recorded as covered
+
+        An empty or missing download (which is also how failed downloads look)
+        does not count as a refresh; it is recorded as checked_at instead, so
+        the window is not downloaded again for OHLCV_EMPTY_RETRY_SECONDS rather
+        than OHLCV_REFRESH_SECONDS.
+        """
+        requested = _start_of_day(start or datetime.now())
+
+        with self._lock(source, symbol):
+            meta = self._read_meta(source, symbol)
+
+            if new_data is None or new_data.empty:
+                meta.update(checked_at=datetime.now(), checked_start=requested)
+                self._write_meta(source, symbol, meta)
+                return
+
+            stored = self.read(source, symbol)
+            new_data = _normalize_index(new_data)
+            merged = new_data if stored is None else pd.concat([stored, new_data])
+            merged = merged[~merged.index.duplicated(keep='last')].sort_index()
+            self._write_atomic(self._paths(source, symbol)[0], merged.to_parquet)
+
+            covered = min(requested, meta['start']) if 'start' in meta else requested
+            self._write_meta(source, symbol, {'start': covered, 'updated_at': datetime.now()})
+
+    def read_range(self, source, symbol, start=None, end=None):
+        """Read stored bars between start and end (inclusive)"""
+        stored = self.read(source, symbol)
+        if stored is None:
+            return None
+        return stored.loc[start:end]
+
+    def get_range(self, source, symbol, start, end, fetch):
+        """
+        Get bars for [start, end], downloading only what the store is missing
+
+        Args:
+            fetch: Callable fetch(fetch_start, fetch_end) returning a DataFrame
+
+        Returns:
+            DataFrame of bars (empty if the symbol has no data)
+        """
+        start = _start_of_day(start)
+        fetch_start = self.missing_start(source, symbol, start)
+        if fetch_start is not None:
+            self.update(source, symbol, fetch(fetch_start, end), start=start)
+
+        data = self.read_range(source, symbol, start, end)
+        return data if data is not None else pd.DataFrame()
+
+    def _write_atomic(self, path, writer):
+        """Write via a temp file so readers in other processes never see a partial file"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            writer(tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+def _start_of_day(value):
+    return datetime.combine(value.date(), datetime.min.time())
+
+
+def _normalize_index(df):
+    """Use a sorted, timezone-naive DatetimeIndex so stored and new bars line up"""
+    df = df.copy()
+    df.index = pd.to_datetime(df.index)
+    if df.index.tz is not None:
+        df.index = df.index.tz_localize(None)
+    return df.sort_index()
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_ohlcv_store():
+    """Get the process-wide OHLCV store"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = OHLCVStore()
+    return _store
+
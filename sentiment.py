@@ -0,0 +1,151 @@
+"""
+News Sentiment Service
+Keeps one VADER analyzer per process, caches news searches per symbol and
+memoizes headline scores so repeated headlines are never scored twice
+"""
+
+import hashlib
+import threading
+from datetime import datetime
+
+import numpy as np
+
+from cache import get_cache
+from metrics import span, count_upstream_error
+
+
+class SentimentService:
+    """
+    Long-lived news sentiment analyzer for stock symbols
+
+    News results live in the 'news' cache namespace and headline scores in
+    'headline_scores' (see cache.CACHE_NAMESPACES for TTLs and sizes).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._analyzer = None
+        self._news = get_cache('news')               # (symbol, days) -> articles
+        self._scores = get_cache('headline_scores')  # headline hash -> compound score
+
+    def _get_analyzer(self):
+        """Load the VADER lexicon once per process"""
+        if self._analyzer is None:
+            with self._lock:
+                if self._analyzer is None:
+                    import nltk
+                    from nltk.sentiment.vader import SentimentIntensityAnalyzer
+
+                    try:
+                        nltk.data.find('sentiment/vader_lexicon.zip')
+                    except LookupError:
+                        nltk.download('vader_lexicon', quiet=True)
+
+                    self._analyzer = SentimentIntensityAnalyzer()
+        return self._analyzer
+
+    def get_news(self, symbol, days=7):
+        """Get Google News results for a symbol (cached)"""
+        key = (symbol, days)
+        articles = self._news.get(key)
+        if articles is not None:
+            return articles
+
+        from GoogleNews import GoogleNews
+
+        print(f"Fetching latest news for: {symbol}")
+        try:
+            with span('news_fetch'):
+                googlenews = GoogleNews(period=f"{days}d")
+                googlenews.search(symbol)
+                articles = googlenews.result()
+        except Exception:
+            count_upstream_error('google_news')
+            raise
+
+        self._news.set(key, articles)
+        return articles
+
+    def score(self, text):
+        """VADER compound score for a headline, memoized by content hash"""
+        key = hashlib.sha1(text.encode('utf-8')).digest()
+        score = self._scores.get(key)
+        if score is None:
+            score = self._get_analyzer().polarity_scores(text)['compound']
+            self._scores.set(key, score)
+        return score
+
+    def analyze(self, symbol, days=7, max_results=20):
+        """
+        Analyze news sentiment for a symbol
+
+        Returns:
+            Dictionary with sentiment analysis results (see utils.analyze_sentiment)
+        """
+        news = self.get_news(symbol, days)[:max_results]
+
+        if not news:
+            print(f"No news found for {symbol}")
+            return {
+                'symbol': symbol,
+                'sentiment_score': 0.0,
+                'sentiment_label': 'neutral',
+                'articles_analyzed': 0,
+                'confidence': 0.0,
+                'timestamp': datetime.now().isoformat()
+            }
+
+        sentiment_scores = []
+        headlines = []
+
+        # Analyze sentiment for each article
+        with span('sentiment_scoring'):
+            for item in news:
+                title = item.get('title', '')
+                if title:
+                    sentiment = self.score(title)
+                    sentiment_scores.append(sentiment)
+                    headlines.append({
+                        'title': title,
+                        'sentiment': sentiment,
+                        'date': item.get('date', ''),
+                        'link': item.get('link', '')
+                    })
+
+        # Calculate aggregate sentiment
+        avg_sentiment = np.mean(sentiment_scores) if sentiment_scores else 0.0
+
+        # Determine sentiment label
+        if avg_sentiment >= 0.05:
+            label = 'positive'
+        elif avg_sentiment <= -0.05:
+            label = 'negative'
+        else:
+            label = 'neutral'
+
+        # Calculate confidence based on number of articles and sentiment variance
+        confidence = min(len(sentiment_scores) / max_results, 1.0) * (1 - np.var(sentiment_scores)) if sentiment_scores else 0.0
+
+        return {
+            'symbol': symbol,
+            'sentiment_score': float(avg_sentiment),  # -1 (very negative) to 1 (very positive)
+            'sentiment_label': label,
+            'articles_analyzed': len(sentiment_scores),
+            'confidence': float(confidence),
+            'headlines': headlines[:5],  # Top 5 headlines
+            'timestamp': datetime.now().isoformat()
+        }
+
+
+_sentiment_service = None
+_sentiment_service_lock = threading.Lock()
+
+
+def get_sentiment_service():
+    """Get the process-wide sentiment service"""
+    global _sentiment_service
+    if _sentiment_service is None:
+        with _sentiment_service_lock:
+            if _sentiment_service is None:
+                _sentiment_service = SentimentService()
+    return _sentiment_service
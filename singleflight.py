@@ -0,0 +1,124 @@
+"""
+Single-Flight Request Coalescing
+Collapses identical concurrent calls into one unit of work: the first caller
+runs the function and every concurrent duplicate waits for its result
+"""
+
+import inspect
+import threading
+import functools
+
+from cache import make_call_key
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Group of in-flight calls keyed by caller-supplied keys"""
+
+    def __init__(self, name='default'):
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls = {}  # key -> _Call
+        self.executions = 0
+        self.coalesced = 0
+
+    def do(self, key, fn, *args, timeout=None, **kwargs):
+        """
+        Run fn(*args, **kwargs) unless a call with the same key is already running
+
+        Duplicates block until the leading call finishes and receive the same
+        result (or exception).
+
+        Args:
+            timeout: Seconds a duplicate waits before raising TimeoutError
+
+        Returns:
+            The function's result
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _Call()
+                self._calls[key] = call
+                self.executions += 1
+            else:
+                call.waiters += 1
+                self.coalesced += 1
+
+        if not is_leader:
+            if not call.done.wait(timeout):
+                raise TimeoutError(f"Timed out waiting for in-flight call {key!r}")
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def stats(self):
+        """In-flight count and how many calls were served by another caller's work"""
+        with self._lock:
+            return {
+                'in_flight': len(self._calls),
+                'executions': self.executions,
+                'coalesced': self.coalesced
+            }
+
+
+_groups = {}
+_groups_lock = threading.Lock()
+
+
+def get_group(name):
+    """Get (creating on first use) a named single-flight group"""
+    with _groups_lock:
+        group = _groups.get(name)
+        if group is None:
+            group = SingleFlight(name)
+            _groups[name] = group
+        return group
+
+
+def singleflight_stats():
+    """Stats for every single-flight group in use"""
+    with _groups_lock:
+        groups = dict(_groups)
+    return {name: group.stats() for name, group in groups.items()}
+
+
+def coalesce(group, key=None):
+    """
+    Coalesce identical concurrent calls to a function
+
+    Args:
+        group: Single-flight group name
+        key: Optional callable taking the function's arguments and returning the
+             coalescing key; by default all arguments (with defaults applied) are used
+    """
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            call_key = (fn.__name__, make_call_key(signature, key, args, kwargs))
+            return get_group(group).do(call_key, fn, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
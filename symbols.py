@@ -0,0 +1,269 @@
+"""
+Symbol Universe Index
+Preloaded master list of US, NSE and crypto tickers with names and sectors,
+indexed in memory for exact lookups and prefix autocomplete
+"""
+
+import os
+import re
+import csv
+import bisect
+import threading
+
+from cache import get_cache
+from metadata import get_metadata_cache
+
+SYMBOL_MASTER_PATH = os.getenv(
+    'SYMBOL_MASTER_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'symbols.csv')
+)
+# Ranked candidates kept per prefix; autocomplete never returns more than this
+AUTOCOMPLETE_MAX_RESULTS = int(os.getenv('AUTOCOMPLETE_MAX_RESULTS', '25'))
+# Check symbols missing from the master with one metadata lookup (misses are cached)
+SYMBOL_PROBE_UPSTREAM = os.getenv('SYMBOL_PROBE_UPSTREAM', 'true').lower() in ('1', 'true', 'yes')
+
+MARKETS = ['us', 'indian', 'crypto']
+
+# Suffix Yahoo Finance uses for each market's tickers (e.g. RELIANCE.NS, BTC-USD)
+MARKET_SUFFIXES = {'indian': '.NS', 'crypto': '-USD'}
+_LISTING_SUFFIXES = ('.NS', '.BO', '-USD')
+
+# Name words too common to start a useful name match
+_NAME_STOPWORDS = {'inc', 'ltd', 'limited', 'corp', 'corporation', 'company', 'co', 'the', 'of', 'and', 'plc', 'class'}
+
+
+def _base_symbol(symbol):
+    """Ticker without its listing suffix, e.g. RELIANCE for RELIANCE.NS"""
+    for suffix in _LISTING_SUFFIXES:
+        if symbol.endswith(suffix) and len(symbol) > len(suffix):
+            return symbol[:-len(suffix)]
+    return symbol
+
+
+def _normalize_name(text):
+    return ' '.join(re.sub(r'[^a-z0-9]+', ' ', text.lower()).split())
+
+
+def _name_keys(name):
+    """The normalized name from each significant word on, so 'consul' finds Tata Consultancy Services"""
+    words = _normalize_name(name).split()
+    return [' '.join(words[i:]) for i, word in enumerate(words) if i == 0 or word not in _NAME_STOPWORDS]
+
+
+class _PrefixTrie:
+    """
+    Character trie whose nodes keep their best-ranked entries
+
+    Ranking happens once at insert time, so a lookup is a walk down the
+    prefix and a copy of the node's list.
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        self._root = {}  # char -> child node; node[None] = sorted [(rank, symbol), ...]
+
+    def insert(self, key, ranked):
+        node = self._root
+        for char in key:
+            node = node.setdefault(char, {})
+            hits = node.setdefault(None, [])
+            if ranked in hits:
+                continue
+            if len(hits) >= self.limit and ranked > hits[-1]:
+                continue
+            bisect.insort(hits, ranked)
+            del hits[self.limit:]
+
+    def lookup(self, prefix):
+        node = self._root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return []
+        return [symbol for _, symbol in node.get(None, ())]
+
+
+class SymbolIndex:
+    """
+    In-memory symbol master with exact and prefix lookups
+
+    Entries are {'symbol', 'name', 'market', 'sector'} dictionaries ranked by
+    insertion order (the master file lists the most traded tickers first).
+    Lookups do not lock; add() is only needed for symbols learned at runtime.
+    """
+
+    def __init__(self, entries=(), limit=AUTOCOMPLETE_MAX_RESULTS):
+        self.limit = limit
+        self._lock = threading.Lock()
+        self._entries = {}  # symbol -> entry
+        self._by_base = {}  # ticker without listing suffix -> [symbols]
+        # market (None = all markets) -> (symbol trie, name trie)
+        self._tries = {market: (_PrefixTrie(limit), _PrefixTrie(limit)) for market in [None] + MARKETS}
+        for entry in entries:
+            self.add(entry)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, entry):
+        """Index an entry (ignored if its symbol is already known)"""
+        symbol = entry['symbol'].upper()
+        entry = dict(entry, symbol=symbol)
+
+        with self._lock:
+            if symbol in self._entries:
+                return
+            ranked = (len(self._entries), symbol)
+            self._entries[symbol] = entry
+            self._by_base.setdefault(_base_symbol(symbol), []).append(symbol)
+
+            for market in (None, entry['market']):
+                if market not in self._tries:
+                    continue
+                symbol_trie, name_trie = self._tries[market]
+                symbol_trie.insert(symbol, ranked)
+                for key in _name_keys(entry['name']):
+                    name_trie.insert(key, ranked)
+
+    def get(self, symbol):
+        """Entry for an exact symbol, or None"""
+        return self._entries.get(symbol.upper())
+
+    def resolve(self, symbol, market=None):
+        """
+        Match a user-entered ticker to an entry
+
+        The exact symbol wins, then the same ticker on another listing
+        (RELIANCE -> RELIANCE.NS, BTC -> BTC-USD); listings in the requested
+        market are preferred (INFY in 'indian' -> INFY.NS).
+
+        Returns:
+            Entry dictionary, or None if the ticker is not in the master
+        """
+        symbol = symbol.upper()
+        candidates = dict.fromkeys([symbol] + self._by_base.get(_base_symbol(symbol), []))
+        matches = [self._entries[s] for s in candidates if s in self._entries]
+        if market:
+            matches.sort(key=lambda entry: entry['market'] != market)
+        return matches[0] if matches else None
+
+    def search(self, query, market=None, limit=10):
+        """
+        Autocomplete a partial ticker or company name
+
+        Symbol prefix matches rank above name matches; an exact symbol comes first.
+
+        Returns:
+            List of at most min(limit, self.limit) entries
+        """
+        query = query.strip()
+        if not query:
+            return []
+
+        symbol_trie, name_trie = self._tries.get(market, self._tries[None])
+        exact = self._entries.get(query.upper())
+        ranked = [exact['symbol']] if exact and market in (None, exact['market']) else []
+        ranked += symbol_trie.lookup(query.upper())
+        ranked += name_trie.lookup(_normalize_name(query))
+
+        limit = max(min(limit, self.limit), 1)
+        return [self._entries[symbol] for symbol in dict.fromkeys(ranked)][:limit]
+
+
+def load_symbol_master(path=SYMBOL_MASTER_PATH):
+    """Read the symbol master CSV (symbol,name,market,sector)"""
+    try:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            return [
+                {
+                    'symbol': row['symbol'].strip().upper(),
+                    'name': row['name'].strip(),
+                    'market': row['market'].strip().lower(),
+                    'sector': row.get('sector', '').strip() or 'Unknown'
+                }
+                for row in csv.DictReader(f) if row.get('symbol')
+            ]
+    except (OSError, KeyError, csv.Error) as e:
+        print(f"Error loading symbol master {path}: {str(e)}")
+        return []
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_symbol_index():
+    """Get the process-wide symbol index, loading the master on first use"""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = SymbolIndex(load_symbol_master())
+    return _index
+
+
+def _probe_candidates(symbol, market):
+    suffix = MARKET_SUFFIXES.get(market)
+    if suffix and _base_symbol(symbol) == symbol:
+        return [symbol + suffix, symbol]
+    return [symbol]
+
+
+def _entry_from_info(symbol, info):
+    name = info.get('longName') or info.get('shortName') or info.get('name')
+    if not name:
+        return None
+
+    if info.get('quoteType') == 'CRYPTOCURRENCY' or symbol.endswith('-USD'):
+        market = 'crypto'
+    elif symbol.endswith(('.NS', '.BO')) or info.get('exchange') in ('NSI', 'BSE'):
+        market = 'indian'
+    else:
+        market = 'us'
+
+    sector = info.get('sector') or info.get('industry') or info.get('category') or 'Unknown'
+    return {'symbol': symbol, 'name': name, 'market': market, 'sector': sector}
+
+
+def lookup_symbol(symbol, market=None):
+    """
+    Resolve a user-entered ticker against the symbol master
+
+    Tickers missing from the master are checked with one (disk-cached)
+    metadata lookup when SYMBOL_PROBE_UPSTREAM is on; confirmed ones join the
+    index, and tickers Yahoo answered for without a name are remembered in the
+    'symbol_misses' cache, so repeated searches for them make no network calls.
+
+    Returns:
+        Entry dictionary {'symbol', 'name', 'market', 'sector'}, or None
+    """
+    symbol = symbol.strip().upper()
+    index = get_symbol_index()
+
+    entry = index.resolve(symbol, market)
+    if entry is not None or not SYMBOL_PROBE_UPSTREAM or not symbol:
+        return entry
+
+    misses = get_cache('symbol_misses')
+    miss_key = (symbol, market)
+    if misses.get(miss_key, False):
+        return None
+
+    failed = False
+    for candidate in _probe_candidates(symbol, market):
+        info, candidate_failed = get_metadata_cache().lookup(candidate)
+        entry = _entry_from_info(candidate, info)
+        if entry is not None:
+            index.add(entry)
+            return index.get(candidate)
+        failed = failed or candidate_failed
+
+    # Only a definite answer from Yahoo is remembered; after an upstream error the
+    # metadata cache retries once its short failure TTL has passed
+    if not failed:
+        misses.set(miss_key, True)
+    return None
+
+
+def autocomplete(query, market=None, limit=10):
+    """Entries whose ticker or company name starts with query (see SymbolIndex.search)"""
+    return get_symbol_index().search(query, market, limit)
@@ -0,0 +1,223 @@
+"""
+Batch Model Training
+Runs training tasks for a whole market universe in a separate, CPU-limited
+process pool and records per-task progress under a run id
+"""
+
+import os
+import uuid
+import atexit
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+
+TRAINING_WORKERS = int(os.getenv('TRAINING_WORKERS', str(max((os.cpu_count() or 2) // 2, 1))))
+TRAINING_THREADS_PER_WORKER = int(os.getenv('TRAINING_THREADS_PER_WORKER', '1'))
+TRAINING_NICE = int(os.getenv('TRAINING_NICE', '10'))
+TRAINING_RUN_RETENTION = int(os.getenv('TRAINING_RUN_RETENTION', '20'))
+
+
+def _limit_worker(threads, niceness):
+    """
+    Pool initializer: cap the threads and priority of a training worker
+
+    Runs before TensorFlow is imported in the (spawned) worker, so the thread
+    limits apply to every op it runs.
+    """
+    threads = str(max(threads, 1))
+    for name in ('OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS',
+                 'TF_NUM_INTRAOP_THREADS', 'TF_NUM_INTEROP_THREADS'):
+        os.environ[name] = threads
+
+    if niceness and hasattr(os, 'nice'):
+        try:
+            os.nice(niceness)
+        except OSError:
+            pass
+
+
+class TrainingScheduler:
+    """
+    Tracks training runs submitted to a fixed-size process pool
+
+    Each run is a list of tasks; a task's result dictionary is merged into its
+    entry so progress can be polled while the run is in flight.
+    """
+
+    def __init__(self, max_workers=TRAINING_WORKERS, threads_per_worker=TRAINING_THREADS_PER_WORKER,
+                 niceness=TRAINING_NICE, retention=TRAINING_RUN_RETENTION):
+        self.max_workers = max(max_workers, 1)
+        self.threads_per_worker = threads_per_worker
+        self.niceness = niceness
+        self.retention = max(retention, 1)
+        self._lock = threading.Lock()
+        self._executor = None
+        self._runs = {}  # run_id -> run record, oldest first
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_limit_worker,
+                    initargs=(self.threads_per_worker, self.niceness)
+                )
+            return self._executor
+
+    def _reset_executor(self):
+        """Replace a pool whose worker process died"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit_future(self, fn, *args):
+        try:
+            return self._get_executor().submit(fn, *args)
+        except BrokenProcessPool:
+            self._reset_executor()
+            return self._get_executor().submit(fn, *args)
+
+    def start(self, key, fn, tasks, skipped=None, params=None):
+        """
+        Start a run of fn(*args) for each task unless an unfinished run with the same key exists
+
+        fn must be a module-level function so it can be pickled, and should
+        return a dictionary describing the task's outcome.
+
+        Args:
+            key: Identifies equivalent runs, e.g. (market, force)
+            fn: Function run once per task in the worker pool
+            tasks: List of (label, args) where label is a dictionary naming the task
+            skipped: Labels of tasks left out because their models are fresh
+            params: Settings of the run echoed back in its status (e.g. market, force)
+
+        Returns:
+            Run id string
+        """
+        with self._lock:
+            for run_id, run in self._runs.items():
+                if run['key'] == key and not _run_finished(run):
+                    return run_id
+
+            run_id = uuid.uuid4().hex
+            run = {
+                'key': key,
+                'params': dict(params or {}),
+                'created_at': datetime.now(),
+                'finished_at': None,
+                'submitting': True,
+                'tasks': [],
+                'skipped': [dict(label, status='fresh') for label in (skipped or [])]
+            }
+            self._runs[run_id] = run
+            self._prune()
+
+        for label, args in tasks:
+            task = dict(label, status='queued')
+            with self._lock:
+                run['tasks'].append(task)
+            future = self._submit_future(fn, *args)
+            future.add_done_callback(lambda f, run=run, task=task: self._finish_task(run, task, f))
+
+        with self._lock:
+            run['submitting'] = False
+            if _run_finished(run) and run['finished_at'] is None:
+                run['finished_at'] = datetime.now()
+        return run_id
+
+    def _finish_task(self, run, task, future):
+        if future.cancelled():
+            outcome = {'status': 'failed', 'error': 'Task was cancelled'}
+        elif future.exception() is not None:
+            outcome = {'status': 'failed', 'error': str(future.exception())}
+        else:
+            outcome = future.result() or {'status': 'failed', 'error': 'Task returned no result'}
+
+        with self._lock:
+            task.update(outcome)
+            if _run_finished(run) and run['finished_at'] is None:
+                run['finished_at'] = datetime.now()
+
+    def get(self, run_id):
+        """
+        Get a run's progress and per-task results
+
+        Returns:
+            Run dictionary, or None if the run id is unknown or expired
+        """
+        with self._lock:
+            run = self._runs.get(run_id)
+            if run is None:
+                return None
+            return self._describe(run_id, run)
+
+    def list(self):
+        """Summaries of retained runs, newest first"""
+        with self._lock:
+            runs = [self._describe(run_id, run) for run_id, run in self._runs.items()]
+        for run in runs:
+            del run['tasks'], run['skipped']
+        return runs[::-1]
+
+    def _describe(self, run_id, run):
+        counts = {'queued': 0, 'trained': 0, 'failed': 0}
+        for task in run['tasks']:
+            counts[task['status'] if task['status'] in counts else 'trained'] += 1
+
+        total = len(run['tasks'])
+        done = total - counts['queued']
+        response = {
+            'run_id': run_id,
+            'status': 'completed' if _run_finished(run) else 'running',
+            **run['params'],
+            'created_at': run['created_at'].isoformat(),
+            'progress': {
+                'total': total,
+                'done': done,
+                'trained': counts['trained'],
+                'failed': counts['failed'],
+                'skipped': len(run['skipped']),
+                'percent': round(100.0 * done / total, 1) if total else 100.0
+            },
+            'tasks': [dict(task) for task in run['tasks']],
+            'skipped': [dict(task) for task in run['skipped']]
+        }
+
+        if run['finished_at'] is not None:
+            response['finished_at'] = run['finished_at'].isoformat()
+            response['duration_seconds'] = round((run['finished_at'] - run['created_at']).total_seconds(), 3)
+
+        return response
+
+    def _prune(self):
+        """Forget the oldest finished runs beyond retention (caller holds the lock)"""
+        finished = [run_id for run_id, run in self._runs.items() if _run_finished(run)]
+        for run_id in finished[:max(len(self._runs) - self.retention, 0)]:
+            del self._runs[run_id]
+
+    def shutdown(self):
+        """Stop the worker pool without waiting for running tasks"""
+        self._reset_executor()
+
+
+def _run_finished(run):
+    return not run['submitting'] and all(task['status'] != 'queued' for task in run['tasks'])
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_training_scheduler():
+    """Get the process-wide training scheduler"""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = TrainingScheduler()
+                atexit.register(_scheduler.shutdown)
+    return _scheduler
@@ -5,21 +5,54 @@ Utility functions for data fetching, processing, and technical indicators
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-import yfinance as yf
-from alpha_vantage.timeseries import TimeSeries
 import os
+import threading
 from dotenv import load_dotenv
 
+from ohlcv_store import get_ohlcv_store
+from indicators import compute_indicators, IndicatorState
+from downsample import downsample_ohlcv
+from metadata import get_symbol_info
+from sentiment import get_sentiment_service
+from cache import cached, get_cache, clear_caches
+from singleflight import coalesce
+from metrics import span, timed, count_upstream_error
+
 load_dotenv()
 
 # API Keys
 ALPHA_VANTAGE_KEY = os.getenv('ALPHA_VANTAGE_API_KEY', '')
 
+# History replayed the first time live indicators are requested for a symbol
+LIVE_INDICATOR_HISTORY_DAYS = int(os.getenv('LIVE_INDICATOR_HISTORY_DAYS', '365'))
+
+# Bars included in historical_data responses
+HISTORY_RESPONSE_BARS = 30
+
+# Chart history range queries: points returned by default and at most
+CHART_DEFAULT_POINTS = int(os.getenv('CHART_DEFAULT_POINTS', '500'))
+CHART_MAX_POINTS = int(os.getenv('CHART_MAX_POINTS', '5000'))
+
+# 'rows' is a list of {date, open, ...} dicts, 'columnar' a dict of {date: [...], open: [...], ...}
+HISTORY_FORMATS = ['rows', 'columnar']
+
+# historical_data fields and the source columns they are read from, in order of preference
+HISTORY_FIELDS = [
+    ('open', ('Open', '1. open')),
+    ('high', ('High', '2. high')),
+    ('low', ('Low', '3. low')),
+    ('close', ('Close', '4. close')),
+    ('volume', ('Volume', '6. volume'))
+]
+
 # ============================================================================
 # DATA FETCHING FUNCTIONS
 # ============================================================================
 
-def fetch_stock_data(symbol, days=30, source='yfinance'):
+@cached('stock_data')
+@coalesce('stock_data')
+@timed('fetch_stock_data')
+def fetch_stock_data(symbol, days=30, source='yfinance', history_format='rows'):
     """
     Fetch historical stock data
     
@@ -27,15 +60,16 @@ def fetch_stock_data(symbol, days=30, source='yfinance'):
         symbol: Stock symbol (e.g., 'AAPL', 'RELIANCE.NS', 'BTC-USD')
         days: Number of historical days to fetch
         source: Data source ('yfinance' or 'alpha_vantage')
+        history_format: Shape of historical_data, 'rows' or 'columnar' (see HISTORY_FORMATS)
     
     Returns:
         Dictionary with stock data and technical indicators
     """
     try:
         if source == 'yfinance':
-            return _fetch_from_yfinance(symbol, days)
+            return _fetch_from_yfinance(symbol, days, history_format)
         elif source == 'alpha_vantage':
-            return _fetch_from_alpha_vantage(symbol, days)
+            return _fetch_from_alpha_vantage(symbol, days, history_format)
         else:
             return None
     
@@ -44,72 +78,267 @@ def fetch_stock_data(symbol, days=30, source='yfinance'):
         return None
 
 
-def _fetch_from_yfinance(symbol, days):
+def _fetch_from_yfinance(symbol, days, history_format='rows'):
     """Fetch data from Yahoo Finance"""
     try:
-        # Download historical data
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
         
-        df = yf.download(symbol, start=start_date, end=end_date, progress=False)
+        # Read from the local store, downloading only bars it does not have yet
+        df = _load_history('yfinance', symbol, start_date, end_date, _yfinance_downloader(symbol))
 
         if df.empty:
             return None
-
-        # Flatten MultiIndex columns if present (for single symbol)
-        if isinstance(df.columns, pd.MultiIndex):
-            df.columns = df.columns.droplevel(1)
         
-        # Get current price
-        ticker = yf.Ticker(symbol)
-        current_price = df['Close'].iloc[-1]
+        return _build_yfinance_response(symbol, df, get_symbol_info(symbol), history_format=history_format)
         
-        # Calculate technical indicators
-        df = calculate_technical_indicators(df)
+    except Exception as e:
+        print(f"Error fetching from Yahoo Finance: {str(e)}")
+        return None
+
+
+@cached('stock_data')
+def fetch_history_range(symbol, start, end, max_points=CHART_DEFAULT_POINTS, history_format='rows'):
+    """
+    Fetch daily bars between two dates for charting, downsampled with LTTB
+    
+    Args:
+        symbol: Stock symbol
+        start: First date (datetime)
+        end: Last date (datetime)
+        max_points: Most bars to return; longer ranges are reduced with
+                    Largest-Triangle-Three-Buckets on the close
+        history_format: 'rows' or 'columnar' (see HISTORY_FORMATS)
+    
+    Returns:
+        Dictionary with the range, bar counts and historical_data, or None if no data
+    """
+    try:
+        df = _load_history('yfinance', symbol, start, end, _yfinance_downloader(symbol))
+        df = df[(df.index >= pd.Timestamp(start.date())) & (df.index <= pd.Timestamp(end))] if not df.empty else df
         
-        # Format response
-        data = {
+        if df.empty:
+            return None
+        
+        sampled = downsample_ohlcv(df, max_points)
+        return {
             'symbol': symbol,
-            'currentPrice': float(current_price),
-            'currency': 'USD',
-            'dayHigh': float(df['High'].iloc[-1]),
-            'dayLow': float(df['Low'].iloc[-1]),
-            'volume': int(df['Volume'].iloc[-1]),
-            'marketCap': getattr(ticker.info.get('marketCap'), '__float__', lambda: 0)() if ticker.info.get('marketCap') else 0,
-            'pe_ratio': ticker.info.get('trailingPE', 0),
-            'historical_data': format_historical_data(df),
-            'technical_indicators': {
-                'sma_20': float(df['SMA_20'].iloc[-1]) if 'SMA_20' in df else None,
-                'sma_50': float(df['SMA_50'].iloc[-1]) if 'SMA_50' in df else None,
-                'rsi': float(df['RSI'].iloc[-1]) if 'RSI' in df else None,
-                'macd': float(df['MACD'].iloc[-1]) if 'MACD' in df else None,
-            },
-            'timestamp': datetime.now().isoformat()
+            'start': str(df.index[0].date()),
+            'end': str(df.index[-1].date()),
+            'bars': len(df),
+            'points': len(sampled),
+            'downsampled': len(sampled) < len(df),
+            'historical_data': format_historical_data(sampled, limit=None, columnar=history_format == 'columnar')
         }
         
-        return data
+    except Exception as e:
+        print(f"Error fetching history range for {symbol}: {str(e)}")
+        return None
+
+
+@cached('stock_data')
+def fetch_close_history(symbol, days=730):
+    """
+    Fetch daily closing prices for model training
+    
+    Args:
+        symbol: Stock symbol
+        days: Number of historical days to fetch
+    
+    Returns:
+        pandas Series of closes indexed by date, or None if no data is available
+    """
+    try:
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=days)
+        
+        df = _load_history('yfinance', symbol, start_date, end_date, _yfinance_downloader(symbol))
         
+        if df.empty or 'Close' not in df:
+            return None
+        
+        return df['Close'].dropna()
+    
     except Exception as e:
-        print(f"Error fetching from Yahoo Finance: {str(e)}")
+        print(f"Error fetching close history for {symbol}: {str(e)}")
+        return None
+
+
+def _yfinance_downloader(symbol):
+    """Build a download(fetch_start, fetch_end) callable for one symbol"""
+    def _download(fetch_start, fetch_end):
+        import yfinance as yf
+        
+        try:
+            with span('yahoo_download'):
+                df = yf.download(symbol, start=fetch_start, end=fetch_end, progress=False)
+        except Exception:
+            count_upstream_error('yfinance')
+            raise
+        
+        # Flatten MultiIndex columns if present (for single symbol)
+        if isinstance(df.columns, pd.MultiIndex):
+            df.columns = df.columns.droplevel(1)
+        return df
+    
+    return _download
+
+
+def fetch_stock_data_many(symbols, days=30, include_info=True, history_format='rows'):
+    """
+    Fetch historical stock data for several symbols with one batched download
+    
+    Args:
+        symbols: List of stock symbols
+        days: Number of historical days to fetch
+        include_info: Also look up marketCap and PE ratio (cached per symbol)
+        history_format: Shape of historical_data, 'rows' or 'columnar' (see HISTORY_FORMATS)
+    
+    Returns:
+        Dictionary mapping symbol to the same data fetch_stock_data returns;
+        symbols without data are left out
+    """
+    symbols = list(dict.fromkeys(symbols))
+    if not symbols:
+        return {}
+    
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=days)
+    store = get_ohlcv_store()
+    
+    # Work out which symbols the local store cannot serve on its own
+    frames = {}
+    fetch_from = {}
+    for symbol in symbols:
+        try:
+            fetch_start = store.missing_start('yfinance', symbol, start_date)
+            if fetch_start is None:
+                frames[symbol] = store.read_range('yfinance', symbol, start_date, end_date)
+            else:
+                fetch_from[symbol] = fetch_start
+        except Exception as e:
+            print(f"Error reading OHLCV store for {symbol}: {str(e)}")
+            fetch_from[symbol] = start_date
+    
+    if fetch_from:
+        try:
+            import yfinance as yf
+            
+            with span('yahoo_download'):
+                df = yf.download(list(fetch_from), start=min(fetch_from.values()), end=end_date,
+                                 progress=False, group_by='ticker', threads=True)
+        except Exception as e:
+            count_upstream_error('yfinance')
+            print(f"Error fetching batch from Yahoo Finance: {str(e)}")
+            df = pd.DataFrame()
+        
+        for symbol in fetch_from:
+            symbol_df = _split_batch_frame(df, symbol) if not df.empty else None
+            try:
+                store.update('yfinance', symbol, symbol_df, start=start_date)
+                frames[symbol] = store.read_range('yfinance', symbol, start_date, end_date)
+            except Exception as e:
+                print(f"Error updating OHLCV store for {symbol}: {str(e)}")
+                frames[symbol] = symbol_df
+    
+    frames = {symbol: df for symbol, df in frames.items() if df is not None and not df.empty}
+    frames = calculate_technical_indicators_many(frames)
+    
+    results = {}
+    for symbol in symbols:
+        try:
+            symbol_df = frames.get(symbol)
+            if symbol_df is None:
+                print(f"No data in batch download for {symbol}")
+                continue
+            
+            info = get_symbol_info(symbol) if include_info else None
+            results[symbol] = _build_yfinance_response(symbol, symbol_df, info, indicators_ready=True,
+                                                       history_format=history_format)
+            
+        except Exception as e:
+            print(f"Error processing batch data for {symbol}: {str(e)}")
+    
+    return results
+
+
+def _split_batch_frame(df, symbol):
+    """Extract one symbol's OHLCV frame from a multi-ticker yf.download result"""
+    if not isinstance(df.columns, pd.MultiIndex):
+        symbol_df = df.copy()
+    elif symbol in df.columns.get_level_values(0):
+        symbol_df = df[symbol].copy()
+    elif symbol in df.columns.get_level_values(1):
+        symbol_df = df.xs(symbol, axis=1, level=1).copy()
+    else:
         return None
+    
+    # Markets trade on different calendars, so drop the rows this symbol has no bar for
+    return symbol_df.dropna(subset=['Close'])
 
 
-def _fetch_from_alpha_vantage(symbol, days):
+def _build_yfinance_response(symbol, df, info=None, indicators_ready=False, history_format='rows'):
+    """Build the stock data response from a single-symbol OHLCV frame"""
+    # Get current price
+    current_price = df['Close'].iloc[-1]
+    
+    # Calculate technical indicators
+    if not indicators_ready:
+        df = calculate_technical_indicators(df)
+    
+    info = info or {}
+    market_cap = info.get('marketCap')
+    
+    # Format response
+    return {
+        'symbol': symbol,
+        'currentPrice': float(current_price),
+        'currency': 'USD',
+        'dayHigh': float(df['High'].iloc[-1]),
+        'dayLow': float(df['Low'].iloc[-1]),
+        'volume': int(df['Volume'].iloc[-1]),
+        'marketCap': float(market_cap) if market_cap else 0,
+        'pe_ratio': info.get('trailingPE', 0),
+        'historical_data': format_historical_data(df, columnar=history_format == 'columnar'),
+        'technical_indicators': {
+            'sma_20': float(df['SMA_20'].iloc[-1]) if 'SMA_20' in df else None,
+            'sma_50': float(df['SMA_50'].iloc[-1]) if 'SMA_50' in df else None,
+            'rsi': float(df['RSI'].iloc[-1]) if 'RSI' in df else None,
+            'macd': float(df['MACD'].iloc[-1]) if 'MACD' in df else None,
+        },
+        'timestamp': datetime.now().isoformat()
+    }
+
+
+def _fetch_from_alpha_vantage(symbol, days, history_format='rows'):
     """Fetch data from Alpha Vantage"""
     try:
         if not ALPHA_VANTAGE_KEY:
             print("Alpha Vantage API key not configured")
             return None
         
-        ts = TimeSeries(key=ALPHA_VANTAGE_KEY, output_format='pandas')
-        data, meta_data = ts.get_daily(symbol=symbol)
+        def _download(fetch_start, fetch_end):
+            from alpha_vantage.timeseries import TimeSeries
+            
+            ts = TimeSeries(key=ALPHA_VANTAGE_KEY, output_format='pandas')
+            # 'compact' returns the latest 100 trading days, enough for tail updates
+            outputsize = 'full' if (fetch_end - fetch_start).days > 140 else 'compact'
+            try:
+                with span('alpha_vantage_download'):
+                    data, meta_data = ts.get_daily(symbol=symbol, outputsize=outputsize)
+            except Exception:
+                count_upstream_error('alpha_vantage')
+                raise
+            return data
+        
+        # `days` counts trading days here, so cover a wider calendar window
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=days * 2 + 7)
+        data = _load_history('alpha_vantage', symbol, start_date, end_date, _download)
         
         if data.empty:
             return None
         
-        # Sort by date
-        data = data.sort_index()
-        
         # Get recent data
         recent_data = data[-days:]
         
@@ -117,7 +346,7 @@ def _fetch_from_alpha_vantage(symbol, days):
         return {
             'symbol': symbol,
             'currentPrice': float(recent_data['4. close'].iloc[-1]),
-            'historical_data': format_historical_data(recent_data),
+            'historical_data': format_historical_data(recent_data, columnar=history_format == 'columnar'),
             'timestamp': datetime.now().isoformat()
         }
         
@@ -126,21 +355,58 @@ def _fetch_from_alpha_vantage(symbol, days):
         return None
 
 
-def format_historical_data(df):
-    """Format historical data for API response"""
-    formatted_data = []
+def _load_history(source, symbol, start_date, end_date, download):
+    """
+    Get OHLCV bars through the local store, falling back to a direct download
+    
+    Args:
+        download: Callable download(fetch_start, fetch_end) returning a DataFrame
+    """
+    try:
+        return get_ohlcv_store().get_range(source, symbol, start_date, end_date, download)
+    except Exception as e:
+        print(f"OHLCV store unavailable for {symbol}, downloading directly: {str(e)}")
+        return download(start_date, end_date).sort_index()
+
+
+def format_historical_data(df, limit=HISTORY_RESPONSE_BARS, columnar=False):
+    """
+    Format historical data for API response
     
-    for index, row in df.iterrows():
-        formatted_data.append({
-            'date': str(index.date()) if hasattr(index, 'date') else str(index),
-            'open': float(row.get('Open', 0)) if 'Open' in row else float(row.get('1. open', 0)),
-            'high': float(row.get('High', 0)) if 'High' in row else float(row.get('2. high', 0)),
-            'low': float(row.get('Low', 0)) if 'Low' in row else float(row.get('3. low', 0)),
-            'close': float(row.get('Close', 0)) if 'Close' in row else float(row.get('4. close', 0)),
-            'volume': int(row.get('Volume', 0)) if 'Volume' in row else int(row.get('6. volume', 0))
-        })
+    Only the last `limit` bars are converted, one whole column at a time.
     
-    return formatted_data[-30:]  # Return last 30 days
+    Args:
+        df: OHLCV frame with yfinance or Alpha Vantage column names
+        limit: Number of most recent bars to include (None for all)
+        columnar: Return {'date': [...], 'open': [...], ...} instead of one dict per bar
+    
+    Returns:
+        List of bar dictionaries, or dictionary of field lists if columnar
+    """
+    tail = df.iloc[-limit:] if limit else df
+    
+    if isinstance(tail.index, pd.DatetimeIndex):
+        dates = tail.index.strftime('%Y-%m-%d').tolist()
+    else:
+        dates = [str(index.date()) if hasattr(index, 'date') else str(index) for index in tail.index]
+    
+    columns = {'date': dates}
+    for field, sources in HISTORY_FIELDS:
+        source = next((name for name in sources if name in tail.columns), None)
+        if source is None:
+            values = np.zeros(len(tail))
+        else:
+            values = tail[source].to_numpy(dtype=float)
+        
+        if field == 'volume':
+            columns[field] = np.nan_to_num(values).astype(np.int64).tolist()
+        else:
+            columns[field] = values.tolist()
+    
+    if columnar:
+        return columns
+    
+    return [dict(zip(columns, bar)) for bar in zip(*columns.values())]
 
 
 # ============================================================================
@@ -178,6 +444,43 @@ def calculate_technical_indicators(df):
         return df
 
 
+def calculate_technical_indicators_many(frames):
+    """
+    Calculate technical indicators for many symbols in vectorized passes
+    
+    Frames that share the same dates are stacked and computed together with
+    the indicators engine; the results match calculate_technical_indicators.
+    
+    Args:
+        frames: Dictionary mapping symbol to an OHLCV DataFrame
+    
+    Returns:
+        Dictionary mapping symbol to a copy of its frame with indicator columns
+    """
+    groups = {}
+    for symbol, df in frames.items():
+        groups.setdefault(df.index.values.tobytes(), []).append(symbol)
+    
+    results = {}
+    for group in groups.values():
+        try:
+            closes = np.vstack([frames[symbol]['Close'].to_numpy(dtype=float) for symbol in group])
+            columns = compute_indicators(closes)
+            
+            # One concat per frame; assigning columns one by one costs more than computing them
+            for row, symbol in enumerate(group):
+                df = frames[symbol].drop(columns=list(columns), errors='ignore')
+                indicator_df = pd.DataFrame({name: values[row] for name, values in columns.items()}, index=df.index)
+                results[symbol] = pd.concat([df, indicator_df], axis=1)
+                
+        except Exception as e:
+            print(f"Error calculating batch indicators: {str(e)}")
+            for symbol in group:
+                results[symbol] = calculate_technical_indicators(frames[symbol].copy())
+    
+    return results
+
+
 def calculate_rsi(prices, period=14):
     """Calculate Relative Strength Index"""
     try:
@@ -211,6 +514,7 @@ def calculate_rsi(prices, period=14):
         return None
 
 
+@cached('indicators')
 def calculate_indicators(symbol, period='1m'):
     """
     Calculate all technical indicators for a stock
@@ -250,10 +554,77 @@ def calculate_indicators(symbol, period='1m'):
         return None
 
 
+_live_indicators = {}  # symbol -> IndicatorState
+_live_indicators_lock = threading.Lock()
+
+
+def get_live_indicators(symbol):
+    """
+    Get technical indicators from in-memory streaming state
+    
+    The first request for a symbol replays its stored history once. Later
+    requests only fold in bars newer than the last one seen, in O(1) per bar.
+    Today's bar may still change, so it is previewed rather than folded in.
+    
+    Returns:
+        Dictionary with indicators, or None if there is no data
+    """
+    try:
+        end_date = datetime.now()
+        today = pd.Timestamp(end_date.date())
+        
+        with _live_indicators_lock:
+            state = _live_indicators.get(symbol)
+        
+        if state is None or state.last_timestamp is None:
+            start_date = end_date - timedelta(days=LIVE_INDICATOR_HISTORY_DAYS)
+        else:
+            start_date = pd.Timestamp(state.last_timestamp).to_pydatetime()
+        
+        bars = _load_history('yfinance', symbol, start_date, end_date, _yfinance_downloader(symbol))
+        if state is None and bars.empty:
+            return None
+        
+        closes = bars['Close'] if not bars.empty else pd.Series(dtype=float)
+        completed = closes[closes.index < today]
+        in_progress = closes[closes.index >= today]
+        
+        with _live_indicators_lock:
+            state = _live_indicators.setdefault(symbol, state or IndicatorState())
+            
+            for timestamp, close in completed.items():
+                if state.last_timestamp is None or timestamp > pd.Timestamp(state.last_timestamp):
+                    state.update(close, timestamp.isoformat())
+            
+            if not in_progress.empty:
+                indicators = state.preview(in_progress.iloc[-1])
+                as_of = in_progress.index[-1].isoformat()
+            else:
+                indicators = state.values()
+                as_of = state.last_timestamp
+            bars_seen = state.count
+        
+        return {
+            'symbol': symbol,
+            'period': 'live',
+            'indicators': indicators,
+            'as_of': as_of,
+            'bars': bars_seen,
+            'timestamp': datetime.now().isoformat()
+        }
+        
+    except Exception as e:
+        print(f"Error in get_live_indicators: {str(e)}")
+        return None
+
+
 # ============================================================================
 # SENTIMENT ANALYSIS
 # ============================================================================
 
+@cached('sentiment', cache_if=lambda result: result is not None and 'error' not in result)
+@coalesce('sentiment')
+@timed('sentiment')
 def analyze_sentiment(symbol, days=7, max_results=20):
     """
     Analyze sentiment for a stock using Google News and NLTK VADER
@@ -267,76 +638,7 @@ def analyze_sentiment(symbol, days=7, max_results=20):
         Dictionary with sentiment analysis results
     """
     try:
-        from GoogleNews import GoogleNews
-        from nltk.sentiment.vader import SentimentIntensityAnalyzer
-        from nltk import download
-        import nltk
-
-        # Download NLTK data if needed
-        try:
-            nltk.data.find('vader_lexicon')
-        except LookupError:
-            download('vader_lexicon')
-
-        sia = SentimentIntensityAnalyzer()
-
-        print(f"Fetching latest news for: {symbol}")
-
-        # Initialize Google News
-        googlenews = GoogleNews(period=f"{days}d")
-        googlenews.search(symbol)
-        news = googlenews.result()[:max_results]
-
-        if not news:
-            print(f"No news found for {symbol}")
-            return {
-                'symbol': symbol,
-                'sentiment_score': 0.0,
-                'sentiment_label': 'neutral',
-                'articles_analyzed': 0,
-                'confidence': 0.0,
-                'timestamp': datetime.now().isoformat()
-            }
-
-        sentiment_scores = []
-        headlines = []
-
-        # Analyze sentiment for each article
-        for item in news:
-            title = item.get('title', '')
-            if title:
-                sentiment = sia.polarity_scores(title)['compound']
-                sentiment_scores.append(sentiment)
-                headlines.append({
-                    'title': title,
-                    'sentiment': sentiment,
-                    'date': item.get('date', ''),
-                    'link': item.get('link', '')
-                })
-
-        # Calculate aggregate sentiment
-        avg_sentiment = np.mean(sentiment_scores) if sentiment_scores else 0.0
-
-        # Determine sentiment label
-        if avg_sentiment >= 0.05:
-            label = 'positive'
-        elif avg_sentiment <= -0.05:
-            label = 'negative'
-        else:
-            label = 'neutral'
-
-        # Calculate confidence based on number of articles and sentiment variance
-        confidence = min(len(sentiment_scores) / max_results, 1.0) * (1 - np.var(sentiment_scores)) if sentiment_scores else 0.0
-
-        return {
-            'symbol': symbol,
-            'sentiment_score': float(avg_sentiment),  # -1 (very negative) to 1 (very positive)
-            'sentiment_label': label,
-            'articles_analyzed': len(sentiment_scores),
-            'confidence': float(confidence),
-            'headlines': headlines[:5],  # Top 5 headlines
-            'timestamp': datetime.now().isoformat()
-        }
+        return get_sentiment_service().analyze(symbol, days=days, max_results=max_results)
 
     except Exception as e:
         print(f"Error analyzing sentiment: {str(e)}")
@@ -375,31 +677,22 @@ def format_prediction_response(prediction, market='us'):
 
 
 # ============================================================================
-# CACHE FUNCTIONS (for future optimization)
+# CACHE FUNCTIONS (see cache.py for the namespaced caches)
 # ============================================================================
 
-_cache = {}
-_cache_timestamp = {}
-
 def get_from_cache(key, max_age_seconds=300):
-    """Get value from cache if not expired"""
-    if key in _cache:
-        if datetime.now().timestamp() - _cache_timestamp.get(key, 0) < max_age_seconds:
-            return _cache[key]
-    return None
+    """Get value from the default cache namespace if not expired"""
+    return get_cache('default').get(key, max_age=max_age_seconds)
 
 
 def set_cache(key, value):
-    """Set value in cache"""
-    _cache[key] = value
-    _cache_timestamp[key] = datetime.now().timestamp()
+    """Set value in the default cache namespace"""
+    get_cache('default').set(key, value)
 
 
 def clear_cache():
-    """Clear entire cache"""
-    global _cache, _cache_timestamp
-    _cache = {}
-    _cache_timestamp = {}
+    """Clear every cache namespace"""
+    clear_caches()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,179 @@
+"""
+Process Warm-Up
+Loads the heavy libraries and runs a dummy LSTM forward pass in the background
+after the server starts, so the first real request does not pay for them
+"""
+
+import os
+import time
+import threading
+import multiprocessing
+from datetime import datetime
+
+WARMUP_ON_START = os.getenv('WARMUP_ON_START', 'true').lower() in ('1', 'true', 'yes')
+WARMUP_PRIME_WORKERS = os.getenv('WARMUP_PRIME_WORKERS', 'true').lower() in ('1', 'true', 'yes')
+
+
+def _warm_libraries():
+    import tensorflow  # noqa: F401
+    import sklearn.preprocessing  # noqa: F401
+    import yfinance  # noqa: F401
+
+
+def _warm_symbols():
+    from symbols import get_symbol_index
+    get_symbol_index()
+
+
+def _warm_lstm():
+    """Build a throwaway LSTM and run one compiled forward pass through it"""
+    import numpy as np
+    from models import LSTMPredictor
+
+    predictor = LSTMPredictor('WARMUP', lookback=20, horizon=1)
+    if predictor.build_model((predictor.lookback, 1)) is None:
+        raise RuntimeError('Could not build the warm-up LSTM')
+    predictor.infer(np.zeros((1, predictor.lookback, 1), dtype=np.float32))
+
+
+def warm_up_worker():
+    """Warm up a worker process (runs in the prediction pool)"""
+    started = time.perf_counter()
+    _warm_libraries()
+    _warm_lstm()
+    return round(time.perf_counter() - started, 3)
+
+
+_worker_warmup = None  # this pool worker's warm-up: seconds taken, or the error
+
+
+def init_worker():
+    """
+    Pool initializer: warm up each prediction worker as it starts
+
+    Runs once per worker before it takes any task, so workers the pool starts
+    later (on demand, or after a crash) are warmed too. Failures are recorded
+    rather than raised, since an initializer error would break the whole pool.
+    """
+    global _worker_warmup
+    if not (WARMUP_ON_START and WARMUP_PRIME_WORKERS):
+        return
+    try:
+        _worker_warmup = warm_up_worker()
+    except Exception as e:
+        print(f"Worker warm-up failed: {str(e)}")
+        _worker_warmup = e
+
+
+def worker_warmup_status():
+    """Seconds this worker spent warming up (runs in the prediction pool)"""
+    if isinstance(_worker_warmup, Exception):
+        raise RuntimeError(str(_worker_warmup))
+    return _worker_warmup
+
+
+class WarmUp:
+    """
+    Background warm-up of this process and the prediction worker pool
+
+    Status moves from 'pending' to 'running' to 'ready' (or 'failed'), or is
+    'skipped' when WARMUP_ON_START is off. A failed warm-up keeps the process
+    out of rotation (/ready returns 503) since its first requests would likely
+    fail the same way.
+    """
+
+    def __init__(self, prime_workers=WARMUP_PRIME_WORKERS):
+        self.prime_workers = prime_workers
+        self._lock = threading.Lock()
+        self._thread = None
+        self.state = 'pending'
+        self.started_at = None
+        self.finished_at = None
+        self.steps = {}  # step name -> seconds
+        self.error = None
+
+    def start(self):
+        """Start warming up in a daemon thread (no-op if already started)"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self.state = 'running'
+            self.started_at = datetime.now()
+            self._thread = threading.Thread(target=self._run, name='warmup', daemon=True)
+            self._thread.start()
+
+    def _step(self, name, fn):
+        started = time.perf_counter()
+        fn()
+        self.steps[name] = round(time.perf_counter() - started, 3)
+
+    def _run(self):
+        try:
+            self._step('libraries', _warm_libraries)
+            self._step('symbols', _warm_symbols)
+            self._step('lstm', _warm_lstm)
+            if self.prime_workers:
+                self._step('workers', self._prime_workers)
+            state, error = 'ready', None
+        except Exception as e:
+            print(f"Warm-up failed: {str(e)}")
+            state, error = 'failed', str(e)
+
+        with self._lock:
+            self.state = state
+            self.error = error
+            self.finished_at = datetime.now()
+        print(f"Warm-up {state} in {sum(self.steps.values()):.1f}s")
+
+    @staticmethod
+    def _prime_workers():
+        """
+        Start the prediction pool's workers and wait for their warm-up
+
+        Each worker warms itself up in init_worker() before taking a task, so
+        the trivial calls below return once the workers they landed on are warm.
+        """
+        from jobs import get_job_manager
+
+        manager = get_job_manager()
+        for _, _, error in manager.run_many(worker_warmup_status, [()] * manager.max_workers):
+            if error:
+                raise RuntimeError(f"Worker warm-up failed: {error}")
+
+    def is_ready(self):
+        """True once warm-up has succeeded, or was skipped (WARMUP_ON_START off)"""
+        return self.state in ('ready', 'skipped')
+
+    def status(self):
+        """Warm-up state, per-step durations and any error"""
+        with self._lock:
+            response = {
+                'status': self.state,
+                'steps': dict(self.steps)
+            }
+            if self.started_at is not None:
+                response['started_at'] = self.started_at.isoformat()
+            if self.finished_at is not None:
+                response['finished_at'] = self.finished_at.isoformat()
+            if self.error:
+                response['error'] = self.error
+            return response
+
+
+_warmup = WarmUp()
+
+
+def get_warmup():
+    """Get the process-wide warm-up tracker"""
+    return _warmup
+
+
+def start_warmup():
+    """Start the background warm-up in the server process (not in pool workers)"""
+    if multiprocessing.parent_process() is not None:
+        return _warmup
+    if WARMUP_ON_START:
+        _warmup.start()
+    else:
+        _warmup.state = 'skipped'
+    return _warmup